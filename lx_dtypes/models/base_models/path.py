@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from lx_dtypes.utils.mixins import PathMixin
 from lx_dtypes.utils.mixins.base_model import AppBaseModel
@@ -23,11 +23,17 @@ class FilesAndDirsModel(PathMixin, AppBaseModel):
         for i, dir_path in enumerate(self.dirs):
             self.dirs[i] = (base_dir / dir_path).expanduser().resolve()
 
-    def get_files_with_suffix(self, suffix: Optional[str]) -> List[Path]:
+    def get_files_with_suffix(
+        self,
+        suffix: Optional[str],
+        list_files: Optional[Callable[[Path], List[Path]]] = None,
+    ) -> List[Path]:
         """Get all files with the specified suffix.
 
         Args:
             suffix (str): The suffix to filter files by.
+            list_files (Optional[Callable[[Path], List[Path]]]): Lists all files
+                below a directory, defaults to a recursive directory walk.
 
         Returns:
             list[Path]: A list of files with the specified suffix.
@@ -35,11 +41,14 @@ class FilesAndDirsModel(PathMixin, AppBaseModel):
         all_files = [self.file] if self.file else []
         all_files += [file for file in self.files]
 
+        if list_files is None:
+            list_files = get_files_from_dir_recursive
+
         for directory in self.dirs:
-            all_files += get_files_from_dir_recursive(directory)
+            all_files += list_files(directory)
 
         if self.dir:
-            all_files += get_files_from_dir_recursive(self.dir)
+            all_files += list_files(self.dir)
 
         filtered_files = [file for file in all_files if file.suffix == suffix]
 
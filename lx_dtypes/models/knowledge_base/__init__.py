@@ -1,9 +1,10 @@
 from .dataloader import DataLoader
-from .knowledge_base import KnowledgeBase
+from .knowledge_base import KnowledgeBase, KnowledgeBaseRefreshResult
 from .knowledge_base_config import KnowledgeBaseConfig
 
 __all__ = [
     "DataLoader",
     "KnowledgeBase",
     "KnowledgeBaseConfig",
+    "KnowledgeBaseRefreshResult",
 ]
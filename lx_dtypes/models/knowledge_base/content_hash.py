@@ -0,0 +1,163 @@
+import hashlib
+import json
+import zlib
+from typing import Any, Dict, Iterable, List, Tuple
+
+from pydantic import BaseModel, Field
+
+from lx_dtypes.models.knowledge_base.knowledge_base import CATEGORY_NAMES, KnowledgeBase
+from lx_dtypes.models.knowledge_base.symbols import SymbolTable
+
+# entities of a category are spread over a fixed number of buckets by name, so
+# the tree shape does not depend on which other entities exist
+BUCKET_COUNT = 256
+
+
+def hash_entity_dump(dump: Dict[str, Any]) -> str:
+    """Hash an entity dump as canonical JSON (sorted keys, no whitespace)."""
+    canonical = json.dumps(
+        dump, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def get_bucket(name: str) -> int:
+    return zlib.crc32(name.encode("utf-8")) % BUCKET_COUNT
+
+
+def combine_hashes(entries: Iterable[Tuple[Any, str]]) -> str:
+    """Fold (key, hash) pairs, sorted by key, into one sha256 hex digest."""
+    digest = hashlib.sha256()
+    for key, value in sorted(entries):
+        digest.update(f"{key}\0{value}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _empty_names() -> Dict[str, List[str]]:
+    return {}
+
+
+class ContentDiff(BaseModel):
+    """Entities that differ between two knowledge bases, by category."""
+
+    added: Dict[str, List[str]] = Field(default_factory=_empty_names)
+    removed: Dict[str, List[str]] = Field(default_factory=_empty_names)
+    changed: Dict[str, List[str]] = Field(default_factory=_empty_names)
+    # modules whose root differs or that exist on one side only
+    changed_modules: List[str] = Field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+
+class CategoryContentTree:
+    """Two level Merkle tree of one category: buckets of entity hashes.
+
+    Args:
+        entity_hashes (Dict[str, str]): Entity name -> entity hash.
+    """
+
+    def __init__(self, entity_hashes: Dict[str, str]) -> None:
+        self.buckets: Dict[int, Dict[str, str]] = {}
+        for name, entity_hash in entity_hashes.items():
+            self.buckets.setdefault(get_bucket(name), {})[name] = entity_hash
+        self.bucket_hashes: Dict[int, str] = {
+            bucket: combine_hashes(entries.items())
+            for bucket, entries in self.buckets.items()
+        }
+        self.root = combine_hashes(self.bucket_hashes.items())
+
+    def get_entity_hash(self, name: str) -> str:
+        return self.buckets[get_bucket(name)][name]
+
+    def diff(
+        self, other: "CategoryContentTree"
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """Return the added, removed and changed names of ``other``.
+
+        Only buckets whose hashes differ are compared entity by entity.
+        """
+        added: List[str] = []
+        removed: List[str] = []
+        changed: List[str] = []
+        if self.root == other.root:
+            return added, removed, changed
+        for bucket in sorted(set(self.bucket_hashes) | set(other.bucket_hashes)):
+            if self.bucket_hashes.get(bucket) == other.bucket_hashes.get(bucket):
+                continue
+            mine = self.buckets.get(bucket, {})
+            theirs = other.buckets.get(bucket, {})
+            added += [name for name in theirs if name not in mine]
+            removed += [name for name in mine if name not in theirs]
+            changed += [
+                name
+                for name, entity_hash in theirs.items()
+                if name in mine and mine[name] != entity_hash
+            ]
+        return sorted(added), sorted(removed), sorted(changed)
+
+
+class KnowledgeBaseContentTree:
+    """Merkle tree of the entities of a knowledge base.
+
+    Entity hashes cover the dump of each entity (without ``source_file`` and
+    ``created_at``), so equal content gives equal hashes across builds and
+    hosts. The root covers the entities of all categories; the config is not
+    included since it holds host specific paths. Module roots cover the
+    entities each imported module defines last.
+
+    Args:
+        symbol_table (SymbolTable): The symbol table of the knowledge base, used
+            to detect when the tree is outdated.
+        knowledge_base (KnowledgeBase): The knowledge base to hash.
+    """
+
+    def __init__(
+        self, symbol_table: SymbolTable, knowledge_base: KnowledgeBase
+    ) -> None:
+        self.symbol_table = symbol_table
+        dump = knowledge_base.model_dump(include=set(CATEGORY_NAMES))
+        self.categories: Dict[str, CategoryContentTree] = {
+            category: CategoryContentTree(
+                {
+                    name: hash_entity_dump(entity)
+                    for name, entity in dump[category].items()
+                }
+            )
+            for category in CATEGORY_NAMES
+        }
+        self.root = combine_hashes(
+            (category, tree.root) for category, tree in self.categories.items()
+        )
+        self.modules: Dict[str, str] = {
+            module: combine_hashes(
+                ((category, name), self.categories[category].get_entity_hash(name))
+                for category, name in entity_keys
+            )
+            for module, entity_keys in knowledge_base.get_module_entities().items()
+        }
+
+    def diff(self, other: "KnowledgeBaseContentTree") -> ContentDiff:
+        """Compare with the tree of another knowledge base.
+
+        Args:
+            other (KnowledgeBaseContentTree): The newer tree.
+        Returns:
+            ContentDiff: The entities added, removed and changed in ``other``.
+        """
+        result = ContentDiff()
+        if self.root != other.root:
+            for category, tree in self.categories.items():
+                added, removed, changed = tree.diff(other.categories[category])
+                if added:
+                    result.added[category] = added
+                if removed:
+                    result.removed[category] = removed
+                if changed:
+                    result.changed[category] = changed
+        result.changed_modules = sorted(
+            module
+            for module in set(self.modules) | set(other.modules)
+            if self.modules.get(module) != other.modules.get(module)
+        )
+        return result
@@ -1,11 +1,28 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Set
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from lx_dtypes.models.knowledge_base.knowledge_base_config import KnowledgeBaseConfig
-from lx_dtypes.utils.dataloader import resolve_kb_module_load_order
+from lx_dtypes.models.knowledge_base.module_cache import (
+    ModuleCache,
+    ModuleCacheKey,
+    ModuleCacheStats,
+)
+from lx_dtypes.utils.dataloader import (
+    ParseExecutorKind,
+    resolve_kb_module_load_levels,
+    resolve_kb_module_load_order,
+)
+from lx_dtypes.utils.fingerprint import combine_fingerprints, fingerprint_file
+from lx_dtypes.utils.manifest import (
+    DiscoveryManifest,
+    ManifestFileLister,
+    load_manifest,
+)
 from lx_dtypes.utils.mixins import BaseModelMixin
+from lx_dtypes.utils.paths import sort_walk_files
 
 if TYPE_CHECKING:
     from lx_dtypes.models.knowledge_base.knowledge_base import KnowledgeBase
@@ -22,44 +39,346 @@ class DataLoader(BaseModelMixin):
     name: str = "data_loader"
     input_dirs: List[Path] = Field(default_factory=_default_dataloader_dirs_factory)
     module_configs: Dict[str, KnowledgeBaseConfig] = Field(default_factory=dict)
+    # directory for binary knowledge base snapshots, disabled if None
+    snapshot_dir: Optional[Path] = None
+    # include content hashes in the snapshot key (slower, robust against mtime reuse)
+    snapshot_hash_content: bool = False
+    # parse module data files in a "thread" or "process" pool, sequential if None
+    parse_executor: Optional[ParseExecutorKind] = None
+    parse_workers: Optional[int] = None
+    # validate entities on first access instead of while loading
+    lazy: bool = False
+    # discover config and data files through a discovery manifest persisted in
+    # each input dir, revalidated by directory mtime
+    use_manifest: bool = False
+    # stack submodule knowledge bases as shared layers instead of copying them
+    layered: bool = False
+    # keep up to this many built module knowledge bases across
+    # load_knowledge_base calls, disabled if 0 (unbounded in layered mode)
+    module_cache_size: int = 0
+    # directory of trusted dumps (<module>.yaml + stamp) written by the CI build;
+    # dumps with a valid stamp are loaded without validation
+    trusted_dir: Optional[Path] = None
+    # build the modules of each dependency level in a thread pool of this size,
+    # sequentially if None; results are merged in the canonical load order
+    module_workers: Optional[int] = None
+    # directory of memory-mapped knowledge base files shared by all processes
+    # of a host; built and written once, then mapped read-only
+    mapped_dir: Optional[Path] = None
+
+    # (module name, config set version) -> initialized config
+    _resolved_configs: Dict[Tuple[str, int], KnowledgeBaseConfig] = PrivateAttr(
+        default_factory=dict
+    )
+    _config_version: int = PrivateAttr(default=0)
+    _resolved_module_configs: Optional[Dict[str, KnowledgeBaseConfig]] = PrivateAttr(
+        default=None
+    )
+    # resolved input dir -> manifest of the last config discovery
+    _manifests: Dict[Path, DiscoveryManifest] = PrivateAttr(default_factory=dict)
+    # created with the loader, module_workers threads share it from the start
+    _module_cache: ModuleCache = PrivateAttr(default_factory=ModuleCache)
 
     def load_knowledge_base(self, module_name: str) -> "KnowledgeBase":
         """Load a knowledge base by module name.
 
+        If ``snapshot_dir`` is set, a snapshot keyed by the fingerprint of all
+        input files is used when it is still valid. Otherwise the knowledge base
+        is built from the YAML files and a fresh snapshot is written.
+
+        If ``trusted_dir`` holds a dump of the module with a valid trust stamp
+        (see ``export_trusted_knowledge_base``), it is constructed without
+        validation instead. The signing key is read from LX_DTYPES_TRUST_KEY.
+
+        If ``mapped_dir`` is set, the knowledge base is loaded as above once per
+        host, written to a flat file and memory-mapped read-only (see
+        ``open_mapped_knowledge_base``); all processes share the file pages and
+        decode entities on first access.
+
         Args:
             module_name (str): The name of the knowledge base module to load.
 
         Returns:
             KnowledgeBase: The loaded knowledge base.
         """
+        if self.mapped_dir is not None:
+            return self._load_mapped_knowledge_base(module_name)
+        return self._load_unmapped_knowledge_base(module_name)
+
+    def _load_unmapped_knowledge_base(self, module_name: str) -> "KnowledgeBase":
+        if self.trusted_dir is not None:
+            kb = self._load_trusted_knowledge_base(module_name)
+            if kb is not None:
+                return kb
+
+        if self.snapshot_dir is None:
+            return self._build_knowledge_base(module_name)
+
+        from lx_dtypes.models.knowledge_base.snapshot import (
+            compute_snapshot_key,
+            get_snapshot_path,
+            read_knowledge_base_snapshot,
+            write_knowledge_base_snapshot,
+        )
+
+        snapshot_path = get_snapshot_path(self.snapshot_dir, module_name)
+        snapshot_key = compute_snapshot_key(
+            self.get_input_files(module_name),
+            hash_content=self.snapshot_hash_content,
+            mode=self.get_build_mode(),
+        )
+        kb = read_knowledge_base_snapshot(snapshot_path, snapshot_key)
+        if kb is not None:
+            return kb
+
+        kb = self._build_knowledge_base(module_name)
+        write_knowledge_base_snapshot(kb, snapshot_path, snapshot_key)
+        return kb
+
+    def _load_mapped_knowledge_base(self, module_name: str) -> "KnowledgeBase":
+        from lx_dtypes.models.knowledge_base.mapped import (
+            get_mapped_path,
+            open_mapped_knowledge_base,
+            write_mapped_knowledge_base,
+        )
+        from lx_dtypes.models.knowledge_base.snapshot import compute_snapshot_key
+
+        assert self.mapped_dir is not None
+        mapped_path = get_mapped_path(self.mapped_dir, module_name)
+        key = compute_snapshot_key(
+            self.get_input_files(module_name),
+            hash_content=self.snapshot_hash_content,
+            mode=self.get_build_mode(),
+        )
+        kb = open_mapped_knowledge_base(mapped_path, key)
+        if kb is not None:
+            return kb
+
+        built = self._load_unmapped_knowledge_base(module_name)
+        write_mapped_knowledge_base(built, mapped_path, key)
+        # the builder maps the file as well instead of keeping its own copy
+        return open_mapped_knowledge_base(mapped_path, key) or built
+
+    def _load_trusted_knowledge_base(
+        self, module_name: str
+    ) -> Optional["KnowledgeBase"]:
+        from lx_dtypes.models.knowledge_base.knowledge_base import KnowledgeBase
+        from lx_dtypes.models.knowledge_base.trusted import read_trusted_dump
+
+        assert self.trusted_dir is not None
+        data = read_trusted_dump(self.trusted_dir / f"{module_name}.yaml")
+        if data is None:
+            return None
+        return KnowledgeBase.construct_from_dump(data)
+
+    def get_input_files(self, module_name: str) -> List[Path]:
+        """Return every config and data file the knowledge base is built from.
+
+        Args:
+            module_name (str): The name of the knowledge base module.
+
+        Returns:
+            List[Path]: The config.yaml files of the module and its submodules
+            followed by all submodule data files.
+        """
+        kb_config = self.get_initialized_config_view(module_name)
+        input_files: List[Path] = []
+        if kb_config.source_file:
+            input_files.append(kb_config.source_file)
+
+        for sm_name in kb_config.modules:
+            sm_config = self.module_configs[sm_name]
+            if sm_config.source_file:
+                input_files.append(sm_config.source_file)
+            input_files += sm_config.data.get_files_with_suffix(
+                ".yaml", list_files=self.get_file_lister()
+            )
+        return input_files
+
+    def get_file_lister(self) -> Optional[Callable[[Path], List[Path]]]:
+        """Return the manifest backed file lister, or None without manifests."""
+        if not self.use_manifest or not self._manifests:
+            return None
+        return ManifestFileLister(self._manifests)
+
+    def _build_knowledge_base(self, module_name: str) -> "KnowledgeBase":
         from lx_dtypes.models.knowledge_base.knowledge_base import KnowledgeBase
 
         kb_config = self.get_initialized_config(module_name)
         kb = KnowledgeBase(name=kb_config.name, config=kb_config)
+        if self.layered:
+            kb.enable_layering()
+        elif self.lazy:
+            kb.enable_lazy_loading()
+
+        if self.parse_executor is None or self.lazy:
+            return self._import_module_knowledge_bases(kb, None)
+
+        from lx_dtypes.utils.parser import create_parse_executor
+
+        # one pool for every module of this load instead of one per module
+        with create_parse_executor(
+            self.parse_executor, max_workers=self.parse_workers
+        ) as parse_pool:
+            return self._import_module_knowledge_bases(kb, parse_pool)
+
+    def _import_module_knowledge_bases(
+        self, kb: "KnowledgeBase", parse_pool: Optional[Executor]
+    ) -> "KnowledgeBase":
+        from lx_dtypes.models.knowledge_base.knowledge_base import KnowledgeBase
 
-        ordered_submodules = kb_config.modules
+        assert kb.config is not None
+        ordered_submodules = kb.config.modules
+
+        def build_module(sm_name: str) -> KnowledgeBase:
+            return self._get_module_knowledge_base(sm_name, parse_pool)
+
+        if self.module_workers is None:
+            for sm_name in ordered_submodules:
+                kb.import_knowledge_base(build_module(sm_name))
+            return kb
+
+        # resolve all configs up front so workers only read the memo
+        for sm_name in ordered_submodules:
+            self.get_initialized_config_view(sm_name)
+
+        module_kbs: Dict[str, KnowledgeBase] = {}
+        with ThreadPoolExecutor(max_workers=self.module_workers) as pool:
+            for level in self.get_module_load_levels(kb.config.name):
+                level_kbs = pool.map(build_module, level)
+                module_kbs.update(zip(level, level_kbs))
 
         for sm_name in ordered_submodules:
-            sm_config = self.get_initialized_config(sm_name)
-            sm_kb = KnowledgeBase.create_from_config(sm_config)
-            kb.import_knowledge_base(sm_kb)
+            kb.import_knowledge_base(module_kbs[sm_name])
         return kb
 
+    def get_module_load_levels(self, module_name: str) -> List[List[str]]:
+        """Return the submodules of a knowledge base grouped by dependency level.
+
+        Modules of the same level do not depend on each other.
+
+        Args:
+            module_name (str): The name of the knowledge base module.
+
+        Returns:
+            List[List[str]]: The levels, each in canonical load order.
+        """
+        kb_config = self.get_initialized_config_view(module_name)
+        modules = self._collect_modules_with_dependencies(kb_config.modules)
+        return resolve_kb_module_load_levels(modules, kb_config.modules)
+
+    def get_module_knowledge_base(self, module_name: str) -> "KnowledgeBase":
+        """Build the knowledge base of a single module from its own data files.
+
+        With the module cache enabled the result is reused by every later call
+        for the module as long as its config and data files are unchanged. In
+        layered mode cached modules are shared as layers.
+
+        Args:
+            module_name (str): The name of the module.
+
+        Returns:
+            KnowledgeBase: The module knowledge base.
+        """
+        return self._get_module_knowledge_base(module_name, None)
+
+    def _get_module_knowledge_base(
+        self, module_name: str, parse_pool: Optional[Executor]
+    ) -> "KnowledgeBase":
+        from lx_dtypes.models.knowledge_base.knowledge_base import KnowledgeBase
+
+        cache = self.get_module_cache()
+        cache_key: Optional[ModuleCacheKey] = None
+        if cache is not None:
+            cache_key = self.get_module_cache_key(module_name)
+            cached_kb = cache.get(cache_key)
+            if cached_kb is not None:
+                return cached_kb
+
+        # the knowledge base owns its config, never the memoized view
+        sm_config = self.get_initialized_config(module_name)
+        sm_kb = KnowledgeBase.create_from_config(
+            sm_config,
+            executor=parse_pool or self.parse_executor,
+            max_workers=self.parse_workers,
+            lazy=self.lazy,
+            list_files=self.get_file_lister(),
+        )
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, sm_kb)
+        return sm_kb
+
+    def get_module_cache(self) -> Optional[ModuleCache]:
+        """Return the module cache, or None if caching is disabled."""
+        if self.module_cache_size > 0:
+            maxsize: Optional[int] = self.module_cache_size
+        elif self.layered:
+            maxsize = None
+        else:
+            return None
+
+        self._module_cache.maxsize = maxsize
+        return self._module_cache
+
+    def get_module_cache_stats(self) -> ModuleCacheStats:
+        """Return hit, miss and eviction counts of the module cache."""
+        cache = self.get_module_cache()
+        if cache is None:
+            return ModuleCacheStats(maxsize=self.module_cache_size or None)
+        return cache.get_stats()
+
+    def get_build_mode(self) -> str:
+        """Return how knowledge bases are built, e.g. ``"eager:flat"``.
+
+        Lazy and layered knowledge bases have different category types than
+        eager, flat ones, so snapshots and mapped files are keyed by the mode.
+        """
+        evaluation = "lazy" if self.lazy else "eager"
+        layout = "layered" if self.layered else "flat"
+        return f"{evaluation}:{layout}"
+
+    def get_module_cache_key(self, module_name: str) -> ModuleCacheKey:
+        """Return the cache key of a module: its name and input file fingerprint.
+
+        The fingerprint covers the module config file and all data files in load
+        order, plus the lazy flag since lazy and eager builds differ.
+        """
+        sm_config = self.get_initialized_config_view(module_name)
+        input_files: List[Path] = []
+        if sm_config.source_file:
+            input_files.append(sm_config.source_file)
+        input_files += sm_config.data.get_files_with_suffix(
+            ".yaml", list_files=self.get_file_lister()
+        )
+        fingerprint = combine_fingerprints(fingerprint_file(p) for p in input_files)
+        mode = "lazy" if self.lazy else "eager"
+        return (module_name, f"{mode}:{fingerprint}")
+
     def fetch_config_yamls(self) -> List[Path]:
         """Screens the input directories to ensure they exist.
         Then recursively iterates all directories to the end to locate all
         files named 'config.yaml'.
 
+        With ``use_manifest`` the walk is replaced by the discovery manifest of
+        each input dir; only directories whose mtime changed are listed again.
+
         Returns:
             List[Path]: A list of existing config_files.
         """
         config_files: List[Path] = []
+        if self.use_manifest:
+            self._manifests.clear()
         for input_dir in self.input_dirs:
             if not input_dir.exists() or not input_dir.is_dir():
                 continue
 
-            for path in input_dir.rglob("config.yaml"):
-                config_files.append(path)
+            if self.use_manifest:
+                manifest = load_manifest(input_dir)
+                self._manifests[input_dir.resolve()] = manifest
+                config_files += manifest.get_config_files(input_dir)
+                continue
+
+            config_files += sort_walk_files(list(input_dir.rglob("config.yaml")))
 
         return config_files
 
@@ -79,10 +398,50 @@ class DataLoader(BaseModelMixin):
             kb_config.data.source_file = config_file
             kb_config.normalize_data_paths(config_file)
             self.module_configs[kb_config.name] = kb_config
+        self.invalidate_resolution_cache()
+
+    def invalidate_resolution_cache(self) -> None:
+        """Drop all memoized initialized configs.
+
+        Called by ``load_module_configs`` and whenever ``module_configs`` is
+        replaced by a new dict. Call it after mutating ``module_configs`` in place.
+        """
+        self._config_version += 1
+        self._resolved_configs.clear()
+        self._resolved_module_configs = self.module_configs
 
     def get_initialized_config(self, module_name: str) -> "KnowledgeBaseConfig":
-        """Return the configuration with modules ordered by dependency graph."""
+        """Return the configuration with modules ordered by dependency graph.
+
+        The returned config is an independent copy; use
+        ``get_initialized_config_view`` to avoid copying.
+        """
+
+        return self.get_initialized_config_view(module_name).model_copy(deep=True)
+
+    def get_initialized_config_view(self, module_name: str) -> "KnowledgeBaseConfig":
+        """Return the memoized initialized configuration without copying it.
+
+        The result is shared by all callers and must be treated as read-only.
+
+        Args:
+            module_name (str): The name of the knowledge base module.
+
+        Returns:
+            KnowledgeBaseConfig: The configuration with modules ordered by the
+            dependency graph.
+        """
+        if self._resolved_module_configs is not self.module_configs:
+            self.invalidate_resolution_cache()
+
+        cache_key = (module_name, self._config_version)
+        kb_config = self._resolved_configs.get(cache_key)
+        if kb_config is None:
+            kb_config = self._resolve_config(module_name)
+            self._resolved_configs[cache_key] = kb_config
+        return kb_config
 
+    def _resolve_config(self, module_name: str) -> "KnowledgeBaseConfig":
         stored_config = self.module_configs.get(module_name)
         if stored_config is None:
             raise ValueError(
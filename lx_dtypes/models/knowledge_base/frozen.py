@@ -0,0 +1,286 @@
+import copy
+import threading
+import types
+import warnings
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    NoReturn,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, ConfigDict
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+
+from lx_dtypes.models.knowledge_base.knowledge_base import (
+    CATEGORY_NAMES,
+    KnowledgeBase,
+    KnowledgeBaseRefreshResult,
+)
+
+K = TypeVar("K")
+V = TypeVar("V")
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class FrozenDict(Dict[K, V]):
+    """A read-only, hashable dict.
+
+    Subclasses dict so pydantic validates and serializes it like the dict
+    fields it replaces; every mutating method raises ``TypeError``.
+    """
+
+    __slots__ = ("_hash",)
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    def __setitem__(self, key: K, value: V) -> NoReturn:
+        self._read_only()
+
+    def __delitem__(self, key: K) -> NoReturn:
+        self._read_only()
+
+    def __ior__(self, other: Any) -> NoReturn:  # type: ignore[misc]
+        self._read_only()
+
+    def clear(self) -> NoReturn:
+        self._read_only()
+
+    def pop(self, *args: Any) -> NoReturn:  # type: ignore[override]
+        self._read_only()
+
+    def popitem(self) -> NoReturn:
+        self._read_only()
+
+    def setdefault(self, *args: Any) -> NoReturn:  # type: ignore[override]
+        self._read_only()
+
+    def update(self, *args: Any, **kwargs: Any) -> NoReturn:  # type: ignore[override]
+        self._read_only()
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash: int = hash(frozenset(self.items()))
+            return self._hash
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (dict(self),))
+
+
+def freeze_value(value: Any) -> Any:
+    """Return an immutable version of a field value.
+
+    Lists and sets become tuples and frozensets, dicts ``FrozenDict`` and
+    pydantic models frozen copies; values are frozen recursively.
+    """
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    if isinstance(value, BaseModel):
+        return freeze_model(value)
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze_value(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze_value(item) for item in value)
+    return value
+
+
+def _freeze_annotation(annotation: Any) -> Any:
+    """Replace list and set types by tuples and frozensets in an annotation."""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if not args:
+        return annotation
+    if origin in (list, tuple):
+        return Tuple[(_freeze_annotation(args[0]), ...)]
+    if origin in (set, frozenset):
+        return frozenset[_freeze_annotation(args[0])]  # type: ignore[misc]
+    if origin is dict:
+        return Dict[args[0], _freeze_annotation(args[1])]  # type: ignore[misc,valid-type]
+    if origin in (Union, types.UnionType):
+        return Union[tuple(_freeze_annotation(arg) for arg in args)]
+    return annotation
+
+
+class _FrozenDefaultFactory:
+    def __init__(self, factory: Any) -> None:
+        self.factory = factory
+
+    def __call__(self) -> Any:
+        return freeze_value(self.factory())
+
+
+def _rebuild_frozen(
+    model_type: Type[BaseModel], values: Dict[str, Any], fields_set: Set[str]
+) -> BaseModel:
+    """Unpickle a frozen model, its generated class is not importable."""
+    frozen_type = get_frozen_model_type(model_type)
+    return frozen_type.model_construct(_fields_set=fields_set, **values)
+
+
+def _reduce_frozen(self: BaseModel) -> Tuple[Any, ...]:
+    return (
+        _rebuild_frozen,
+        (type(self).__bases__[0], dict(self.__dict__), set(self.model_fields_set)),
+    )
+
+
+_frozen_types: Dict[Type[BaseModel], Type[BaseModel]] = {}
+_frozen_types_lock = threading.Lock()
+
+
+def _create_frozen_model_type(model_type: Type[BaseModel]) -> Type[BaseModel]:
+    annotations: Dict[str, Any] = {}
+    namespace: Dict[str, Any] = {
+        "model_config": ConfigDict(frozen=True),
+        "__module__": model_type.__module__,
+        "__reduce__": _reduce_frozen,
+    }
+    for name, field_info in model_type.model_fields.items():
+        annotation = _freeze_annotation(field_info.annotation)
+        if annotation == field_info.annotation:
+            continue
+        frozen_field: FieldInfo = copy.copy(field_info)
+        frozen_field.annotation = annotation
+        if field_info.default_factory is not None:
+            frozen_field.default_factory = _FrozenDefaultFactory(
+                field_info.default_factory
+            )
+        elif field_info.default is not PydanticUndefined:
+            frozen_field.default = freeze_value(field_info.default)
+        annotations[name] = annotation
+        namespace[name] = frozen_field
+    namespace["__annotations__"] = annotations
+    with warnings.catch_warnings():
+        # redeclared fields of plain mixins (e.g. TaggedMixin.tags) "shadow" them
+        warnings.simplefilter("ignore", UserWarning)
+        return type(f"Frozen{model_type.__name__}", (model_type,), namespace)
+
+
+def get_frozen_model_type(model_type: Type[ModelT]) -> Type[ModelT]:
+    """Return the frozen subclass of a model class, created once per class.
+
+    The subclass has ``frozen=True`` and tuple annotations instead of lists, so
+    instances are hashable and still pass ``isinstance`` checks for the model.
+
+    Args:
+        model_type (Type[ModelT]): The model class.
+    Returns:
+        Type[ModelT]: The frozen subclass.
+    """
+    if model_type in _frozen_types.values():
+        return model_type
+    frozen_type = _frozen_types.get(model_type)
+    if frozen_type is None:
+        with _frozen_types_lock:
+            frozen_type = _frozen_types.get(model_type)
+            if frozen_type is None:
+                frozen_type = _create_frozen_model_type(model_type)
+                _frozen_types[model_type] = frozen_type
+    return frozen_type  # type: ignore[return-value]
+
+
+def freeze_model(model: ModelT) -> ModelT:
+    """Return a frozen, hashable copy of a pydantic model without validating it.
+
+    Args:
+        model (ModelT): The model to freeze.
+    Returns:
+        ModelT: An instance of the frozen subclass of the model class, ``model``
+        itself if it is frozen already.
+    """
+    frozen_type = get_frozen_model_type(type(model))
+    if type(model) is frozen_type:
+        return model
+    values = {name: freeze_value(value) for name, value in model.__dict__.items()}
+    return frozen_type.model_construct(
+        _fields_set=set(model.model_fields_set), **values
+    )
+
+
+class FrozenKnowledgeBase(KnowledgeBase):
+    """A read-only knowledge base of frozen entities.
+
+    Categories are ``FrozenDict`` instances and entities frozen, hashable
+    models with tuples instead of lists, so both can be shared between threads
+    and request handlers without copies. Indexes are still built and cached on
+    first use. Methods that change entities raise ``TypeError``.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    def __hash__(self) -> int:
+        return hash(self.get_content_hash())
+
+    def model_dump(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        # entities are serialized by their frozen classes, whose tuple fields
+        # the list schemas of the declared entity types would warn about
+        kwargs.setdefault("serialize_as_any", True)
+        return super().model_dump(*args, **kwargs)
+
+    def _read_only(self) -> NoReturn:
+        raise TypeError("FrozenKnowledgeBase is read-only")
+
+    def add_shallow_object(self, parsed_object: Any) -> NoReturn:
+        self._read_only()
+
+    def _remove_entity(self, category: str, name: str) -> NoReturn:
+        self._read_only()
+
+    def import_knowledge_base(self, other: KnowledgeBase) -> NoReturn:
+        self._read_only()
+
+    def refresh(self) -> KnowledgeBaseRefreshResult:
+        self._read_only()
+
+    def freeze(self) -> "FrozenKnowledgeBase":
+        return self
+
+
+def _freeze_entities(entities: Iterable[Tuple[str, BaseModel]]) -> FrozenDict[str, Any]:
+    return FrozenDict((name, freeze_model(entity)) for name, entity in entities)
+
+
+def freeze_knowledge_base(kb: KnowledgeBase) -> FrozenKnowledgeBase:
+    """Convert a knowledge base into a ``FrozenKnowledgeBase`` in one pass.
+
+    Every entity is copied once into its frozen model class without
+    validation; lazy and layered categories are materialized. The source
+    knowledge base is left unchanged.
+
+    Args:
+        kb (KnowledgeBase): The knowledge base to freeze.
+    Returns:
+        FrozenKnowledgeBase: The read-only knowledge base.
+    """
+    if isinstance(kb, FrozenKnowledgeBase):
+        return kb
+    values: Dict[str, Any] = {}
+    for name in KnowledgeBase.model_fields:
+        value = getattr(kb, name)
+        if name in CATEGORY_NAMES:
+            values[name] = _freeze_entities(value.items())
+        else:
+            values[name] = freeze_value(value)
+    frozen = FrozenKnowledgeBase.model_construct(
+        _fields_set=set(kb.model_fields_set), **values
+    )
+    # origins of the entities, for module roots and source lookups
+    frozen._source_fingerprints = dict(kb._source_fingerprints)
+    frozen._source_entities = dict(kb._source_entities)
+    frozen._module_files = dict(kb._module_files)
+    return frozen
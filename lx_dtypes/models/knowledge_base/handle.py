@@ -0,0 +1,130 @@
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from lx_dtypes.models.knowledge_base.knowledge_base import KnowledgeBase
+
+
+class KnowledgeBaseVersion(NamedTuple):
+    """A published knowledge base and its version number."""
+
+    version: int
+    knowledge_base: KnowledgeBase
+
+
+class KnowledgeBaseHandle:
+    """Atomically swappable reference to the current knowledge base.
+
+    Readers call ``snapshot()`` once per request and use that version for the
+    whole request; it is a single attribute read. ``publish`` and ``reload``
+    replace the current version with one pointer swap, so readers never wait
+    and never see a partially loaded knowledge base. A replaced version is
+    released as soon as the last reader holding it drops its reference.
+    Subscribed listeners receive the published versions in order; a version
+    that is replaced while listeners are notified is skipped.
+
+    Args:
+        knowledge_base (KnowledgeBase): The initial knowledge base, version 1.
+    """
+
+    def __init__(self, knowledge_base: KnowledgeBase) -> None:
+        self._lock = threading.Lock()
+        # serializes listener calls; reentrant so listeners may publish
+        self._notify_lock = threading.RLock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._listeners: List[
+            "weakref.WeakMethod[Callable[[KnowledgeBaseVersion], Any]]"
+        ] = []
+        # version -> knowledge base, as long as something still references it
+        self._versions: "weakref.WeakValueDictionary[int, KnowledgeBase]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._current = KnowledgeBaseVersion(1, knowledge_base)
+        self._versions[1] = knowledge_base
+
+    def snapshot(self) -> KnowledgeBaseVersion:
+        """Return the current version; keep using it for the whole request."""
+        return self._current
+
+    @property
+    def knowledge_base(self) -> KnowledgeBase:
+        return self._current.knowledge_base
+
+    @property
+    def version(self) -> int:
+        return self._current.version
+
+    def publish(self, knowledge_base: KnowledgeBase) -> KnowledgeBaseVersion:
+        """Make a fully built knowledge base the current version.
+
+        Args:
+            knowledge_base (KnowledgeBase): The new knowledge base.
+        Returns:
+            KnowledgeBaseVersion: The published version.
+        """
+        with self._lock:
+            current = KnowledgeBaseVersion(self._current.version + 1, knowledge_base)
+            self._versions[current.version] = knowledge_base
+            self._current = current
+            listeners = list(self._listeners)
+
+        # listeners run outside the lock, so they may read, publish or
+        # subscribe; a superseded version is not delivered any more
+        with self._notify_lock:
+            for ref in listeners:
+                if self._current is not current:
+                    break
+                listener = ref()
+                if listener is not None:
+                    listener(current)
+        if any(ref() is None for ref in listeners):
+            with self._lock:
+                self._listeners = [ref for ref in self._listeners if ref() is not None]
+        return current
+
+    def reload(
+        self, build: Callable[[], KnowledgeBase]
+    ) -> "Future[KnowledgeBaseVersion]":
+        """Build a knowledge base in a background thread and publish it.
+
+        Reloads run one after another in a single worker thread; readers keep
+        using the current version until the new one is published. If ``build``
+        raises, nothing is published and the future holds the exception.
+
+        Args:
+            build (Callable[[], KnowledgeBase]): Builds the new knowledge base,
+                e.g. ``lambda: loader.load_knowledge_base(name)``.
+        Returns:
+            Future[KnowledgeBaseVersion]: Resolves to the published version.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="kb-reload"
+                )
+            executor = self._executor
+        return executor.submit(lambda: self.publish(build()))
+
+    def subscribe(self, listener: Callable[[KnowledgeBaseVersion], Any]) -> None:
+        """Call a bound method with every published version.
+
+        Only a weak reference to the method is kept, so subscribing does not
+        keep its object alive.
+
+        Args:
+            listener (Callable[[KnowledgeBaseVersion], Any]): A bound method.
+        """
+        with self._lock:
+            self._listeners.append(weakref.WeakMethod(listener))  # type: ignore[arg-type]
+
+    def get_live_versions(self) -> List[int]:
+        """Return the versions that are current or still held by a reader."""
+        return sorted(self._versions.keys())
+
+    def close(self) -> None:
+        """Wait for pending reloads and stop the reload thread."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
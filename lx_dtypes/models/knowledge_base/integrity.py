@@ -0,0 +1,200 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+
+from pydantic import BaseModel, Field
+
+from lx_dtypes.models.knowledge_base.references import (
+    REFERENCE_FIELDS,
+    REFERENCED_CATEGORIES,
+)
+
+if TYPE_CHECKING:
+    from lx_dtypes.models.knowledge_base.knowledge_base import KnowledgeBase
+
+
+class DanglingReference(BaseModel):
+    category: str
+    name: str
+    field: str
+    target_category: str
+    target_name: str
+
+
+class DuplicateReference(BaseModel):
+    category: str
+    name: str
+    field: str
+    target_name: str
+    count: int
+
+
+class DuplicateDefinition(BaseModel):
+    category: str
+    name: str
+    source_files: List[Path]
+
+
+class OrphanedEntity(BaseModel):
+    category: str
+    name: str
+
+
+def _dangling_list() -> List[DanglingReference]:
+    return []
+
+
+def _duplicate_reference_list() -> List[DuplicateReference]:
+    return []
+
+
+def _duplicate_definition_list() -> List[DuplicateDefinition]:
+    return []
+
+
+def _orphan_list() -> List[OrphanedEntity]:
+    return []
+
+
+class IntegrityReport(BaseModel):
+    """Result of ``KnowledgeBase.check_integrity``."""
+
+    checked_entities: int = 0
+    checked_references: int = 0
+    dangling: List[DanglingReference] = Field(default_factory=_dangling_list)
+    duplicate_references: List[DuplicateReference] = Field(
+        default_factory=_duplicate_reference_list
+    )
+    duplicate_definitions: List[DuplicateDefinition] = Field(
+        default_factory=_duplicate_definition_list
+    )
+    orphaned: List[OrphanedEntity] = Field(default_factory=_orphan_list)
+
+    def has_errors(self) -> bool:
+        """Dangling and repeated references are errors; orphans and shadowed
+        definitions are informational."""
+        return bool(self.dangling or self.duplicate_references)
+
+
+def check_knowledge_base_integrity(kb: "KnowledgeBase") -> IntegrityReport:
+    """Resolve every name reference of a knowledge base in a single pass.
+
+    The pass collects the referenced names of each target category into a
+    cross-reference index. Set differences against the category dicts then
+    yield the dangling and orphaned names. The entities holding a dangling
+    reference are then looked up in the knowledge base's reverse indexes,
+    which are built on first use, to report where each reference occurs.
+
+    Args:
+        kb (KnowledgeBase): The knowledge base to check.
+
+    Returns:
+        IntegrityReport: Dangling, repeated and orphaned names and names defined
+        by more than one data file.
+    """
+    report = IntegrityReport()
+    referenced: Dict[str, Set[str]] = {
+        category: set() for category in REFERENCED_CATEGORIES
+    }
+
+    checked_entities = 0
+    checked_references = 0
+    for category, fields in REFERENCE_FIELDS.items():
+        entities = getattr(kb, category)
+        field_targets = [
+            (field, referenced[target]) for field, target in fields.items()
+        ]
+        for name, entity in entities.items():
+            checked_entities += 1
+            for field, target_referenced in field_targets:
+                target_names: List[str] = getattr(entity, field)
+                if not target_names:
+                    continue
+                checked_references += len(target_names)
+                target_referenced.update(target_names)
+                if len(target_names) > 1 and len(set(target_names)) != len(
+                    target_names
+                ):
+                    report.duplicate_references += _find_duplicates(
+                        category, name, field, target_names
+                    )
+    report.checked_entities = checked_entities
+    report.checked_references = checked_references
+
+    missing = {
+        category: names.difference(getattr(kb, category))
+        for category, names in referenced.items()
+    }
+    if any(missing.values()):
+        report.dangling = _find_dangling(kb, missing)
+
+    for category in REFERENCED_CATEGORIES:
+        used = referenced[category]
+        report.orphaned += [
+            OrphanedEntity(category=category, name=name)
+            for name in getattr(kb, category)
+            if name not in used
+        ]
+
+    definitions: Dict[Tuple[str, str], List[Path]] = {}
+    for file_path, entity_keys in kb._source_entities.items():
+        for entity_key in entity_keys:
+            definitions.setdefault(entity_key, []).append(file_path)
+    report.duplicate_definitions = [
+        DuplicateDefinition(category=category, name=name, source_files=files)
+        for (category, name), files in definitions.items()
+        if len(files) > 1
+    ]
+    return report
+
+
+def _find_duplicates(
+    category: str, name: str, field: str, target_names: List[str]
+) -> List[DuplicateReference]:
+    duplicates: List[DuplicateReference] = []
+    for target_name in dict.fromkeys(target_names):
+        count = target_names.count(target_name)
+        if count > 1:
+            duplicates.append(
+                DuplicateReference(
+                    category=category,
+                    name=name,
+                    field=field,
+                    target_name=target_name,
+                    count=count,
+                )
+            )
+    return duplicates
+
+
+def _find_dangling(
+    kb: "KnowledgeBase", missing: Dict[str, Set[str]]
+) -> List[DanglingReference]:
+    """Report where the missing names are referenced.
+
+    Only the entities listed by the reverse index of a reference field for a
+    missing name are visited, not the whole referencing category.
+    """
+    dangling: List[DanglingReference] = []
+    for category, fields in REFERENCE_FIELDS.items():
+        entities = getattr(kb, category)
+        for field, target_category in fields.items():
+            missing_names = missing[target_category]
+            if not missing_names:
+                continue
+            index = kb.get_reverse_index(category, field)
+            for target_name in sorted(missing_names):
+                for name in index.get(target_name):
+                    entity = entities.get(name)
+                    if entity is None:
+                        continue
+                    dangling += [
+                        DanglingReference(
+                            category=category,
+                            name=name,
+                            field=field,
+                            target_category=target_category,
+                            target_name=target_name,
+                        )
+                        for _ in range(getattr(entity, field).count(target_name))
+                    ]
+    return dangling
@@ -1,10 +1,36 @@
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Self, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Self,
+    Tuple,
+    Type,
+    Union,
+)
 
-import yaml
-from pydantic import Field, field_serializer
+from pydantic import (
+    BaseModel,
+    Field,
+    FieldSerializationInfo,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    TypeAdapter,
+    field_serializer,
+)
 
+from lx_dtypes.models.base_models.path import FilesAndDirsModel
 from lx_dtypes.models.knowledge_base.knowledge_base_config import KnowledgeBaseConfig
+from lx_dtypes.models.knowledge_base.references import REFERENCE_FIELDS
+from lx_dtypes.models.knowledge_base.reverse_index import ReverseIndex
+from lx_dtypes.models.knowledge_base.symbols import SymbolTable
 from lx_dtypes.models.shallow import (
     CitationShallow,
     ClassificationChoiceShallow,
@@ -22,8 +48,134 @@ from lx_dtypes.models.shallow import (
     UnitShallow,
     UnitTypeShallow,
 )
+from lx_dtypes.utils.fingerprint import FileFingerprint, fingerprint_file
 from lx_dtypes.utils.mixins.base_model import BaseModelMixin
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from lx_dtypes.models.knowledge_base.content_hash import (
+        ContentDiff,
+        KnowledgeBaseContentTree,
+    )
+    from lx_dtypes.models.knowledge_base.frozen import FrozenKnowledgeBase
+    from lx_dtypes.models.knowledge_base.integrity import IntegrityReport
+    from lx_dtypes.models.knowledge_base.search import SearchHit, SearchIndex
+    from lx_dtypes.models.knowledge_base.tag_index import TagIndex
+    from lx_dtypes.utils.dataloader import ParseExecutorKind
+    from lx_dtypes.utils.export.export_knowledge_base import ExportFormat
+    from lx_dtypes.utils.parser import ShallowModel
+
+
+CATEGORY_NAMES: Tuple[str, ...] = (
+    "citations",
+    "findings",
+    "finding_types",
+    "classifications",
+    "classification_types",
+    "classification_choices",
+    "examinations",
+    "examination_types",
+    "indications",
+    "indication_types",
+    "interventions",
+    "intervention_types",
+    "information_sources",
+    "units",
+    "unit_types",
+)
+
+# shallow model type -> category field, used to route parsed objects
+CATEGORY_BY_TYPE: Dict[Type[BaseModel], str] = {
+    CitationShallow: "citations",
+    FindingShallow: "findings",
+    FindingTypeShallow: "finding_types",
+    ClassificationShallow: "classifications",
+    ClassificationTypeShallow: "classification_types",
+    ClassificationChoiceShallow: "classification_choices",
+    ExaminationShallow: "examinations",
+    ExaminationTypeShallow: "examination_types",
+    IndicationShallow: "indications",
+    IndicationTypeShallow: "indication_types",
+    InterventionShallow: "interventions",
+    InterventionTypeShallow: "intervention_types",
+    InformationSourceShallow: "information_sources",
+    UnitShallow: "units",
+    UnitTypeShallow: "unit_types",
+}
+
+
+# fields dropped from every dump, see AppBaseModel.model_dump
+_DUMP_EXCLUDED_FIELDS = frozenset({"source_file", "created_at"})
+
+# exclude spec of the single pass dump, applying the per model exclusions of
+# AppBaseModel.model_dump to the config and to every entity
+DUMP_EXCLUDE: Dict[str, Any] = {
+    **{name: True for name in _DUMP_EXCLUDED_FIELDS},
+    "config": set(_DUMP_EXCLUDED_FIELDS),
+    **{
+        category: {"__all__": set(_DUMP_EXCLUDED_FIELDS)} for category in CATEGORY_NAMES
+    },
+}
+
+DUMP_OPTIONS: Dict[str, Any] = {
+    "by_alias": True,
+    "exclude_none": True,
+    "exclude_defaults": True,
+    "round_trip": True,
+}
+
+
+# set while KnowledgeBase.model_dump runs, which serializes the entities in
+# the same pass; other dumps serialize every entity like entity.model_dump()
+_SINGLE_PASS_DUMP: ContextVar[bool] = ContextVar("single_pass_dump", default=False)
+
+
+@lru_cache(maxsize=None)
+def _get_category_adapter(category: str) -> TypeAdapter[Dict[str, Any]]:
+    model_type: Any = next(
+        model_type for model_type, name in CATEGORY_BY_TYPE.items() if name == category
+    )
+    return TypeAdapter(Dict[str, model_type])
+
+
+def _dump_category(category: str, entities: Mapping[str, BaseModel]) -> Any:
+    """Dump every entity like ``entity.model_dump()``, in one pydantic-core call."""
+    return _get_category_adapter(category).dump_python(
+        entities if type(entities) is dict else dict(entities),
+        mode="json",
+        exclude={"__all__": set(_DUMP_EXCLUDED_FIELDS)},
+        serialize_as_any=True,
+        **DUMP_OPTIONS,
+    )
+
+
+def _merge_dump_exclude(exclude: Any) -> Dict[Any, Any]:
+    """Add user excludes (a set or dict of field names) to DUMP_EXCLUDE."""
+    merged: Dict[Any, Any] = dict(DUMP_EXCLUDE)
+    if isinstance(exclude, dict):
+        merged.update(exclude)
+    elif exclude:
+        merged.update((name, True) for name in exclude)
+    return merged
+
+
+def _empty_path_list() -> List[Path]:
+    return []
+
+
+class KnowledgeBaseRefreshResult(BaseModel):
+    """Summary of the changes applied by ``KnowledgeBase.refresh``."""
+
+    added_files: List[Path] = Field(default_factory=_empty_path_list)
+    changed_files: List[Path] = Field(default_factory=_empty_path_list)
+    removed_files: List[Path] = Field(default_factory=_empty_path_list)
+    upserted_entities: int = 0
+    removed_entities: int = 0
+
+    def has_changes(self) -> bool:
+        return bool(self.added_files or self.changed_files or self.removed_files)
+
 
 class KnowledgeBase(BaseModelMixin):
     """
@@ -57,15 +209,62 @@ class KnowledgeBase(BaseModelMixin):
     units: Dict[str, "UnitShallow"] = Field(default_factory=dict)
     unit_types: Dict[str, "UnitTypeShallow"] = Field(default_factory=dict)
 
+    # data file -> fingerprint at load time, in load order
+    _source_fingerprints: Dict[Path, FileFingerprint] = PrivateAttr(
+        default_factory=dict
+    )
+    # data file -> (category, name) of every entity parsed from it
+    _source_entities: Dict[Path, List[Tuple[str, str]]] = PrivateAttr(
+        default_factory=dict
+    )
+    # imported module name -> data files it was loaded from
+    _module_files: Dict[str, List[Path]] = PrivateAttr(default_factory=dict)
+    # data sections of the module configs, scanned for new files on refresh
+    _data_models: List[FilesAndDirsModel] = PrivateAttr(default_factory=list)
+    # (category, reference field) -> reverse index, built on first query
+    _reverse_indexes: Dict[Tuple[str, str], ReverseIndex] = PrivateAttr(
+        default_factory=dict
+    )
+    # name <-> id table, rebuilt on first query after a change
+    _symbol_table: Optional[SymbolTable] = PrivateAttr(default=None)
+    # tag bitmaps over the ids of the current symbol table
+    _tag_index: Optional["TagIndex"] = PrivateAttr(default=None)
+    # prefix and trigram index over the ids of the current symbol table
+    _search_index: Optional["SearchIndex"] = PrivateAttr(default=None)
+    # Merkle tree of the entity hashes of the current symbol table
+    _content_tree: Optional["KnowledgeBaseContentTree"] = PrivateAttr(default=None)
+
     @classmethod
-    def create_from_config(cls, config: "KnowledgeBaseConfig") -> "KnowledgeBase":
+    def create_from_config(
+        cls,
+        config: "KnowledgeBaseConfig",
+        executor: Optional[Union["ParseExecutorKind", "Executor"]] = None,
+        max_workers: Optional[int] = None,
+        lazy: bool = False,
+        list_files: Optional[Callable[[Path], List[Path]]] = None,
+    ) -> "KnowledgeBase":
         """Create a KnowledgeBase instance from a KnowledgeBaseConfig.
 
         Args:
             config (KnowledgeBaseConfig): The knowledge base configuration.
+            executor (Optional[Union[ParseExecutorKind, Executor]]): Parse and
+                validate the data files in a "thread" or "process" pool, or in a
+                pool from ``create_parse_executor`` shared across modules. Parsed
+                objects are merged in file order, so the result matches a
+                sequential build. Modules with few data files are parsed
+                sequentially.
+            max_workers (Optional[int]): Worker count of a "thread" or "process"
+                pool.
+            lazy (bool): Only index the data files and validate each entity the
+                first time it is accessed (see ``enable_lazy_loading``). The
+                executor is not used in lazy mode.
+            list_files (Optional[Callable[[Path], List[Path]]]): Lists the files
+                below a data directory, e.g. a ``ManifestFileLister``. Defaults to
+                a recursive directory walk.
         Returns:
             KnowledgeBase: The created KnowledgeBase instance.
         """
+        from lx_dtypes.utils.parser import parse_shallow_objects
 
         name = config.name
         kb_dict: Dict[str, Union[str, "KnowledgeBaseConfig", Path]] = {
@@ -78,69 +277,576 @@ class KnowledgeBase(BaseModelMixin):
 
         kb = cls.model_validate(kb_dict)
         data = config.data
-        submodule_files = data.get_files_with_suffix(".yaml")
-        for sm_file in submodule_files:
-            from lx_dtypes.utils.parser import parse_shallow_object
-
-            parsed_object_generator = parse_shallow_object(sm_file)
-            for parsed_object in parsed_object_generator:
-                if isinstance(parsed_object, CitationShallow):
-                    kb.citations[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, FindingShallow):
-                    kb.findings[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, FindingTypeShallow):
-                    kb.finding_types[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, ClassificationShallow):
-                    kb.classifications[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, ClassificationTypeShallow):
-                    kb.classification_types[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, ClassificationChoiceShallow):
-                    kb.classification_choices[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, ExaminationShallow):
-                    kb.examinations[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, ExaminationTypeShallow):
-                    kb.examination_types[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, IndicationShallow):
-                    kb.indications[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, IndicationTypeShallow):
-                    kb.indication_types[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, InterventionShallow):
-                    kb.interventions[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, InterventionTypeShallow):
-                    kb.intervention_types[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, InformationSourceShallow):
-                    kb.information_sources[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, UnitShallow):
-                    kb.units[parsed_object.name] = parsed_object
-                elif isinstance(parsed_object, UnitTypeShallow):  # type: ignore
-                    kb.unit_types[parsed_object.name] = parsed_object
-                else:
-                    raise TypeError(
-                        f"Unsupported shallow model type: {type(parsed_object)}"
-                    )
+        kb._data_models.append(data)
+        submodule_files = data.get_files_with_suffix(".yaml", list_files=list_files)
+        # fingerprint before parsing so edits made while parsing are picked up
+        # by the next refresh
+        fingerprints = [fingerprint_file(sm_file) for sm_file in submodule_files]
+        if lazy:
+            kb.enable_lazy_loading()
+            for sm_file, fingerprint in zip(submodule_files, fingerprints):
+                kb._add_pending_source_file(sm_file, fingerprint)
+            return kb
+
+        parsed_files = parse_shallow_objects(
+            submodule_files, executor=executor, max_workers=max_workers
+        )
+        for sm_file, fingerprint, parsed_objects in zip(
+            submodule_files, fingerprints, parsed_files
+        ):
+            kb._add_source_file(sm_file, fingerprint, parsed_objects)
         return kb
 
+    @staticmethod
+    def get_category_name(parsed_object: "ShallowModel") -> str:
+        """Return the name of the category field a shallow object belongs to.
+
+        Args:
+            parsed_object (ShallowModel): The shallow object.
+        Returns:
+            str: The category field name, e.g. "findings".
+        """
+        category = CATEGORY_BY_TYPE.get(type(parsed_object))
+        if category is None:
+            # subclasses of the shallow models
+            for model_type, model_category in CATEGORY_BY_TYPE.items():
+                if isinstance(parsed_object, model_type):
+                    return model_category
+            raise TypeError(f"Unsupported shallow model type: {type(parsed_object)}")
+        return category
+
+    def add_shallow_object(self, parsed_object: "ShallowModel") -> str:
+        """Add a parsed shallow object to the matching category.
+
+        Args:
+            parsed_object (ShallowModel): The object to add. An existing entry with
+                the same name is replaced.
+        Returns:
+            str: The name of the category the object was added to.
+        """
+        category = self.get_category_name(parsed_object)
+        entities = getattr(self, category)
+        if self._reverse_indexes:
+            self._update_reverse_indexes(category, parsed_object.name, parsed_object)
+        if self._symbol_table is not None:
+            self._symbol_table = None
+        entities[parsed_object.name] = parsed_object
+        return category
+
+    def _remove_entity(self, category: str, name: str) -> None:
+        if self._reverse_indexes:
+            self._update_reverse_indexes(category, name, None)
+        self._symbol_table = None
+        del getattr(self, category)[name]
+
+    def _add_source_file(
+        self,
+        file_path: Path,
+        fingerprint: FileFingerprint,
+        parsed_objects: List["ShallowModel"],
+    ) -> None:
+        """Add the objects parsed from one data file and remember their origin."""
+        entity_keys: List[Tuple[str, str]] = []
+        for parsed_object in parsed_objects:
+            category = self.add_shallow_object(parsed_object)
+            entity_keys.append((category, parsed_object.name))
+        self._source_fingerprints[file_path] = fingerprint
+        self._source_entities[file_path] = entity_keys
+
     def import_knowledge_base(self, other: "KnowledgeBase") -> None:
         """Merge another KnowledgeBase into this one.
 
+        With layering enabled (see ``enable_layering``) the categories of
+        ``other`` are stacked as layers instead of being copied.
+
         Args:
             other (KnowledgeBase): The other KnowledgeBase to merge.
         """
-        self.findings.update(other.findings)
-        self.finding_types.update(other.finding_types)
-        self.citations.update(other.citations)
-        self.classifications.update(other.classifications)
-        self.classification_types.update(other.classification_types)
-        self.classification_choices.update(other.classification_choices)
-        self.examinations.update(other.examinations)
-        self.examination_types.update(other.examination_types)
-        self.indications.update(other.indications)
-        self.indication_types.update(other.indication_types)
-        self.interventions.update(other.interventions)
-        self.intervention_types.update(other.intervention_types)
-        self.information_sources.update(other.information_sources)
-        self.units.update(other.units)
-        self.unit_types.update(other.unit_types)
+        from lx_dtypes.models.knowledge_base.layered import LayeredEntityDict
+
+        for category, field in self._reverse_indexes:
+            for name, entity in getattr(other, category).items():
+                self._update_reverse_indexes(category, name, entity, fields=(field,))
+        self._symbol_table = None
+
+        for category in CATEGORY_NAMES:
+            entities = getattr(self, category)
+            if isinstance(entities, LayeredEntityDict):
+                entities.add_layer(getattr(other, category))
+            else:
+                entities.update(getattr(other, category))
+
+        for file_path in other._source_fingerprints:
+            # re-insert so the merged dict keeps the load order of the files
+            self._source_fingerprints.pop(file_path, None)
+        self._source_fingerprints.update(other._source_fingerprints)
+        self._source_entities.update(other._source_entities)
+        if other._module_files:
+            self._module_files.update(other._module_files)
+        else:
+            self._module_files[other.name] = list(other._source_entities)
+        self._data_models.extend(other._data_models)
+
+    def refresh(self) -> "KnowledgeBaseRefreshResult":
+        """Reload only the data files that changed since they were loaded.
+
+        Files whose fingerprint (size and mtime) changed are re-parsed, entities
+        that disappeared from them are removed and new files in the tracked data
+        directories are added. Entities defined in several files keep the "last
+        file wins" order of the initial load; new files are treated as loaded last.
+
+        Returns:
+            KnowledgeBaseRefreshResult: The files and entities that were changed.
+        """
+        from lx_dtypes.utils.parser import parse_shallow_object
+
+        current_files: Dict[Path, None] = {}
+        for data_model in self._data_models:
+            for file_path in data_model.get_files_with_suffix(".yaml"):
+                # explicitly listed files may have been deleted
+                if file_path.is_file():
+                    current_files[file_path] = None
+
+        result = KnowledgeBaseRefreshResult()
+        for file_path, known in self._source_fingerprints.items():
+            if file_path not in current_files:
+                result.removed_files.append(file_path)
+            elif fingerprint_file(file_path) != known:
+                result.changed_files.append(file_path)
+        for file_path in current_files:
+            if file_path not in self._source_fingerprints:
+                result.added_files.append(file_path)
+
+        if not result.has_changes():
+            return result
+
+        # remove everything the changed and removed files contributed
+        stale_keys: Dict[Tuple[str, str], None] = {}
+        for file_path in [*result.changed_files, *result.removed_files]:
+            for category, name in self._source_entities.pop(file_path, []):
+                if self._get_source_file(category, name) == file_path:
+                    self._remove_entity(category, name)
+                    stale_keys[(category, name)] = None
+        for file_path in result.removed_files:
+            del self._source_fingerprints[file_path]
+
+        # re-parse in load order so later files still override earlier ones
+        changed_files = set(result.changed_files)
+        reparse_files = [p for p in self._source_fingerprints if p in changed_files]
+        for file_path in [*reparse_files, *result.added_files]:
+            fingerprint = fingerprint_file(file_path)
+            result.upserted_entities += self._merge_source_file(
+                file_path, fingerprint, parse_shallow_object(file_path)
+            )
+
+        # entities that were shadowed by a removed definition resurface from
+        # the last remaining file that defines them
+        for category, name in stale_keys:
+            if name in getattr(self, category):
+                continue
+            for file_path in reversed(list(self._source_fingerprints)):
+                if (category, name) not in self._source_entities[file_path]:
+                    continue
+                for parsed_object in parse_shallow_object(file_path):
+                    if parsed_object.name == name:
+                        self.add_shallow_object(parsed_object)
+                        result.upserted_entities += 1
+                break
+            else:
+                result.removed_entities += 1
+        return result
+
+    def _add_pending_source_file(
+        self, file_path: Path, fingerprint: FileFingerprint
+    ) -> None:
+        """Index the objects of one data file without validating them."""
+        from lx_dtypes.models.knowledge_base.lazy import LazyEntityDict, PendingEntity
+        from lx_dtypes.utils.parser import index_shallow_objects
+
+        # keeping reverse indexes up to date would validate the pending entities
+        self.invalidate_reverse_indexes()
+        self._symbol_table = None
+
+        entity_keys: List[Tuple[str, str]] = []
+        for category, name, item in index_shallow_objects(file_path):
+            entities = getattr(self, category)
+            assert isinstance(entities, LazyEntityDict)
+            entities.add_pending(name, PendingEntity(item, file_path))
+            entity_keys.append((category, name))
+        self._source_fingerprints[file_path] = fingerprint
+        self._source_entities[file_path] = entity_keys
+
+    def enable_layering(self) -> None:
+        """Switch all categories to views that stack imported knowledge bases.
+
+        ``import_knowledge_base`` then adds the categories of the imported
+        knowledge base as layers without copying them; later imports override
+        earlier ones as before. Entities already present are kept.
+        """
+        from lx_dtypes.models.knowledge_base.layered import LayeredEntityDict
+
+        for category in CATEGORY_NAMES:
+            entities = getattr(self, category)
+            if not isinstance(entities, LayeredEntityDict):
+                setattr(self, category, LayeredEntityDict(entities))
+
+    def flatten_layers(self) -> None:
+        """Replace layered categories by plain dicts holding the merged entries."""
+        from lx_dtypes.models.knowledge_base.layered import LayeredEntityDict
+
+        for category in CATEGORY_NAMES:
+            entities = getattr(self, category)
+            if isinstance(entities, LayeredEntityDict):
+                setattr(self, category, entities.flatten())
+
+    def enable_lazy_loading(self) -> None:
+        """Switch all categories to mappings that validate entities on first access.
+
+        Entities already present are kept. Getters and dict access work as
+        before; validation errors of pending entities surface on first access.
+        """
+        from lx_dtypes.models.knowledge_base.layered import LayeredEntityDict
+        from lx_dtypes.models.knowledge_base.lazy import LazyEntityDict
+
+        for category in CATEGORY_NAMES:
+            entities = getattr(self, category)
+            # layers keep their own lazy entries
+            if not isinstance(entities, (LazyEntityDict, LayeredEntityDict)):
+                setattr(self, category, LazyEntityDict(entities))
+
+    def count_materialized(self) -> Dict[str, int]:
+        """Count the validated entities of each category.
+
+        Returns:
+            Dict[str, int]: The number of materialized entities per category; equal
+            to the number of entries unless lazy loading is enabled.
+        """
+        from lx_dtypes.models.knowledge_base.layered import LayeredEntityDict
+        from lx_dtypes.models.knowledge_base.lazy import LazyEntityDict
+
+        counts: Dict[str, int] = {}
+        for category in CATEGORY_NAMES:
+            entities = getattr(self, category)
+            if isinstance(entities, (LazyEntityDict, LayeredEntityDict)):
+                counts[category] = entities.count_materialized()
+            else:
+                counts[category] = len(entities)
+        return counts
+
+    def _get_source_file(self, category: str, name: str) -> Optional[Path]:
+        """Return the source file of an entity without materializing it."""
+        from lx_dtypes.models.knowledge_base.layered import LayeredEntityDict
+        from lx_dtypes.models.knowledge_base.lazy import LazyEntityDict
+
+        entities = getattr(self, category)
+        if name not in entities:
+            return None
+        if isinstance(entities, (LazyEntityDict, LayeredEntityDict)):
+            return entities.get_source_file(name)
+        source_file: Optional[Path] = entities[name].source_file
+        return source_file
+
+    def _merge_source_file(
+        self,
+        file_path: Path,
+        fingerprint: FileFingerprint,
+        parsed_objects: List["ShallowModel"],
+    ) -> int:
+        """Add re-parsed objects unless a file loaded later defines them too.
+
+        Returns:
+            int: The number of entities that were added or replaced.
+        """
+        load_order = list(self._source_fingerprints)
+        position = (
+            load_order.index(file_path)
+            if file_path in self._source_fingerprints
+            else len(load_order)
+        )
+        later_files = set(load_order[position + 1 :])
+
+        upserted = 0
+        entity_keys: List[Tuple[str, str]] = []
+        for parsed_object in parsed_objects:
+            category = self.get_category_name(parsed_object)
+            entity_keys.append((category, parsed_object.name))
+            if self._get_source_file(category, parsed_object.name) in later_files:
+                continue
+            self.add_shallow_object(parsed_object)
+            upserted += 1
+        self._source_fingerprints[file_path] = fingerprint
+        self._source_entities[file_path] = entity_keys
+        return upserted
+
+    def get_reverse_index(self, category: str, field: str) -> ReverseIndex:
+        """Return the reverse index of a reference field, building it if needed.
+
+        Args:
+            category (str): The referencing category, e.g. "findings".
+            field (str): The reference field, e.g. "classification_names".
+        Returns:
+            ReverseIndex: Maps referenced names to the referencing entity names.
+        """
+        if field not in REFERENCE_FIELDS.get(category, {}):
+            raise KeyError(f"'{category}.{field}' is not a reference field.")
+        index = self._reverse_indexes.get((category, field))
+        if index is None:
+            index = ReverseIndex.build(getattr(self, category), field)
+            self._reverse_indexes[(category, field)] = index
+        return index
+
+    def get_referencing_names(
+        self, category: str, field: str, target_name: str
+    ) -> List[str]:
+        """Return the names of the entities of ``category`` referencing a name.
+
+        Args:
+            category (str): The referencing category, e.g. "findings".
+            field (str): The reference field, e.g. "classification_names".
+            target_name (str): The referenced name.
+        Returns:
+            List[str]: The referencing entity names.
+        """
+        return self.get_reverse_index(category, field).get(target_name)
+
+    def invalidate_reverse_indexes(self) -> None:
+        """Drop all reverse indexes.
+
+        ``add_shallow_object``, ``import_knowledge_base`` and ``refresh`` keep
+        the indexes up to date; call this after modifying entities or category
+        dicts directly.
+        """
+        self._reverse_indexes.clear()
+
+    def _update_reverse_indexes(
+        self,
+        category: str,
+        name: str,
+        entity: Optional[BaseModel],
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> None:
+        """Replace the references of one entity in the built reverse indexes."""
+        entities = getattr(self, category)
+        previous = entities[name] if name in entities else None
+        for field in fields or REFERENCE_FIELDS.get(category, {}):
+            index = self._reverse_indexes.get((category, field))
+            if index is None:
+                continue
+            if previous is not None:
+                index.remove(name, previous)
+            if entity is not None:
+                index.add(name, entity)
+
+    def get_findings_by_classification(self, classification_name: str) -> List[str]:
+        """Return the names of the findings using a classification."""
+        return self.get_referencing_names(
+            "findings", "classification_names", classification_name
+        )
+
+    def get_findings_by_intervention(self, intervention_name: str) -> List[str]:
+        """Return the names of the findings allowing an intervention."""
+        return self.get_referencing_names(
+            "findings", "intervention_names", intervention_name
+        )
+
+    def get_classifications_by_choice(self, choice_name: str) -> List[str]:
+        """Return the names of the classifications offering a choice."""
+        return self.get_referencing_names(
+            "classifications", "choice_names", choice_name
+        )
+
+    def get_examinations_by_finding(self, finding_name: str) -> List[str]:
+        """Return the names of the examinations including a finding."""
+        return self.get_referencing_names("examinations", "finding_names", finding_name)
+
+    def get_symbol_table(self) -> SymbolTable:
+        """Return the integer symbol table of the current entities.
+
+        The table is cached until an entity is added or removed through
+        ``add_shallow_object``, ``import_knowledge_base`` or ``refresh``; call
+        ``invalidate_symbol_table`` after modifying category dicts directly.
+
+        Returns:
+            SymbolTable: Dense ids per category and id arrays of the reference
+            fields.
+        """
+        if self._symbol_table is None:
+            self._symbol_table = SymbolTable(self)
+        return self._symbol_table
+
+    def invalidate_symbol_table(self) -> None:
+        self._symbol_table = None
+
+    def get_tag_index(self) -> "TagIndex":
+        """Return the tag bitmap index, rebuilt with the symbol table.
+
+        Returns:
+            TagIndex: The tag vocabulary and per category tag bitmaps.
+        """
+        from lx_dtypes.models.knowledge_base.tag_index import TagIndex
+
+        symbol_table = self.get_symbol_table()
+        if self._tag_index is None or self._tag_index.symbol_table is not symbol_table:
+            self._tag_index = TagIndex(symbol_table, self)
+        return self._tag_index
+
+    def query_tags(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+        categories: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[str]]:
+        """Return the names of the tagged entities matching a tag query.
+
+        Args:
+            all_of (Iterable[str]): Tags that must all be present.
+            any_of (Iterable[str]): Tags of which at least one must be present.
+            none_of (Iterable[str]): Tags that must not be present.
+            categories (Optional[Iterable[str]]): The categories to query,
+                defaults to all categories with tags.
+        Returns:
+            Dict[str, List[str]]: Category -> matching names.
+        """
+        return self.get_tag_index().query(
+            all_of=all_of, any_of=any_of, none_of=none_of, categories=categories
+        )
+
+    def get_search_index(self) -> "SearchIndex":
+        """Return the term search index, rebuilt with the symbol table.
+
+        Returns:
+            SearchIndex: Prefix and trigram index over names, translations and
+            descriptions of all entities.
+        """
+        from lx_dtypes.models.knowledge_base.search import SearchIndex
+
+        symbol_table = self.get_symbol_table()
+        index = self._search_index
+        if index is None or index.symbol_table is not symbol_table:
+            index = self._search_index = SearchIndex(symbol_table, self)
+        return index
+
+    def search(
+        self,
+        text: str,
+        limit: int = 10,
+        categories: Optional[Iterable[str]] = None,
+        tags: Optional[Iterable[str]] = None,
+        fuzzy: bool = True,
+    ) -> List["SearchHit"]:
+        """Search entities by partial name, translation or description.
+
+        Args:
+            text (str): The query; case, accents and underscores are ignored.
+            limit (int): The maximum number of hits.
+            categories (Optional[Iterable[str]]): Restrict the hits to categories.
+            tags (Optional[Iterable[str]]): Restrict the hits to entities carrying
+                all of these tags.
+            fuzzy (bool): Include misspelled matches if there are too few others.
+        Returns:
+            List[SearchHit]: Prefix matches first, then substring and fuzzy matches.
+        """
+        return self.get_search_index().search(
+            text,
+            limit=limit,
+            categories=categories,
+            tags=tags,
+            knowledge_base=self,
+            fuzzy=fuzzy,
+        )
+
+    def get_module_entities(self) -> Dict[str, List[Tuple[str, str]]]:
+        """Return the entities each imported module defines.
+
+        An entity defined by several modules belongs to the one imported last,
+        like its value does.
+
+        Returns:
+            Dict[str, List[Tuple[str, str]]]: Module name -> (category, name)
+            keys, empty if no module was imported.
+        """
+        file_modules = {
+            file_path: module
+            for module, file_paths in self._module_files.items()
+            for file_path in file_paths
+        }
+        module_entities: Dict[str, Dict[Tuple[str, str], None]] = {
+            module: {} for module in self._module_files
+        }
+        for file_path, entity_keys in self._source_entities.items():
+            module = file_modules.get(file_path)
+            if module is None:
+                continue
+            for category, name in entity_keys:
+                if self._get_source_file(category, name) == file_path:
+                    module_entities[module][(category, name)] = None
+        return {module: list(keys) for module, keys in module_entities.items()}
+
+    def get_content_tree(self) -> "KnowledgeBaseContentTree":
+        """Return the Merkle tree of the entity hashes, rebuilt with the symbol
+        table.
+
+        Returns:
+            KnowledgeBaseContentTree: Entity, bucket, category and module hashes.
+        """
+        from lx_dtypes.models.knowledge_base.content_hash import (
+            KnowledgeBaseContentTree,
+        )
+
+        symbol_table = self.get_symbol_table()
+        tree = self._content_tree
+        if tree is None or tree.symbol_table is not symbol_table:
+            tree = self._content_tree = KnowledgeBaseContentTree(symbol_table, self)
+        return tree
+
+    def get_content_hash(self) -> str:
+        """Return the root hash over all entities.
+
+        Equal for knowledge bases with equal entities, independent of load order,
+        source files and creation times, e.g. for cache keys and ETags.
+
+        Returns:
+            str: A sha256 hex digest.
+        """
+        return self.get_content_tree().root
+
+    def diff_content(self, other: "KnowledgeBase") -> "ContentDiff":
+        """Return the entities added, removed and changed in another knowledge base.
+
+        Only the buckets whose hashes differ are compared entity by entity.
+
+        Args:
+            other (KnowledgeBase): The knowledge base to compare with, e.g. a newer
+                build.
+        Returns:
+            ContentDiff: Names per category and the modules whose roots differ.
+        """
+        return self.get_content_tree().diff(other.get_content_tree())
+
+    def freeze(self) -> "FrozenKnowledgeBase":
+        """Return a read-only copy with frozen, hashable entities.
+
+        See ``FrozenKnowledgeBase``; this knowledge base is left unchanged.
+
+        Returns:
+            FrozenKnowledgeBase: The frozen knowledge base.
+        """
+        from lx_dtypes.models.knowledge_base.frozen import freeze_knowledge_base
+
+        return freeze_knowledge_base(self)
+
+    def check_integrity(self) -> "IntegrityReport":
+        """Check that every name reference between entities resolves.
+
+        Returns:
+            IntegrityReport: Dangling, repeated and orphaned names.
+        """
+        from lx_dtypes.models.knowledge_base.integrity import (
+            check_knowledge_base_integrity,
+        )
+
+        return check_knowledge_base_integrity(self)
 
     def export_yaml(self, export_dir: Path, filename: str = "knowledge_base") -> None:
         """Export the knowledge base to the specified directory.
@@ -152,19 +858,111 @@ class KnowledgeBase(BaseModelMixin):
 
         export_knowledge_base(self, export_dir, filename=filename)
 
+    def export(
+        self,
+        export_dir: Path,
+        filename: str = "knowledge_base",
+        export_format: "ExportFormat" = "yaml",
+        compress: bool = False,
+    ) -> Path:
+        """Stream the knowledge base to a YAML, JSON Lines or JSON file.
+
+        Args:
+            export_dir (Path): The directory to export the knowledge base to.
+            filename (str): The file name without suffix.
+            export_format (ExportFormat): "yaml", "jsonl" or "json".
+            compress (bool): Write gzip compressed output.
+
+        Returns:
+            Path: The written file.
+        """
+        from lx_dtypes.utils.export.export_knowledge_base import export_knowledge_base
+
+        return export_knowledge_base(
+            self,
+            export_dir,
+            filename=filename,
+            export_format=export_format,
+            compress=compress,
+        )
+
     @classmethod
-    def create_from_yaml(cls, yaml_path: Path) -> Self:
-        """Load a knowledge base from a YAML dump.
+    def create_from_yaml(
+        cls, yaml_path: Path, trusted: bool = False, trust_key: Optional[bytes] = None
+    ) -> Self:
+        """Load a knowledge base from a YAML dump or its JSON sidecar.
 
         Args:
             yaml_path (Path): The path to the YAML file.
+            trusted (bool): Skip validation if the dump carries a valid trust
+                stamp (see ``export_trusted_knowledge_base``). Dumps without a
+                valid stamp are fully validated.
+            trust_key (Optional[bytes]): Key the stamp was signed with, defaults
+                to the LX_DTYPES_TRUST_KEY environment variable.
         """
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            data_dict = yaml.safe_load(f)
+        from lx_dtypes.utils.file_loader import load_yaml, read_json_sidecar
+
+        if trusted:
+            from lx_dtypes.models.knowledge_base.trusted import read_trusted_dump
 
+            trusted_data = read_trusted_dump(yaml_path, key=trust_key)
+            if trusted_data is not None:
+                return cls.construct_from_dump(trusted_data)
+
+        raw = read_json_sidecar(yaml_path)
+        if raw is not None:
+            return cls.model_validate_json(raw)
+
+        data_dict = load_yaml(yaml_path)
         kb = cls.model_validate(data_dict)
         return kb
 
+    @classmethod
+    def construct_from_dump(cls, data: Dict[str, Any]) -> Self:
+        """Build a knowledge base from a ``model_dump`` without validating entities.
+
+        Entities are created with ``model_construct`` semantics, so the dump must
+        come from a validated knowledge base. Only the config is validated.
+
+        Args:
+            data (Dict[str, Any]): The dumped knowledge base.
+        Returns:
+            KnowledgeBase: The constructed knowledge base.
+        """
+        from lx_dtypes.models.knowledge_base.trusted import construct_validated
+
+        values = {k: v for k, v in data.items() if k not in CATEGORY_NAMES}
+        config = values.pop("config", None)
+        if config is not None:
+            values["config"] = KnowledgeBaseConfig.model_validate(config)
+        for model_type, category in CATEGORY_BY_TYPE.items():
+            values[category] = {
+                name: construct_validated(model_type, item)
+                for name, item in data.get(category, {}).items()
+            }
+        return cls.model_construct(**values)
+
+    def model_dump(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Dump the knowledge base and all entities in one pydantic-core pass.
+
+        Every entity is dumped like ``AppBaseModel.model_dump`` dumps it on its
+        own (JSON mode, no defaults, no None values, no ``source_file`` and
+        ``created_at``). Keyword arguments apply to the entities as well;
+        ``exclude`` is added to the default exclusions.
+
+        ``model_dump_json`` keeps the pydantic defaults for the top-level fields
+        and dumps the config and every entity like ``model_dump()`` on its own.
+        """
+        kwargs.setdefault("mode", "json")
+        for option, value in DUMP_OPTIONS.items():
+            kwargs.setdefault(option, value)
+        kwargs["exclude"] = _merge_dump_exclude(kwargs.get("exclude"))
+        token = _SINGLE_PASS_DUMP.set(True)
+        try:
+            return super().model_dump(*args, **kwargs)
+        finally:
+            _SINGLE_PASS_DUMP.reset(token)
+
     def count_entries(self) -> Dict[str, int]:
         """Count the number of entries in each category of the knowledge base.
 
@@ -336,150 +1134,27 @@ class KnowledgeBase(BaseModelMixin):
             raise KeyError(f"Information source '{name}' not found in knowledge base.")
         return information_source
 
-    @field_serializer("citations")
-    def serialize_citations(
-        self, citations: Dict[str, "CitationShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: citation.model_dump() for name, citation in citations.items()
-        }
-        return r
-
-    @field_serializer("findings")
-    def serialize_findings(
-        self, findings: Dict[str, "FindingShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: finding.model_dump() for name, finding in findings.items()
-        }
-        return r
-
-    @field_serializer("finding_types")
-    def serialize_finding_types(
-        self, finding_types: Dict[str, "FindingTypeShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: finding_type.model_dump()
-            for name, finding_type in finding_types.items()
-        }
-        return r
-
-    @field_serializer("classifications")
-    def serialize_classifications(
-        self, classifications: Dict[str, "ClassificationShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: classification.model_dump()
-            for name, classification in classifications.items()
-        }
-        return r
-
-    @field_serializer("classification_types")
-    def serialize_classification_types(
-        self, classification_types: Dict[str, "ClassificationTypeShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: classification_type.model_dump()
-            for name, classification_type in classification_types.items()
-        }
-        return r
-
-    @field_serializer("classification_choices")
-    def serialize_classification_choices(
-        self, classification_choices: Dict[str, "ClassificationChoiceShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: classification_choice.model_dump()
-            for name, classification_choice in classification_choices.items()
-        }
-        return r
-
-    @field_serializer("examinations")
-    def serialize_examinations(
-        self, examinations: Dict[str, "ExaminationShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: examination.model_dump() for name, examination in examinations.items()
-        }
-        return r
-
-    @field_serializer("examination_types")
-    def serialize_examination_types(
-        self, examination_types: Dict[str, "ExaminationTypeShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: examination_type.model_dump()
-            for name, examination_type in examination_types.items()
-        }
-        return r
-
-    @field_serializer("interventions")
-    def serialize_interventions(
-        self, interventions: Dict[str, "InterventionShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: intervention.model_dump()
-            for name, intervention in interventions.items()
-        }
-        return r
-
-    @field_serializer("intervention_types")
-    def serialize_intervention_types(
-        self, intervention_types: Dict[str, "InterventionTypeShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: intervention_type.model_dump()
-            for name, intervention_type in intervention_types.items()
-        }
-        return r
-
-    @field_serializer("indications")
-    def serialize_indications(
-        self, indications: Dict[str, "IndicationShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: indication.model_dump() for name, indication in indications.items()
-        }
-        return r
-
-    @field_serializer("indication_types")
-    def serialize_indication_types(
-        self, indication_types: Dict[str, "IndicationTypeShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: indication_type.model_dump()
-            for name, indication_type in indication_types.items()
-        }
-        return r
-
-    @field_serializer("information_sources")
-    def serialize_information_sources(
-        self, information_sources: Dict[str, "InformationSourceShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: information_source.model_dump()
-            for name, information_source in information_sources.items()
-        }
-        return r
+    @field_serializer(*CATEGORY_NAMES, mode="wrap")
+    def serialize_category(
+        self,
+        entities: Mapping[str, BaseModel],
+        handler: SerializerFunctionWrapHandler,
+        info: FieldSerializationInfo,
+    ) -> Any:
+        # in model_dump pydantic-core serializes the entities in the same pass;
+        # model_dump_json keeps the per-entity output of entity.model_dump().
+        # As a field level serializer this also keeps empty categories in dumps
+        # with exclude_defaults
+        if _SINGLE_PASS_DUMP.get():
+            return handler(entities if type(entities) is dict else dict(entities))
+        return _dump_category(info.field_name, entities)
 
-    @field_serializer("config")
+    @field_serializer("config", mode="wrap")
     def serialize_config(
-        self, config: Optional["KnowledgeBaseConfig"]
-    ) -> Optional[Dict[str, Any]]:
-        if config is None:
-            return None
-        return config.model_dump()
-
-    @field_serializer("units")
-    def serialize_units(self, units: Dict[str, "UnitShallow"]) -> Dict[str, Any]:
-        r: Dict[str, Any] = {name: unit.model_dump() for name, unit in units.items()}
-        return r
-
-    @field_serializer("unit_types")
-    def serialize_unit_types(
-        self, unit_types: Dict[str, "UnitTypeShallow"]
-    ) -> Dict[str, Any]:
-        r: Dict[str, Any] = {
-            name: unit_type.model_dump() for name, unit_type in unit_types.items()
-        }
-        return r
+        self,
+        config: Optional[KnowledgeBaseConfig],
+        handler: SerializerFunctionWrapHandler,
+    ) -> Any:
+        if _SINGLE_PASS_DUMP.get():
+            return handler(config)
+        return None if config is None else config.model_dump()
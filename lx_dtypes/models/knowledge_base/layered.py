@@ -0,0 +1,134 @@
+from pathlib import Path
+from typing import (
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from lx_dtypes.models.knowledge_base.lazy import LazyEntityDict
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class LayeredEntityDict(MutableMapping[str, T], Generic[T]):
+    """Name -> entity view over a stack of module layers.
+
+    Layers are kept in load order and are never copied or modified: a name
+    resolves to the entry of the last layer that defines it, matching the
+    override semantics of repeated ``dict.update`` calls. Writes and deletes only
+    affect a local top layer, so the same module layer can be shared by several
+    knowledge bases.
+
+    The number of visible names is kept up to date on every write, delete and
+    ``add_layer``, so ``len()`` does not walk the layers. Layers must therefore
+    not change once they are stacked.
+    """
+
+    def __init__(self, entries: Optional[Mapping[str, T]] = None) -> None:
+        self._layers: List[Mapping[str, T]] = []
+        self._local: Dict[str, T] = dict(entries or {})
+        self._deleted: Set[str] = set()
+        self._count = len(self._local)
+
+    @property
+    def layers(self) -> List[Mapping[str, T]]:
+        return list(self._layers)
+
+    def add_layer(self, layer: Mapping[str, T]) -> None:
+        """Stack a layer on top of the existing ones.
+
+        Local writes and deletes of names defined in the layer are dropped, like
+        a ``dict.update`` would overwrite them.
+        """
+        # every name of the layer is visible afterwards
+        self._count += sum(1 for name in layer if name not in self)
+        self._layers = [known for known in self._layers if known is not layer]
+        self._layers.append(layer)
+        for name in layer:
+            self._local.pop(name, None)
+            self._deleted.discard(name)
+
+    def _find_owner(self, name: str) -> Optional[Mapping[str, T]]:
+        if name in self._local:
+            return self._local
+        if name in self._deleted:
+            return None
+        for layer in reversed(self._layers):
+            if name in layer:
+                return layer
+        return None
+
+    def get_source_file(self, name: str) -> Optional[Path]:
+        """Return the source file of an entry without materializing it."""
+        owner = self._find_owner(name)
+        if owner is None:
+            raise KeyError(name)
+        if isinstance(owner, (LazyEntityDict, LayeredEntityDict)):
+            return owner.get_source_file(name)
+        source_file: Optional[Path] = getattr(owner[name], "source_file", None)
+        return source_file
+
+    def count_materialized(self) -> int:
+        count = 0
+        for name in self:
+            owner = self._find_owner(name)
+            if isinstance(owner, (LazyEntityDict, LayeredEntityDict)):
+                count += owner.is_materialized(name)
+            else:
+                count += 1
+        return count
+
+    def is_materialized(self, name: str) -> bool:
+        owner = self._find_owner(name)
+        if isinstance(owner, (LazyEntityDict, LayeredEntityDict)):
+            return owner.is_materialized(name)
+        return owner is not None
+
+    def flatten(self) -> Dict[str, T]:
+        """Merge all layers into a single dict."""
+        return {name: self[name] for name in self}
+
+    def __getitem__(self, name: str) -> T:
+        owner = self._find_owner(name)
+        if owner is None:
+            raise KeyError(name)
+        return owner[name]
+
+    def __setitem__(self, name: str, value: T) -> None:
+        if name not in self:
+            self._count += 1
+        self._deleted.discard(name)
+        self._local[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self:
+            raise KeyError(name)
+        self._local.pop(name, None)
+        self._deleted.add(name)
+        self._count -= 1
+
+    def __iter__(self) -> Iterator[str]:
+        seen: Set[str] = set()
+        for layer in (*self._layers, self._local):
+            for name in layer:
+                if name in seen or name in self._deleted:
+                    continue
+                seen.add(name)
+                yield name
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._find_owner(name) is not None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(layers={len(self._layers)}, entries={len(self)})"
@@ -0,0 +1,107 @@
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from lx_dtypes.utils.parser import ShallowModel
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class PendingEntity:
+    """Raw data file item that is validated on first access."""
+
+    __slots__ = ("item", "source_file")
+
+    def __init__(self, item: Dict[str, Any], source_file: Path) -> None:
+        self.item = item
+        self.source_file = source_file
+
+    def materialize(self) -> "ShallowModel":
+        from lx_dtypes.utils.parser import validate_shallow_item
+
+        return validate_shallow_item(dict(self.item), self.source_file)
+
+
+class LazyEntityDict(MutableMapping[str, T], Generic[T]):
+    """Name -> entity mapping that validates entities the first time they are read.
+
+    Membership tests, ``len`` and key iteration never validate anything. Merging
+    another LazyEntityDict via ``update`` copies pending entries as they are.
+    """
+
+    def __init__(self, entries: Optional[Mapping[str, T]] = None) -> None:
+        self._slots: Dict[str, Union[T, PendingEntity]] = dict(entries or {})
+
+    def add_pending(self, name: str, pending: PendingEntity) -> None:
+        self._slots[name] = pending
+
+    def get_source_file(self, name: str) -> Optional[Path]:
+        """Return the source file of an entry without materializing it."""
+        value = self._slots[name]
+        if isinstance(value, PendingEntity):
+            return value.source_file
+        source_file: Optional[Path] = getattr(value, "source_file", None)
+        return source_file
+
+    def is_materialized(self, name: str) -> bool:
+        return not isinstance(self._slots[name], PendingEntity)
+
+    def count_materialized(self) -> int:
+        return sum(
+            1 for value in self._slots.values() if not isinstance(value, PendingEntity)
+        )
+
+    def __getitem__(self, name: str) -> T:
+        value = self._slots[name]
+        if isinstance(value, PendingEntity):
+            value = cast(T, value.materialize())
+            self._slots[name] = value
+        return value
+
+    def __setitem__(self, name: str, value: T) -> None:
+        self._slots[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        del self._slots[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._slots
+
+    def update(  # type: ignore[override]
+        self,
+        other: Union[Mapping[str, T], Iterable[Tuple[str, T]]] = (),
+        /,
+        **kwargs: T,
+    ) -> None:
+        if isinstance(other, LazyEntityDict):
+            self._slots.update(other._slots)
+            other = ()
+        super().update(other, **kwargs)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(entries={len(self)}, "
+            f"materialized={self.count_materialized()})"
+        )
@@ -0,0 +1,221 @@
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Generic, Iterator, List, Mapping, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+from lx_dtypes.models.knowledge_base.knowledge_base import (
+    CATEGORY_BY_TYPE,
+    CATEGORY_NAMES,
+    KnowledgeBase,
+)
+from lx_dtypes.models.knowledge_base.knowledge_base_config import KnowledgeBaseConfig
+
+# Bump whenever the file layout or the entity dump changes incompatibly.
+MAPPED_FORMAT_VERSION = 1
+MAPPED_SUFFIX = ".kb.map"
+MAPPED_MAGIC = b"LXKBMAP1"
+# header offset, header length, magic
+_TRAILER = struct.Struct("<QQ8s")
+_OFFSET_ITEMSIZE = 8
+
+T = TypeVar("T", bound=BaseModel)
+
+MODEL_BY_CATEGORY: Dict[str, Type[BaseModel]] = {
+    category: model_type for model_type, category in CATEGORY_BY_TYPE.items()
+}
+
+
+def get_mapped_path(mapped_dir: Path, module_name: str) -> Path:
+    return mapped_dir / f"{module_name}{MAPPED_SUFFIX}"
+
+
+class MappedEntityDict(Mapping[str, T], Generic[T]):
+    """Read-only name -> entity mapping over entity dumps in a mapped file.
+
+    The dumps stay in the (shared) file pages; an entity is decoded without
+    validation the first time it is read and then kept in this process.
+
+    Args:
+        view (memoryview): A view of the whole mapped file.
+        offsets (memoryview): ``len(names) + 1`` int64 file offsets, entity ``i``
+            spans ``offsets[i]:offsets[i + 1]``.
+        names (List[str]): The entity names in file order.
+        model_type (Type[T]): The model class of the entities.
+    """
+
+    def __init__(
+        self,
+        view: memoryview,
+        offsets: memoryview,
+        names: List[str],
+        model_type: Type[T],
+    ) -> None:
+        self._view = view
+        self._offsets = offsets
+        self._index = {name: position for position, name in enumerate(names)}
+        self._model_type = model_type
+        self._decoded: Dict[str, T] = {}
+
+    def __getitem__(self, name: str) -> T:
+        entity = self._decoded.get(name)
+        if entity is None:
+            from lx_dtypes.models.knowledge_base.trusted import construct_validated
+
+            position = self._index[name]
+            start, end = self._offsets[position], self._offsets[position + 1]
+            # from_json only takes bytes, the dump is copied once to decode it
+            values = from_json(self._view[start:end].tobytes())
+            entity = construct_validated(self._model_type, values)
+            self._decoded[name] = entity
+        return entity
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def count_decoded(self) -> int:
+        return len(self._decoded)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(entries={len(self)}, "
+            f"decoded={self.count_decoded()})"
+        )
+
+
+def write_mapped_knowledge_base(
+    kb: KnowledgeBase, mapped_path: Path, key: str = ""
+) -> Path:
+    """Write a knowledge base to a flat file for ``open_mapped_knowledge_base``.
+
+    Entity dumps (as in ``kb.model_dump()``) are streamed one at a time,
+    followed by the offset table of every category, a JSON header and a fixed
+    size trailer. The file is written to a temporary sibling and moved into
+    place, so processes that map it never see a partial file.
+
+    Args:
+        kb (KnowledgeBase): The knowledge base to write.
+        mapped_path (Path): The target file.
+        key (str): Cache key stored in the header, e.g. from
+            ``compute_snapshot_key``.
+    Returns:
+        Path: The written file.
+    """
+    mapped_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=mapped_path.parent, prefix=mapped_path.name, suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAPPED_MAGIC)
+            categories: Dict[str, Dict[str, Any]] = {}
+            category_offsets: Dict[str, List[int]] = {}
+            for category in CATEGORY_NAMES:
+                entities = getattr(kb, category)
+                offsets = [f.tell()]
+                for entity in entities.values():
+                    f.write(to_json(entity.model_dump()))
+                    offsets.append(f.tell())
+                category_offsets[category] = offsets
+                categories[category] = {"names": list(entities)}
+            for category in CATEGORY_NAMES:
+                categories[category]["offsets"] = f.tell()
+                offsets = category_offsets[category]
+                # native byte order, read back through memoryview.cast("q")
+                f.write(struct.pack(f"={len(offsets)}q", *offsets))
+            header = {
+                "format_version": MAPPED_FORMAT_VERSION,
+                "key": key,
+                "knowledge_base": kb.model_dump(exclude=set(CATEGORY_NAMES)),
+                "categories": categories,
+            }
+            header_offset = f.tell()
+            header_bytes = to_json(header)
+            f.write(header_bytes)
+            f.write(_TRAILER.pack(header_offset, len(header_bytes), MAPPED_MAGIC))
+        os.replace(tmp_name, mapped_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return mapped_path
+
+
+def _read_header(buffer: mmap.mmap) -> Optional[Dict[str, Any]]:
+    if len(buffer) < len(MAPPED_MAGIC) + _TRAILER.size:
+        return None
+    if buffer[: len(MAPPED_MAGIC)] != MAPPED_MAGIC:
+        return None
+    header_offset, header_length, magic = _TRAILER.unpack_from(
+        buffer, len(buffer) - _TRAILER.size
+    )
+    if magic != MAPPED_MAGIC:
+        return None
+    header = from_json(buffer[header_offset : header_offset + header_length])
+    return header if isinstance(header, dict) else None
+
+
+def open_mapped_knowledge_base(
+    mapped_path: Path, key: Optional[str] = None
+) -> Optional[KnowledgeBase]:
+    """Map a file written by ``write_mapped_knowledge_base`` read-only.
+
+    All processes mapping the same file share its pages; each process only
+    holds the entity names and the entities it has read. The categories are
+    read-only ``MappedEntityDict`` instances, so entities cannot be added.
+
+    Args:
+        mapped_path (Path): The mapped knowledge base file.
+        key (Optional[str]): The expected cache key, not checked if None.
+    Returns:
+        Optional[KnowledgeBase]: The knowledge base, or None if the file is
+        missing, stale or unreadable.
+    """
+    if not mapped_path.is_file():
+        return None
+    try:
+        with mapped_path.open("rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        kb = _map_knowledge_base(buffer, key)
+    except (KeyError, TypeError, ValueError, struct.error):
+        kb = None
+    if kb is None:
+        # the views of a failed attempt died with its frame
+        buffer.close()
+    return kb
+
+
+def _map_knowledge_base(
+    buffer: mmap.mmap, key: Optional[str]
+) -> Optional[KnowledgeBase]:
+    header = _read_header(buffer)
+    if header is None or header.get("format_version") != MAPPED_FORMAT_VERSION:
+        return None
+    if key is not None and header.get("key") != key:
+        return None
+
+    values = dict(header["knowledge_base"])
+    config = values.pop("config", None)
+    if config is not None:
+        values["config"] = KnowledgeBaseConfig.model_validate(config)
+    view = memoryview(buffer)
+    for category, entry in header["categories"].items():
+        names: List[str] = entry["names"]
+        start = entry["offsets"]
+        offsets = view[start : start + (len(names) + 1) * _OFFSET_ITEMSIZE].cast("q")
+        values[category] = MappedEntityDict(
+            view, offsets, names, MODEL_BY_CATEGORY[category]
+        )
+    return KnowledgeBase.model_construct(**values)
@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from lx_dtypes.models.knowledge_base.knowledge_base import KnowledgeBase
+
+# (module name, combined fingerprint of the module config and data files)
+ModuleCacheKey = Tuple[str, str]
+
+
+class ModuleCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    maxsize: Optional[int] = None
+
+
+class ModuleCache:
+    """LRU cache of module knowledge bases.
+
+    Entries are keyed by module name and the fingerprint of the module's input
+    files, so a changed file simply misses and the outdated entry ages out.
+
+    Args:
+        maxsize (Optional[int]): Maximum number of cached modules, unbounded if None.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[ModuleCacheKey, KnowledgeBase]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: ModuleCacheKey) -> Optional["KnowledgeBase"]:
+        with self._lock:
+            kb = self._entries.get(key)
+            if kb is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return kb
+
+    def put(self, key: ModuleCacheKey, kb: "KnowledgeBase") -> None:
+        with self._lock:
+            # older builds of the same module can never be hit again
+            for stale_key in [k for k in self._entries if k[0] == key[0]]:
+                if stale_key != key:
+                    del self._entries[stale_key]
+                    self._evictions += 1
+            self._entries[key] = kb
+            self._entries.move_to_end(key)
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> ModuleCacheStats:
+        with self._lock:
+            return ModuleCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
@@ -0,0 +1,44 @@
+from typing import Dict
+
+# category -> reference field -> category the referenced names live in.
+# ClassificationChoiceShallow.classification_choice_descriptor_names and
+# InformationSourceShallow.types point to models that are not knowledge base
+# categories and are therefore not listed.
+REFERENCE_FIELDS: Dict[str, Dict[str, str]] = {
+    "findings": {
+        "classification_names": "classifications",
+        "type_names": "finding_types",
+        "intervention_names": "interventions",
+    },
+    "classifications": {
+        "choice_names": "classification_choices",
+        "type_names": "classification_types",
+    },
+    "classification_choices": {
+        "type_names": "classification_types",
+    },
+    "examinations": {
+        "finding_names": "findings",
+        "type_names": "examination_types",
+        "indication_names": "indications",
+    },
+    "indications": {
+        "type_names": "indication_types",
+        "expected_intervention_names": "interventions",
+    },
+    "interventions": {
+        "expected_intervention_names": "interventions",
+        "causes_finding_names": "findings",
+        "type_names": "intervention_types",
+    },
+    "units": {
+        "type_names": "unit_types",
+    },
+}
+
+# categories that are the target of at least one reference field
+REFERENCED_CATEGORIES = tuple(
+    dict.fromkeys(
+        target for fields in REFERENCE_FIELDS.values() for target in fields.values()
+    )
+)
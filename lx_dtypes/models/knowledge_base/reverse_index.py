@@ -0,0 +1,45 @@
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+from pydantic import BaseModel
+
+
+class ReverseIndex:
+    """Target name -> names of the entities referencing it through one field.
+
+    Args:
+        field (str): The ``*_names`` field of the referencing category.
+    """
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        # dicts keep insertion order and allow O(1) removal
+        self._entries: Dict[str, Dict[str, None]] = {}
+
+    @classmethod
+    def build(cls, entities: Mapping[str, BaseModel], field: str) -> "ReverseIndex":
+        index = cls(field)
+        for name, entity in entities.items():
+            index.add(name, entity)
+        return index
+
+    def add(self, name: str, entity: BaseModel) -> None:
+        for target_name in getattr(entity, self.field):
+            self._entries.setdefault(target_name, {})[name] = None
+
+    def remove(self, name: str, entity: BaseModel) -> None:
+        for target_name in getattr(entity, self.field):
+            referencing = self._entries.get(target_name)
+            if referencing is None:
+                continue
+            referencing.pop(name, None)
+            if not referencing:
+                del self._entries[target_name]
+
+    def get(self, target_name: str) -> List[str]:
+        return list(self._entries.get(target_name, ()))
+
+    def items(self) -> Iterable[Tuple[str, List[str]]]:
+        return ((target, list(names)) for target, names in self._entries.items())
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,319 @@
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from lx_dtypes.models.knowledge_base.knowledge_base import CATEGORY_NAMES, KnowledgeBase
+from lx_dtypes.models.knowledge_base.symbols import SymbolTable
+
+SearchMatch = Literal["prefix", "substring", "fuzzy"]
+
+LABEL_FIELDS: Tuple[str, ...] = ("name", "name_de", "name_en")
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+# prefix entry kinds, lower kinds rank first
+_EXACT_LABEL, _LABEL_PREFIX, _TOKEN_PREFIX = 0, 1, 2
+_PREFIX_SCORES = (1.0, 0.9, 0.8)
+
+
+class SearchHit(NamedTuple):
+    category: str
+    name: str
+    score: float
+    match: SearchMatch
+
+
+def normalize_search_text(text: str) -> str:
+    """Normalize a label or query for matching.
+
+    Case and accents are dropped (``"Läsion"`` -> ``"lasion"``, ``"ß"`` ->
+    ``"ss"``) and underscores and punctuation become single spaces, so
+    ``"colon_polyp"`` and ``"Colon Polyp"`` normalize to the same text.
+    """
+    folded = text.casefold()
+    if not folded.isascii():
+        decomposed = unicodedata.normalize("NFKD", folded)
+        folded = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _SEPARATORS.sub(" ", folded).strip()
+
+
+def get_trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _add_postings(
+    postings: Dict[str, "array[int]"], trigrams: Iterable[str], doc_id: int
+) -> None:
+    for trigram in trigrams:
+        doc_ids = postings.get(trigram)
+        if doc_ids is None:
+            doc_ids = postings[trigram] = array("i")
+        doc_ids.append(doc_id)
+
+
+class SearchIndex:
+    """Prefix and trigram index over the names, translations and descriptions.
+
+    Every entity is a document whose id is its symbol table id offset by the
+    size of the preceding categories. Prefix completion bisects a sorted array of
+    normalized labels and label tokens; substring matches use trigram posting
+    lists over the labels and the description, fuzzy matches over the labels only.
+
+    Args:
+        symbol_table (SymbolTable): The symbol table providing the entity ids.
+        knowledge_base (KnowledgeBase): The knowledge base the table was built
+            from; lazily loaded entities are materialized once.
+    """
+
+    def __init__(
+        self, symbol_table: SymbolTable, knowledge_base: KnowledgeBase
+    ) -> None:
+        self.symbol_table = symbol_table
+        self._category_offsets: Dict[str, int] = {}
+        self._doc_categories: List[str] = []
+        self._doc_names: List[str] = []
+        # normalized labels and description of each document, one per line
+        self._texts: List[str] = []
+        self._trigrams: Dict[str, "array[int]"] = {}
+        self._label_trigrams: Dict[str, "array[int]"] = {}
+        self._label_trigram_counts = array("i")
+
+        prefix_entries: List[Tuple[str, int, int]] = []
+        for category in CATEGORY_NAMES:
+            entities = getattr(knowledge_base, category)
+            self._category_offsets[category] = len(self._doc_names)
+            for name in symbol_table.categories[category].names:
+                doc_id = len(self._doc_names)
+                entity = entities[name]
+                labels = list(
+                    dict.fromkeys(
+                        normalize_search_text(value)
+                        for value in (getattr(entity, f) for f in LABEL_FIELDS)
+                        if value
+                    )
+                )
+                for label in labels:
+                    prefix_entries.append((label, doc_id, _LABEL_PREFIX))
+                    for token in label.split()[1:]:
+                        prefix_entries.append((token, doc_id, _TOKEN_PREFIX))
+
+                label_trigrams: Set[str] = set()
+                for label in labels:
+                    label_trigrams |= get_trigrams(f" {label} ")
+                _add_postings(self._label_trigrams, label_trigrams, doc_id)
+                self._label_trigram_counts.append(len(label_trigrams))
+
+                description = entity.description
+                parts = labels + (
+                    [normalize_search_text(description)] if description else []
+                )
+                text_trigrams = label_trigrams.union(
+                    *(get_trigrams(f" {part} ") for part in parts[len(labels) :])
+                )
+                _add_postings(self._trigrams, text_trigrams, doc_id)
+
+                self._doc_categories.append(category)
+                self._doc_names.append(name)
+                self._texts.append("\n".join(parts))
+
+        prefix_entries.sort()
+        self._prefix_keys = [key for key, _, _ in prefix_entries]
+        self._prefix_docs = array("i", (doc_id for _, doc_id, _ in prefix_entries))
+        self._prefix_kinds = array("b", (kind for _, _, kind in prefix_entries))
+
+    def __len__(self) -> int:
+        return len(self._doc_names)
+
+    def _get_filter(
+        self,
+        categories: Optional[Iterable[str]],
+        tags: Optional[Iterable[str]],
+        knowledge_base: Optional[KnowledgeBase],
+    ) -> Optional[Callable[[int], bool]]:
+        """Return a document id predicate for a category and tag restriction."""
+        if categories is None and not tags:
+            return None
+        allowed = set(CATEGORY_NAMES if categories is None else categories)
+        bitmaps: Dict[str, int] = {}
+        tag_list = list(tags or ())
+        if tag_list:
+            from lx_dtypes.models.knowledge_base.tag_index import TAGGED_CATEGORIES
+
+            if knowledge_base is None:
+                raise ValueError("A knowledge base is required to filter by tags.")
+            tag_index = knowledge_base.get_tag_index()
+            allowed &= set(TAGGED_CATEGORIES)
+            bitmaps = {
+                category: tag_index.evaluate(category, all_of=tag_list)
+                for category in allowed
+            }
+
+        doc_categories = self._doc_categories
+        offsets = self._category_offsets
+
+        def accept(doc_id: int) -> bool:
+            category = doc_categories[doc_id]
+            if category not in allowed:
+                return False
+            if not tag_list:
+                return True
+            return bool(bitmaps[category] >> (doc_id - offsets[category]) & 1)
+
+        return accept
+
+    def _to_hits(
+        self, scored: Dict[int, float], match: SearchMatch, limit: int
+    ) -> List[SearchHit]:
+        ranked = sorted(scored.items(), key=lambda item: (-item[1], item[0]))
+        return [
+            SearchHit(
+                self._doc_categories[doc_id], self._doc_names[doc_id], score, match
+            )
+            for doc_id, score in ranked[:limit]
+        ]
+
+    def complete(
+        self,
+        prefix: str,
+        limit: int = 10,
+        accept: Optional[Callable[[int], bool]] = None,
+    ) -> List[SearchHit]:
+        """Return the documents with a label or label token starting with ``prefix``.
+
+        Exact label matches rank first, then label prefixes, then token prefixes.
+        """
+        query = normalize_search_text(prefix)
+        if not query:
+            return []
+        keys = self._prefix_keys
+        scored: Dict[int, float] = {}
+        position = bisect_left(keys, query)
+        while position < len(keys) and keys[position].startswith(query):
+            doc_id = self._prefix_docs[position]
+            kind = self._prefix_kinds[position]
+            position += 1
+            if kind == _LABEL_PREFIX and keys[position - 1] == query:
+                kind = _EXACT_LABEL
+            score = _PREFIX_SCORES[kind]
+            if scored.get(doc_id, 0.0) >= score:
+                continue
+            if accept is None or accept(doc_id):
+                scored[doc_id] = score
+        return self._to_hits(scored, "prefix", limit)
+
+    def find_substring(
+        self,
+        text: str,
+        limit: int = 10,
+        accept: Optional[Callable[[int], bool]] = None,
+    ) -> List[SearchHit]:
+        """Return the documents whose labels or description contain ``text``.
+
+        The score is the share of the shortest matching line covered by the query.
+        """
+        query = normalize_search_text(text)
+        if not query:
+            return []
+        candidates: Iterable[int]
+        trigrams = get_trigrams(query)
+        if trigrams:
+            postings = sorted(
+                (self._trigrams.get(trigram, array("i")) for trigram in trigrams),
+                key=len,
+            )
+            matching = set(postings[0])
+            for posting in postings[1:]:
+                if not matching:
+                    break
+                matching.intersection_update(posting)
+            candidates = matching
+        else:
+            candidates = range(len(self._texts))
+
+        scored: Dict[int, float] = {}
+        for doc_id in candidates:
+            if accept is not None and not accept(doc_id):
+                continue
+            lengths = [
+                len(line) for line in self._texts[doc_id].split("\n") if query in line
+            ]
+            if lengths:
+                scored[doc_id] = len(query) / min(lengths)
+        return self._to_hits(scored, "substring", limit)
+
+    def find_similar(
+        self,
+        text: str,
+        limit: int = 10,
+        min_score: float = 0.5,
+        accept: Optional[Callable[[int], bool]] = None,
+    ) -> List[SearchHit]:
+        """Return the documents whose labels share most trigrams with ``text``.
+
+        The score is the Dice coefficient of the query trigrams and the label
+        trigrams of the document, so misspelled queries still match.
+        """
+        query = normalize_search_text(text)
+        trigrams = get_trigrams(f" {query} ")
+        if not query or not trigrams:
+            return []
+        shared: Counter[int] = Counter()
+        for trigram in trigrams:
+            shared.update(self._label_trigrams.get(trigram, ()))
+        counts = self._label_trigram_counts
+        scored: Dict[int, float] = {}
+        for doc_id, count in shared.items():
+            score = 2 * count / (len(trigrams) + counts[doc_id])
+            if score >= min_score and (accept is None or accept(doc_id)):
+                scored[doc_id] = score
+        return self._to_hits(scored, "fuzzy", limit)
+
+    def search(
+        self,
+        text: str,
+        limit: int = 10,
+        categories: Optional[Iterable[str]] = None,
+        tags: Optional[Iterable[str]] = None,
+        knowledge_base: Optional[KnowledgeBase] = None,
+        fuzzy: bool = True,
+    ) -> List[SearchHit]:
+        """Search prefix matches first, then substring and fuzzy matches.
+
+        Args:
+            text (str): The query, e.g. a partially typed German or English label.
+            limit (int): The maximum number of hits.
+            categories (Optional[Iterable[str]]): Restrict the hits to categories.
+            tags (Optional[Iterable[str]]): Restrict the hits to entities carrying
+                all of these tags.
+            knowledge_base (Optional[KnowledgeBase]): The indexed knowledge base,
+                required for tag restrictions.
+            fuzzy (bool): Fill remaining slots with fuzzy matches.
+        Returns:
+            List[SearchHit]: The hits, each document at most once.
+        """
+        accept = self._get_filter(categories, tags, knowledge_base)
+        hits = self.complete(text, limit, accept)
+        stages: List[Callable[[], List[SearchHit]]] = [
+            lambda: self.find_substring(text, limit, accept)
+        ]
+        if fuzzy:
+            stages.append(lambda: self.find_similar(text, limit, accept=accept))
+        for stage in stages:
+            if len(hits) >= limit:
+                break
+            seen = {(hit.category, hit.name) for hit in hits}
+            hits.extend(hit for hit in stage() if (hit.category, hit.name) not in seen)
+        return hits[:limit]
@@ -0,0 +1,112 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from lx_dtypes import __version__
+from lx_dtypes.models.knowledge_base.knowledge_base import KnowledgeBase
+from lx_dtypes.utils.fingerprint import combine_fingerprints, fingerprint_files
+
+# Bump whenever the pickled layout of KnowledgeBase changes incompatibly.
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_SUFFIX = ".kb.pickle"
+
+
+def compute_snapshot_key(
+    input_files: Iterable[Path], hash_content: bool = False, mode: str = ""
+) -> str:
+    """Compute the cache key of a knowledge base snapshot.
+
+    The key covers the fingerprint of every input file, the build mode as well
+    as the snapshot format and package version, so snapshots written by an older
+    build or by a loader building differently are never reused.
+
+    Args:
+        input_files (Iterable[Path]): All config and data files of the knowledge base.
+        hash_content (bool): Whether to include content hashes in the fingerprint.
+        mode (str): The build mode, e.g. from ``DataLoader.get_build_mode``.
+
+    Returns:
+        str: The sha256 hex digest identifying the inputs.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{SNAPSHOT_FORMAT_VERSION}:{__version__}\n".encode("utf-8"))
+    digest.update(f"{mode}\n".encode("utf-8"))
+    fingerprints = fingerprint_files(input_files, hash_content=hash_content)
+    digest.update(combine_fingerprints(fingerprints).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_snapshot_path(snapshot_dir: Path, module_name: str) -> Path:
+    return snapshot_dir / f"{module_name}{SNAPSHOT_SUFFIX}"
+
+
+def write_knowledge_base_snapshot(
+    kb: KnowledgeBase, snapshot_path: Path, snapshot_key: str
+) -> None:
+    """Write a fully built knowledge base to a binary snapshot file.
+
+    The file is written to a temporary sibling first and then moved into place,
+    so concurrent readers never observe a partially written snapshot.
+
+    Args:
+        kb (KnowledgeBase): The knowledge base to persist.
+        snapshot_path (Path): The target snapshot file.
+        snapshot_key (str): The cache key computed by ``compute_snapshot_key``.
+    """
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    payload: Dict[str, Any] = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "key": snapshot_key,
+        "knowledge_base": kb,
+    }
+    fd, tmp_name = tempfile.mkstemp(
+        dir=snapshot_path.parent, prefix=snapshot_path.name, suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, snapshot_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def read_knowledge_base_snapshot(
+    snapshot_path: Path, snapshot_key: str
+) -> Optional[KnowledgeBase]:
+    """Load a snapshot file if it matches the expected key.
+
+    Snapshots are trusted local cache files; they are unpickled without any YAML
+    parsing or pydantic validation.
+
+    Args:
+        snapshot_path (Path): The snapshot file to read.
+        snapshot_key (str): The expected cache key.
+
+    Returns:
+        Optional[KnowledgeBase]: The cached knowledge base, or None if the
+        snapshot is missing, stale or unreadable.
+    """
+    if not snapshot_path.is_file():
+        return None
+
+    try:
+        with snapshot_path.open("rb") as f:
+            payload = pickle.load(f)
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError, AttributeError):
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        return None
+    if payload.get("key") != snapshot_key:
+        return None
+
+    kb = payload.get("knowledge_base")
+    if not isinstance(kb, KnowledgeBase):
+        return None
+    return kb
@@ -0,0 +1,189 @@
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from lx_dtypes.models.knowledge_base.references import REFERENCE_FIELDS
+
+if TYPE_CHECKING:
+    from lx_dtypes.models.knowledge_base.knowledge_base import KnowledgeBase
+
+# id stored for a reference whose target name is not defined
+MISSING_ID = -1
+
+
+class CategorySymbols:
+    """Dense integer ids for the entity names of one category.
+
+    Ids follow the iteration order of the category, starting at 0.
+    """
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self.names: List[str] = list(names)
+        self.ids: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.ids
+
+
+class SymbolRelation:
+    """Id lists of one reference field in compressed sparse row layout.
+
+    The target ids of source id ``i`` are ``targets[offsets[i]:offsets[i + 1]]``
+    in the order of the reference field; undefined targets are ``MISSING_ID``.
+    """
+
+    def __init__(self, offsets: "array[int]", targets: "array[int]") -> None:
+        self.offsets = offsets
+        self.targets = targets
+        # targets with every row sorted, for bisect in ``contains``
+        self._sorted_targets: Optional["array[int]"] = None
+
+    @classmethod
+    def build(
+        cls,
+        entities: Mapping[str, object],
+        field: str,
+        sources: CategorySymbols,
+        targets: CategorySymbols,
+    ) -> "SymbolRelation":
+        offsets = array("i", [0])
+        target_ids = array("i")
+        target_lookup = targets.ids
+        for name in sources.names:
+            target_ids.extend(
+                target_lookup.get(target_name, MISSING_ID)
+                for target_name in getattr(entities[name], field)
+            )
+            offsets.append(len(target_ids))
+        return cls(offsets, target_ids)
+
+    def get(self, source_id: int) -> "array[int]":
+        return self.targets[self.offsets[source_id] : self.offsets[source_id + 1]]
+
+    def get_sorted_targets(self) -> "array[int]":
+        """Return the targets with the ids of every row sorted, built once."""
+        if self._sorted_targets is None:
+            offsets, targets = self.offsets, self.targets
+            sorted_targets = array("i")
+            for source_id in range(len(offsets) - 1):
+                sorted_targets.extend(
+                    sorted(targets[offsets[source_id] : offsets[source_id + 1]])
+                )
+            self._sorted_targets = sorted_targets
+        return self._sorted_targets
+
+    def contains(self, source_id: int, target_id: int) -> bool:
+        """Check a row for a target id by binary search over its sorted slice."""
+        start, stop = self.offsets[source_id], self.offsets[source_id + 1]
+        sorted_targets = self.get_sorted_targets()
+        position = bisect_left(sorted_targets, target_id, start, stop)
+        return position < stop and sorted_targets[position] == target_id
+
+
+class SymbolTable:
+    """Integer symbol table of a knowledge base.
+
+    Names are mapped to dense ids per category on construction; the id arrays of
+    the reference fields listed in ``REFERENCE_FIELDS`` are built on first use.
+    The table is a snapshot: ``KnowledgeBase.get_symbol_table`` builds a new one
+    after the knowledge base changed.
+
+    The tag index, the search index and the content tree address entities by
+    these ids. The relation arrays (``get_relation``, ``has_relation``, ...) are
+    a standalone query API; the knowledge base's own reference checks read the
+    entities, since a cached table misses direct edits of category dicts.
+
+    Args:
+        knowledge_base (KnowledgeBase): The knowledge base to index. Lazy
+            categories are only materialized for the relations that are used.
+    """
+
+    def __init__(self, knowledge_base: "KnowledgeBase") -> None:
+        from lx_dtypes.models.knowledge_base.knowledge_base import CATEGORY_NAMES
+
+        self._knowledge_base = knowledge_base
+        self.categories: Dict[str, CategorySymbols] = {
+            category: CategorySymbols(getattr(knowledge_base, category))
+            for category in CATEGORY_NAMES
+        }
+        self._relations: Dict[Tuple[str, str], SymbolRelation] = {}
+
+    def get_id(self, category: str, name: str) -> int:
+        """Return the id of a name, raising KeyError if it is not defined."""
+        return self.categories[category].ids[name]
+
+    def get_name(self, category: str, entity_id: int) -> str:
+        return self.categories[category].names[entity_id]
+
+    def get_ids(self, category: str, names: Iterable[str]) -> "array[int]":
+        """Translate names to ids; undefined names become ``MISSING_ID``."""
+        ids = self.categories[category].ids
+        return array("i", (ids.get(name, MISSING_ID) for name in names))
+
+    def get_names(self, category: str, entity_ids: Iterable[int]) -> List[str]:
+        names = self.categories[category].names
+        return [names[entity_id] for entity_id in entity_ids]
+
+    def get_relation(self, category: str, field: str) -> SymbolRelation:
+        """Return the id arrays of a reference field, building them if needed.
+
+        Args:
+            category (str): The referencing category, e.g. "classifications".
+            field (str): The reference field, e.g. "choice_names".
+        Returns:
+            SymbolRelation: The target ids per source id.
+        """
+        relation = self._relations.get((category, field))
+        if relation is None:
+            target_category = REFERENCE_FIELDS.get(category, {}).get(field)
+            if target_category is None:
+                raise KeyError(f"'{category}.{field}' is not a reference field.")
+            relation = SymbolRelation.build(
+                getattr(self._knowledge_base, category),
+                field,
+                self.categories[category],
+                self.categories[target_category],
+            )
+            self._relations[(category, field)] = relation
+        return relation
+
+    def get_related_ids(self, category: str, field: str, name: str) -> "array[int]":
+        """Return the target ids referenced by one entity."""
+        return self.get_relation(category, field).get(self.get_id(category, name))
+
+    def get_related_names(self, category: str, field: str, name: str) -> List[str]:
+        """Return the defined target names referenced by one entity."""
+        target_category = REFERENCE_FIELDS[category][field]
+        return self.get_names(
+            target_category,
+            (
+                target_id
+                for target_id in self.get_related_ids(category, field, name)
+                if target_id != MISSING_ID
+            ),
+        )
+
+    def has_relation(
+        self, category: str, field: str, name: str, target_name: str
+    ) -> bool:
+        """Check whether an entity references a defined target name.
+
+        Args:
+            category (str): The referencing category, e.g. "classifications".
+            field (str): The reference field, e.g. "choice_names".
+            name (str): The referencing entity name.
+            target_name (str): The referenced name.
+        Returns:
+            bool: False if either name is not defined.
+        """
+        relation = self.get_relation(category, field)
+        source_id = self.categories[category].ids.get(name)
+        target_id = self.categories[REFERENCE_FIELDS[category][field]].ids.get(
+            target_name
+        )
+        if source_id is None or target_id is None:
+            return False
+        return relation.contains(source_id, target_id)
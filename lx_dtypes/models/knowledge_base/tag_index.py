@@ -0,0 +1,153 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from lx_dtypes.models.knowledge_base.knowledge_base import (
+    CATEGORY_BY_TYPE,
+    KnowledgeBase,
+)
+from lx_dtypes.models.knowledge_base.symbols import SymbolTable
+
+# categories whose entities carry a ``tags`` list (TaggedMixin)
+TAGGED_CATEGORIES: Tuple[str, ...] = tuple(
+    category
+    for model_type, category in CATEGORY_BY_TYPE.items()
+    if "tags" in model_type.model_fields
+)
+
+
+def iter_bitmap_ids(bitmap: int) -> Iterator[int]:
+    """Yield the positions of the set bits of a bitmap in ascending order."""
+    while bitmap:
+        lowest = bitmap & -bitmap
+        yield lowest.bit_length() - 1
+        bitmap ^= lowest
+
+
+def build_bitmap(ids: Iterable[int], size: int) -> int:
+    """Return the bitmap with the bits of ``ids`` set, ids below ``size``.
+
+    The bits are set in a bytearray and converted once; or-ing ``1 << id`` into
+    a growing int would copy the int for every id.
+    """
+    buffer = bytearray((size + 7) // 8)
+    for entity_id in ids:
+        buffer[entity_id >> 3] |= 1 << (entity_id & 7)
+    return int.from_bytes(buffer, "little")
+
+
+class TagIndex:
+    """Knowledge base wide tag vocabulary with one bitmap per category and tag.
+
+    Bit ``i`` of a bitmap is set if the entity with symbol table id ``i`` carries
+    the tag. Queries combine bitmaps with integer operations and translate the
+    result through the symbol table, so they do not access the entities.
+
+    Args:
+        symbol_table (SymbolTable): The symbol table providing the entity ids.
+        knowledge_base (KnowledgeBase): The knowledge base the table was built
+            from; the tags of all entities are read once.
+    """
+
+    def __init__(self, symbol_table: SymbolTable, knowledge_base: KnowledgeBase):
+        self.symbol_table = symbol_table
+        # tag -> tag id, in order of first occurrence
+        self.vocabulary: Dict[str, int] = {}
+        self._bitmaps: Dict[str, Dict[str, int]] = {}
+        self._universes: Dict[str, int] = {}
+
+        for category in TAGGED_CATEGORIES:
+            entities = getattr(knowledge_base, category)
+            names = symbol_table.categories[category].names
+            tag_ids: Dict[str, List[int]] = {}
+            for entity_id, name in enumerate(names):
+                for tag in entities[name].tags:
+                    self.vocabulary.setdefault(tag, len(self.vocabulary))
+                    tag_ids.setdefault(tag, []).append(entity_id)
+            self._bitmaps[category] = {
+                tag: build_bitmap(entity_ids, len(names))
+                for tag, entity_ids in tag_ids.items()
+            }
+            self._universes[category] = (1 << len(names)) - 1
+
+    @property
+    def tags(self) -> List[str]:
+        return list(self.vocabulary)
+
+    def get_bitmap(self, category: str, tag: str) -> int:
+        """Return the bitmap of the entities of a category carrying a tag.
+
+        Raises KeyError for categories without tags.
+        """
+        return self._bitmaps[category].get(tag, 0)
+
+    def get_universe(self, category: str) -> int:
+        """Return the bitmap with one bit set for every entity of a category."""
+        return self._universes[category]
+
+    def get_tag_counts(self, category: str) -> Dict[str, int]:
+        return {
+            tag: bitmap.bit_count() for tag, bitmap in self._bitmaps[category].items()
+        }
+
+    def evaluate(
+        self,
+        category: str,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+    ) -> int:
+        """Evaluate a tag query for one category.
+
+        Args:
+            category (str): A category listed in TAGGED_CATEGORIES.
+            all_of (Iterable[str]): Tags that must all be present (AND).
+            any_of (Iterable[str]): Tags of which at least one must be present
+                (OR); ignored if empty.
+            none_of (Iterable[str]): Tags that must not be present (NOT).
+        Returns:
+            int: The bitmap of the matching entity ids.
+        """
+        bitmaps = self._bitmaps[category]
+        result = self._universes[category]
+        for tag in all_of:
+            result &= bitmaps.get(tag, 0)
+        any_tags = list(any_of)
+        if any_tags:
+            matches_any = 0
+            for tag in any_tags:
+                matches_any |= bitmaps.get(tag, 0)
+            result &= matches_any
+        for tag in none_of:
+            result &= ~bitmaps.get(tag, 0)
+        return result
+
+    def get_names(self, category: str, bitmap: int) -> List[str]:
+        """Translate a bitmap of a category to entity names in id order."""
+        return self.symbol_table.get_names(category, iter_bitmap_ids(bitmap))
+
+    def query(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+        categories: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[str]]:
+        """Return the names of the entities matching a tag query.
+
+        Args:
+            all_of (Iterable[str]): Tags that must all be present (AND).
+            any_of (Iterable[str]): Tags of which at least one must be present
+                (OR); ignored if empty.
+            none_of (Iterable[str]): Tags that must not be present (NOT).
+            categories (Optional[Iterable[str]]): The categories to query,
+                defaults to all tagged categories.
+        Returns:
+            Dict[str, List[str]]: Category -> matching names, for every queried
+            category with at least one match.
+        """
+        all_tags, any_tags, no_tags = list(all_of), list(any_of), list(none_of)
+        results: Dict[str, List[str]] = {}
+        for category in categories or TAGGED_CATEGORIES:
+            bitmap = self.evaluate(category, all_tags, any_tags, no_tags)
+            if bitmap:
+                results[category] = self.get_names(category, bitmap)
+        return results
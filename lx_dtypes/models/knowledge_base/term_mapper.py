@@ -0,0 +1,237 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+from sklearn.feature_extraction.text import (  # type: ignore[import-untyped]
+    TfidfVectorizer,
+)
+
+from lx_dtypes.models.knowledge_base.knowledge_base import KnowledgeBase
+from lx_dtypes.models.knowledge_base.search import (
+    LABEL_FIELDS,
+    normalize_search_text,
+)
+
+DEFAULT_MAPPING_CATEGORIES: Tuple[str, ...] = (
+    "findings",
+    "classification_choices",
+    "indications",
+)
+
+
+class TermCandidate(NamedTuple):
+    category: str
+    name: str
+    score: float
+
+
+class TerminologyMapper:
+    """Batch mapper from free-text phrases to knowledge base entity names.
+
+    The normalized names and translations of the mapped categories are
+    vectorized once as TF-IDF weighted character n-grams. Phrases are mapped in
+    batches with one sparse matrix product; the score of an entity is the best
+    cosine similarity of any of its labels. Candidates are ranked on the non-zero
+    entries of the product only, so memory per batch grows with the number of
+    matching labels, not with the vocabulary size.
+
+    Args:
+        knowledge_base (KnowledgeBase): The knowledge base to map to.
+        categories (Sequence[str]): The categories whose entities are candidates.
+        ngram_range (Tuple[int, int]): Character n-gram sizes, within word
+            boundaries.
+    """
+
+    def __init__(
+        self,
+        knowledge_base: KnowledgeBase,
+        categories: Sequence[str] = DEFAULT_MAPPING_CATEGORIES,
+        ngram_range: Tuple[int, int] = (3, 3),
+    ) -> None:
+        self.entities: List[Tuple[str, str]] = []
+        labels: List[str] = []
+        # label row -> entity id
+        label_entities: List[int] = []
+        for category in categories:
+            for name, entity in getattr(knowledge_base, category).items():
+                entity_labels = dict.fromkeys(
+                    normalize_search_text(value)
+                    for value in (getattr(entity, f) for f in LABEL_FIELDS)
+                    if value
+                )
+                entity_labels.pop("", None)
+                if not entity_labels:
+                    continue
+                label_entities.extend([len(self.entities)] * len(entity_labels))
+                labels.extend(entity_labels)
+                self.entities.append((category, name))
+
+        self.labels = labels
+        self._label_entities = np.asarray(label_entities, dtype=np.intp)
+        self._vectorizer = TfidfVectorizer(
+            analyzer="char_wb",
+            ngram_range=ngram_range,
+            sublinear_tf=True,
+            dtype=np.float32,
+        )
+        if labels:
+            # transposed once so that each batch is a single CSR @ CSC product
+            self._label_matrix = self._vectorizer.fit_transform(labels).T.tocsc()
+
+    def map_batch(
+        self, phrases: Sequence[str], top_k: int = 3, min_score: float = 0.3
+    ) -> List[List[TermCandidate]]:
+        """Map a batch of phrases.
+
+        Args:
+            phrases (Sequence[str]): The free-text phrases.
+            top_k (int): The maximum number of candidates per phrase.
+            min_score (float): The minimum cosine similarity of a candidate.
+        Returns:
+            List[List[TermCandidate]]: The candidates of each phrase, best first.
+        """
+        if not phrases or not self.entities:
+            return [[] for _ in phrases]
+        # report phrases repeat a lot, each distinct phrase is scored once
+        normalized = [normalize_search_text(phrase) for phrase in phrases]
+        unique = list(dict.fromkeys(normalized))
+        queries = self._vectorizer.transform(unique)
+        label_scores = (queries @ self._label_matrix).tocsr()
+
+        # (query, entity, score) of every label match above min_score
+        query_ids = np.repeat(
+            np.arange(len(unique), dtype=np.intp), np.diff(label_scores.indptr)
+        )
+        keep = (label_scores.data >= min_score) & (label_scores.data > 0)
+        query_ids = query_ids[keep]
+        entity_ids = self._label_entities[label_scores.indices[keep]]
+        scores = label_scores.data[keep]
+
+        # best first per query, ties by entity id; keep the best label per entity
+        order = np.lexsort((entity_ids, -scores, query_ids))
+        query_ids, entity_ids, scores = (
+            query_ids[order],
+            entity_ids[order],
+            scores[order],
+        )
+        _, first = np.unique(
+            query_ids * len(self.entities) + entity_ids, return_index=True
+        )
+        first.sort()
+        query_ids, entity_ids, scores = (
+            query_ids[first],
+            entity_ids[first],
+            scores[first],
+        )
+        rank = np.arange(len(query_ids)) - np.searchsorted(query_ids, query_ids)
+        top = rank < top_k
+        query_ids, entity_ids, scores = query_ids[top], entity_ids[top], scores[top]
+
+        results: List[List[TermCandidate]] = [[] for _ in unique]
+        for query_id, entity_id, score in zip(
+            query_ids.tolist(), entity_ids.tolist(), scores.tolist()
+        ):
+            category, name = self.entities[entity_id]
+            results[query_id].append(TermCandidate(category, name, round(score, 6)))
+        by_query = dict(zip(unique, results))
+        return [list(by_query[query]) for query in normalized]
+
+    def map_phrases(
+        self,
+        phrases: Iterable[str],
+        top_k: int = 3,
+        min_score: float = 0.3,
+        batch_size: int = 2048,
+        workers: Optional[int] = None,
+    ) -> Iterator[List[TermCandidate]]:
+        """Map a possibly large stream of phrases, optionally in worker processes.
+
+        Results are yielded in the order of ``phrases``. With workers, the
+        mapper is sent to each worker once and at most two batches per worker
+        are in flight, so memory stays bounded for millions of phrases.
+
+        Args:
+            phrases (Iterable[str]): The free-text phrases.
+            top_k (int): The maximum number of candidates per phrase.
+            min_score (float): The minimum cosine similarity of a candidate.
+            batch_size (int): The number of phrases mapped per matrix product.
+            workers (Optional[int]): Number of worker processes, mapped in the
+                calling process if None or 1.
+
+        Yields:
+            List[TermCandidate]: The candidates of each phrase, best first.
+        """
+        batches = _iter_batches(phrases, batch_size)
+        if workers is None or workers <= 1:
+            for batch in batches:
+                yield from self.map_batch(batch, top_k, min_score)
+            return
+
+        # spawn avoids forking a possibly multi-threaded parent process
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as pool:
+            pending: Deque[Future[List[List[TermCandidate]]]] = deque()
+            for batch in batches:
+                pending.append(pool.submit(_map_in_worker, batch, top_k, min_score))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+def _iter_batches(phrases: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+    iterator = iter(phrases)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+_worker_mapper: Optional[TerminologyMapper] = None
+
+
+def _init_worker(mapper: TerminologyMapper) -> None:
+    global _worker_mapper
+    _worker_mapper = mapper
+
+
+def _map_in_worker(
+    phrases: List[str], top_k: int, min_score: float
+) -> List[List[TermCandidate]]:
+    assert _worker_mapper is not None
+    return _worker_mapper.map_batch(phrases, top_k, min_score)
+
+
+def map_terms(
+    knowledge_base: KnowledgeBase,
+    phrases: Iterable[str],
+    categories: Sequence[str] = DEFAULT_MAPPING_CATEGORIES,
+    **kwargs: Any,
+) -> List[List[TermCandidate]]:
+    """Map phrases to entity names of a knowledge base.
+
+    Args:
+        knowledge_base (KnowledgeBase): The knowledge base to map to.
+        phrases (Iterable[str]): The free-text phrases.
+        categories (Sequence[str]): The categories whose entities are candidates.
+        **kwargs: Passed to ``TerminologyMapper.map_phrases``.
+    Returns:
+        List[List[TermCandidate]]: The candidates of each phrase, best first.
+    """
+    mapper = TerminologyMapper(knowledge_base, categories)
+    return list(mapper.map_phrases(phrases, **kwargs))
@@ -0,0 +1,241 @@
+import hashlib
+import hmac
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import from_json
+
+from lx_dtypes import __version__
+from lx_dtypes.models.knowledge_base.knowledge_base import KnowledgeBase
+from lx_dtypes.utils.file_loader import get_json_sidecar, parse_yaml, write_json_sidecar
+
+# Bump whenever the digest input or the dump layout changes.
+TRUST_FORMAT_VERSION = 1
+TRUST_KEY_ENV_VAR = "LX_DTYPES_TRUST_KEY"
+STAMP_SUFFIX = ".stamp.json"
+
+TrustAlgorithm = Literal["hmac-sha256", "sha256"]
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class TrustStamp(BaseModel):
+    """Signature of a validated knowledge base dump and its JSON sidecar."""
+
+    format_version: int = TRUST_FORMAT_VERSION
+    package_version: str = __version__
+    algorithm: TrustAlgorithm
+    # file name -> digest of the file content
+    digests: Dict[str, str]
+
+
+def get_trust_key(key: Optional[bytes] = None) -> Optional[bytes]:
+    """Return ``key`` or the key from the LX_DTYPES_TRUST_KEY environment variable."""
+    if key is not None:
+        return key
+    env_key = os.environ.get(TRUST_KEY_ENV_VAR)
+    return env_key.encode("utf-8") if env_key else None
+
+
+def get_stamp_path(yaml_path: Path) -> Path:
+    return yaml_path.with_name(f"{yaml_path.stem}{STAMP_SUFFIX}")
+
+
+def compute_trust_digest(content: bytes, key: Optional[bytes] = None) -> str:
+    """Digest a dump file, bound to the trust format and package version.
+
+    Args:
+        content (bytes): The file content.
+        key (Optional[bytes]): Signing key. Without a key a plain sha256 digest
+            is used, which detects modified or foreign files but is not a
+            signature.
+
+    Returns:
+        str: The hex digest.
+    """
+    header = f"{TRUST_FORMAT_VERSION}:{__version__}\n".encode("utf-8")
+    if key is None:
+        return hashlib.sha256(header + content).hexdigest()
+    return hmac.new(key, header + content, hashlib.sha256).hexdigest()
+
+
+def stamp_knowledge_base_dump(
+    yaml_path: Path, key: Optional[bytes] = None
+) -> TrustStamp:
+    """Write the trust stamp of a validated dump next to it.
+
+    The stamp covers the YAML dump and, if present, its JSON sidecar.
+
+    Args:
+        yaml_path (Path): The YAML dump written by ``KnowledgeBase.export_yaml``.
+        key (Optional[bytes]): Signing key, defaults to LX_DTYPES_TRUST_KEY.
+
+    Returns:
+        TrustStamp: The written stamp.
+    """
+    key = get_trust_key(key)
+    digests = {yaml_path.name: compute_trust_digest(yaml_path.read_bytes(), key)}
+    sidecar = get_json_sidecar(yaml_path)
+    if sidecar is not None:
+        digests[sidecar.name] = compute_trust_digest(sidecar.read_bytes(), key)
+
+    stamp = TrustStamp(
+        algorithm="sha256" if key is None else "hmac-sha256", digests=digests
+    )
+    get_stamp_path(yaml_path).write_text(stamp.model_dump_json(), encoding="utf-8")
+    return stamp
+
+
+def export_trusted_knowledge_base(
+    kb: KnowledgeBase,
+    export_dir: Path,
+    filename: str = "knowledge_base",
+    key: Optional[bytes] = None,
+) -> Path:
+    """Export a validated knowledge base as a trusted dump.
+
+    Meant for the CI build: the dump holds the normalized entities (translations
+    filled in, tags sorted), so trusted loads can skip validation.
+
+    Args:
+        kb (KnowledgeBase): The validated knowledge base.
+        export_dir (Path): The directory to export to.
+        filename (str): The file name without suffix.
+        key (Optional[bytes]): Signing key, defaults to LX_DTYPES_TRUST_KEY.
+
+    Returns:
+        Path: The YAML dump; its JSON sidecar and stamp are written next to it.
+    """
+    kb.export_yaml(export_dir, filename=filename)
+    yaml_path = export_dir / f"{filename}.yaml"
+    write_json_sidecar(yaml_path)
+    stamp_knowledge_base_dump(yaml_path, key=key)
+    return yaml_path
+
+
+def read_trusted_dump(
+    yaml_path: Path, key: Optional[bytes] = None
+) -> Optional[Dict[str, Any]]:
+    """Return the data of a dump if its stamp verifies.
+
+    Args:
+        yaml_path (Path): The YAML dump.
+        key (Optional[bytes]): Signing key, defaults to LX_DTYPES_TRUST_KEY.
+            With a key configured only HMAC stamps are accepted.
+
+    Returns:
+        Optional[Dict[str, Any]]: The decoded dump, or None if the stamp is
+        missing, written by another version or does not match the content.
+    """
+    key = get_trust_key(key)
+    try:
+        stamp = TrustStamp.model_validate_json(get_stamp_path(yaml_path).read_bytes())
+    except (OSError, ValueError, ValidationError):
+        return None
+    expected_algorithm = "sha256" if key is None else "hmac-sha256"
+    if (
+        stamp.format_version != TRUST_FORMAT_VERSION
+        or stamp.package_version != __version__
+        or stamp.algorithm != expected_algorithm
+    ):
+        return None
+
+    sidecar = get_json_sidecar(yaml_path)
+    source = sidecar if sidecar is not None and sidecar.name in stamp.digests else None
+    source = source or yaml_path
+    expected_digest = stamp.digests.get(source.name)
+    if expected_digest is None:
+        return None
+    try:
+        content = source.read_bytes()
+    except OSError:
+        return None
+    if not hmac.compare_digest(compute_trust_digest(content, key), expected_digest):
+        return None
+
+    data = from_json(content) if source.suffix == ".json" else parse_yaml(content)
+    if not isinstance(data, dict):
+        return None
+    return data
+
+
+# field name, static default or _REQUIRED, default factory or None
+_FieldDefault = Tuple[str, Any, Optional[Callable[[], Any]]]
+_REQUIRED = object()
+
+
+@lru_cache(maxsize=None)
+def _get_field_defaults(
+    model_type: Type[BaseModel],
+) -> Optional[Tuple[_FieldDefault, ...]]:
+    """Return the defaults of a model's fields in declaration order.
+
+    Returns None for models that ``construct_validated`` cannot handle.
+    """
+    if model_type.__private_attributes__:
+        return None
+    if model_type.model_config.get("extra") == "allow":
+        return None
+    fields: List[_FieldDefault] = []
+    for name, field in model_type.model_fields.items():
+        if field.alias is not None and field.alias != name:
+            return None
+        if field.default_factory is not None:
+            if field.default_factory_takes_validated_data:
+                return None
+            fields.append((name, _REQUIRED, field.default_factory))  # type: ignore[arg-type]
+        elif field.is_required():
+            fields.append((name, _REQUIRED, None))
+        else:
+            fields.append((name, field.default, None))
+    return tuple(fields)
+
+
+def construct_validated(model_type: Type[M], values: Dict[str, Any]) -> M:
+    """Create a model from already validated values without validation.
+
+    Equivalent to ``model_type.model_construct(**values)``, but the defaults are
+    resolved once per model type instead of on every call. Fields are stored in
+    declaration order, so dumps are identical to those of validated models.
+
+    Args:
+        model_type (Type[M]): The model class.
+        values (Dict[str, Any]): Field values, e.g. from a ``model_dump``.
+
+    Returns:
+        M: The constructed model.
+    """
+    fields = _get_field_defaults(model_type)
+    if fields is None:
+        return model_type.model_construct(**values)
+
+    data: Dict[str, Any] = {}
+    fields_set: Set[str] = set()
+    for name, default, factory in fields:
+        if name in values:
+            data[name] = values[name]
+            fields_set.add(name)
+        elif factory is not None:
+            data[name] = factory()
+        elif default is not _REQUIRED:
+            data[name] = default
+    instance = model_type.__new__(model_type)
+    object.__setattr__(instance, "__dict__", data)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
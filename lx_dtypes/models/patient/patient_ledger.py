@@ -1,6 +1,6 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from lx_dtypes.models.patient.patient import Patient
 from lx_dtypes.utils.mixins.base_model import AppBaseModel
@@ -14,6 +14,29 @@ class PatientLedger(AppBaseModel):
     patients: Dict[str, Patient] = Field(default_factory=dict)
     examinations: Dict[str, PatientExamination] = Field(default_factory=dict)
 
+    # patient uuid -> examination uuids (dict as insertion ordered set), built
+    # from ``examinations`` on first use
+    _examinations_by_patient: Optional[Dict[str, Dict[str, None]]] = PrivateAttr(
+        default=None
+    )
+
+    def _get_examination_index(self) -> Dict[str, Dict[str, None]]:
+        index = self._examinations_by_patient
+        if index is None:
+            index = {}
+            for uuid, exam in self.examinations.items():
+                index.setdefault(exam.patient_uuid, {})[uuid] = None
+            self._examinations_by_patient = index
+        return index
+
+    def invalidate_examination_index(self) -> None:
+        """Rebuild the patient -> examinations index on next use.
+
+        Only needed after modifying ``examinations`` directly instead of through
+        ``add_patient_examination`` and ``delete_patient_examination``.
+        """
+        self._examinations_by_patient = None
+
     def add_patient(self, patient: Patient) -> None:
         self.patients[patient.uuid] = patient
 
@@ -32,19 +55,12 @@ class PatientLedger(AppBaseModel):
     def get_examinations_by_patient_uuid(
         self, patient_uuid: str
     ) -> Dict[str, PatientExamination]:
-        examinations = {
-            uuid: exam
-            for uuid, exam in self.examinations.items()
-            if exam.patient_uuid == patient_uuid
-        }
+        examination_uuids = self._get_examination_index().get(patient_uuid, {})
+        examinations = {uuid: self.examinations[uuid] for uuid in examination_uuids}
         return examinations
 
     def get_examination_uuids_by_patient_uuid(self, patient_uuid: str) -> List[str]:
-        examination_uuids = [
-            exam.uuid
-            for exam in self.examinations.values()
-            if exam.patient_uuid == patient_uuid
-        ]
+        examination_uuids = list(self._get_examination_index().get(patient_uuid, {}))
         return examination_uuids
 
     def add_patient_examination(self, examination: PatientExamination) -> None:
@@ -54,7 +70,12 @@ class PatientLedger(AppBaseModel):
                 f"Patient with UUID {patient_uuid} does not exist in the ledger."
             )
 
+        index = self._get_examination_index()
+        previous = self.examinations.get(examination.uuid)
+        if previous is not None and previous.patient_uuid != patient_uuid:
+            self._unindex_examination(previous)
         self.examinations[examination.uuid] = examination
+        index.setdefault(patient_uuid, {})[examination.uuid] = None
 
     def delete_patient_examination(self, examination_uuid: str) -> None:
         if not self._examination_exists(examination_uuid):
@@ -62,7 +83,16 @@ class PatientLedger(AppBaseModel):
                 f"Examination with UUID {examination_uuid} does not exist in the ledger."
             )
 
-        del self.examinations[examination_uuid]
+        self._unindex_examination(self.examinations.pop(examination_uuid))
+
+    def _unindex_examination(self, examination: PatientExamination) -> None:
+        index = self._get_examination_index()
+        examination_uuids = index.get(examination.patient_uuid)
+        if examination_uuids is None:
+            return
+        examination_uuids.pop(examination.uuid, None)
+        if not examination_uuids:
+            del index[examination.patient_uuid]
 
     def delete_patient(self, patient_uuid: str) -> None:
         if not self._patient_exists(patient_uuid):
@@ -70,11 +100,9 @@ class PatientLedger(AppBaseModel):
                 f"Patient with UUID {patient_uuid} does not exist in the ledger."
             )
 
-        examinations_to_delete = self.get_examination_uuids_by_patient_uuid(
-            patient_uuid
-        )
-        for exam_uuid in examinations_to_delete:
-            self.delete_patient_examination(exam_uuid)
+        examination_uuids = self._get_examination_index().pop(patient_uuid, {})
+        for exam_uuid in examination_uuids:
+            del self.examinations[exam_uuid]
 
         self.patients.pop(patient_uuid)
 
@@ -1,4 +1,12 @@
+from typing import Optional
+
+from pydantic import PrivateAttr
+
 from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.models.knowledge_base.handle import (
+    KnowledgeBaseHandle,
+    KnowledgeBaseVersion,
+)
 from lx_dtypes.models.patient.patient import Patient
 from lx_dtypes.models.patient.patient_examination import PatientExamination
 from lx_dtypes.models.patient.patient_finding import PatientFinding
@@ -29,6 +37,56 @@ class PatientInterface(AppBaseModel):
     knowledge_base: KnowledgeBase
     patient_ledger: PatientLedger
 
+    # swappable knowledge base followed by this interface, see from_handle
+    _knowledge_base_handle: Optional[KnowledgeBaseHandle] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_handle(
+        cls, handle: KnowledgeBaseHandle, patient_ledger: PatientLedger
+    ) -> "PatientInterface":
+        """Create an interface that follows the versions published on a handle.
+
+        The ``knowledge_base`` of the returned interface is replaced whenever a
+        new version is published. Take a ``snapshot()`` per request so all
+        checks of one request see the same version.
+
+        Args:
+            handle (KnowledgeBaseHandle): The knowledge base handle.
+            patient_ledger (PatientLedger): The patient ledger.
+        Returns:
+            PatientInterface: The interface.
+        """
+        interface = cls(
+            knowledge_base=handle.knowledge_base, patient_ledger=patient_ledger
+        )
+        interface._knowledge_base_handle = handle
+        handle.subscribe(interface._on_knowledge_base_published)
+        return interface
+
+    def _on_knowledge_base_published(self, current: KnowledgeBaseVersion) -> None:
+        self.knowledge_base = current.knowledge_base
+
+    @property
+    def knowledge_base_handle(self) -> Optional[KnowledgeBaseHandle]:
+        return self._knowledge_base_handle
+
+    def snapshot(self) -> "PatientInterface":
+        """Return an interface pinned to the current knowledge base version.
+
+        The copy shares the patient ledger and keeps its knowledge base while
+        newer versions are published, so a request in flight is not affected
+        by a reload. Without a handle the interface itself is returned.
+
+        Returns:
+            PatientInterface: The pinned interface.
+        """
+        handle = self._knowledge_base_handle
+        if handle is None:
+            return self
+        return self.model_copy(
+            update={"knowledge_base": handle.snapshot().knowledge_base}
+        )
+
     # Create Methods
     def create_patient_examination(
         self, patient_uuid: str, examination_name: str
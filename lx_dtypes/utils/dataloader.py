@@ -1,11 +1,13 @@
 from heapq import heappop, heappush
-from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Literal, Set, Tuple
 
 if TYPE_CHECKING:
     from lx_dtypes.models.knowledge_base.knowledge_base_config import (
         KnowledgeBaseConfig,
     )
 
+ParseExecutorKind = Literal["thread", "process"]
+
 
 def resolve_kb_module_load_order(
     modules: Dict[str, "KnowledgeBaseConfig"],
@@ -52,3 +54,26 @@ def resolve_kb_module_load_order(
         raise ValueError(f"Circular dependency detected among modules: {unresolved}")
 
     return load_order
+
+
+def resolve_kb_module_load_levels(
+    modules: Dict[str, "KnowledgeBaseConfig"],
+    preferred_order: List[str],
+) -> List[List[str]]:
+    """Group modules into topological levels.
+
+    Every module is placed one level above its deepest dependency, so the
+    modules of a level never depend on each other and can be built concurrently.
+    Within a level modules follow ``resolve_kb_module_load_order``.
+    """
+    load_order = resolve_kb_module_load_order(modules, preferred_order)
+
+    depth: Dict[str, int] = {}
+    for module_name in load_order:
+        dependencies = modules[module_name].depends_on
+        depth[module_name] = 1 + max((depth[dep] for dep in dependencies), default=-1)
+
+    levels: List[List[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+    for module_name in load_order:
+        levels[depth[module_name]].append(module_name)
+    return levels
@@ -1,21 +1,169 @@
+import gzip
+import io
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Literal, Mapping, Tuple
 
 import yaml
+from pydantic import BaseModel
+from pydantic_core import to_json
 
 from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.models.knowledge_base.knowledge_base import CATEGORY_NAMES
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
+ExportFormat = Literal["yaml", "jsonl", "json"]
+
+EXPORT_SUFFIXES: Dict[ExportFormat, str] = {
+    "yaml": ".yaml",
+    "jsonl": ".jsonl",
+    "json": ".json",
+}
+
+
+def get_export_path(
+    export_dir: Path,
+    filename: str,
+    export_format: ExportFormat = "yaml",
+    compress: bool = False,
+) -> Path:
+    suffix = EXPORT_SUFFIXES[export_format] + (".gz" if compress else "")
+    return export_dir / f"{filename}{suffix}"
+
+
+def _dump_yaml(data: Any) -> str:
+    # same layout as yaml.dump with its default options
+    return yaml.dump(data, Dumper=_YamlDumper, sort_keys=True)
+
+
+def _get_header(kb: KnowledgeBase) -> Dict[str, Any]:
+    """Return the dump of everything but the entity categories."""
+    return kb.model_dump(exclude=set(CATEGORY_NAMES))
+
+
+def _get_categories(kb: KnowledgeBase) -> List[Tuple[str, Mapping[str, BaseModel]]]:
+    return [(category, getattr(kb, category)) for category in CATEGORY_NAMES]
+
+
+def iter_yaml_chunks(kb: KnowledgeBase) -> Iterator[str]:
+    """Yield the YAML export one top level key or entity at a time.
+
+    The output is identical to dumping ``kb.model_dump()`` at once with the same
+    emitter: keys are sorted and every entity is dumped in the context of its
+    category, so indentation and line wrapping match. libyaml's emitter wraps
+    long escaped strings slightly differently than the pure Python one; the
+    loaded data is the same.
+    """
+    header = _get_header(kb)
+    categories = dict(_get_categories(kb))
+    for key in sorted([*header, *categories]):
+        if key in header:
+            yield _dump_yaml({key: header[key]})
+            continue
+        entities = categories[key]
+        if not entities:
+            yield _dump_yaml({key: {}})
+            continue
+        category_line = f"{key}:\n"
+        for position, name in enumerate(sorted(entities)):
+            chunk = _dump_yaml({key: {name: entities[name].model_dump()}})
+            yield chunk if position == 0 else chunk[len(category_line) :]
+
+
+def iter_jsonl_chunks(kb: KnowledgeBase) -> Iterator[bytes]:
+    """Yield one JSON line for the header and one per entity.
+
+    The first line is ``{"knowledge_base": <header>}``, every further line
+    ``{"category": <category>, "entity": <entity dump>}``.
+    """
+    yield to_json({"knowledge_base": _get_header(kb)}) + b"\n"
+    for category, entities in _get_categories(kb):
+        for entity in entities.values():
+            yield to_json({"category": category, "entity": entity.model_dump()}) + b"\n"
+
+
+def iter_json_chunks(kb: KnowledgeBase) -> Iterator[bytes]:
+    """Yield a compact JSON document equal to ``to_json(kb.model_dump())``."""
+    header = _get_header(kb)
+    categories = dict(_get_categories(kb))
+    yield b"{"
+    first_key = True
+    for key in KnowledgeBase.model_fields:
+        if key not in header and key not in categories:
+            continue
+        yield (b"" if first_key else b",") + to_json(key) + b":"
+        first_key = False
+        if key in header:
+            yield to_json(header[key])
+            continue
+        yield b"{"
+        for position, (name, entity) in enumerate(categories[key].items()):
+            prefix = b"" if position == 0 else b","
+            yield prefix + to_json(name) + b":" + to_json(entity.model_dump())
+        yield b"}"
+    yield b"}"
+
+
+def _open_export(path: Path, compress: bool) -> io.BufferedIOBase:
+    if compress:
+        return gzip.GzipFile(path, "wb")
+    return path.open("wb")
+
+
+def stream_knowledge_base(
+    kb: KnowledgeBase,
+    path: Path,
+    export_format: ExportFormat = "yaml",
+    compress: bool = False,
+) -> Path:
+    """Write a knowledge base to a file one entity at a time.
+
+    Only one entity dump is held in memory at a time.
+
+    Args:
+        kb (KnowledgeBase): The knowledge base to export.
+        path (Path): The file to write.
+        export_format (ExportFormat): "yaml", "jsonl" (JSON Lines) or "json"
+            (compact JSON).
+        compress (bool): Write gzip compressed output.
+
+    Returns:
+        Path: The written file.
+    """
+    with _open_export(path, compress) as f:
+        if export_format == "yaml":
+            for text in iter_yaml_chunks(kb):
+                f.write(text.encode("utf-8"))
+        elif export_format == "jsonl":
+            f.writelines(iter_jsonl_chunks(kb))
+        elif export_format == "json":
+            f.writelines(iter_json_chunks(kb))
+        else:
+            raise ValueError(f"Unsupported export format: {export_format}")
+    return path
 
 
 def export_knowledge_base(
-    kb: KnowledgeBase, export_dir: Path, filename: str = "knowledge_base"
-) -> None:
-    """Export the knowledge base to the specified directory in YAML format.
+    kb: KnowledgeBase,
+    export_dir: Path,
+    filename: str = "knowledge_base",
+    export_format: ExportFormat = "yaml",
+    compress: bool = False,
+) -> Path:
+    """Export the knowledge base to the specified directory.
 
     Args:
         kb (KnowledgeBase): The knowledge base to export.
         export_dir (Path): The directory to export the knowledge base to.
-    """
-    dump = kb.model_dump()
-    export_path = export_dir / f"{filename}.yaml"
+        filename (str): The file name without suffix.
+        export_format (ExportFormat): "yaml", "jsonl" or "json".
+        compress (bool): Write gzip compressed output, adds ".gz" to the suffix.
 
-    with open(export_path, "w", encoding="utf-8") as f:
-        yaml.dump(dump, f)
+    Returns:
+        Path: The written file.
+    """
+    export_path = get_export_path(export_dir, filename, export_format, compress)
+    return stream_knowledge_base(kb, export_path, export_format, compress)
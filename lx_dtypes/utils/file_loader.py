@@ -0,0 +1,169 @@
+import hashlib
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+from pydantic import BaseModel, ValidationError
+from pydantic_core import from_json, to_json
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+class LoaderBackend(str, Enum):
+    JSON_SIDECAR = "json_sidecar"
+    YAML_C = "yaml_c"
+    YAML_PYTHON = "yaml_python"
+
+
+YAML_BACKEND = (
+    LoaderBackend.YAML_C
+    if _YamlLoader.__name__ == "CSafeLoader"
+    else LoaderBackend.YAML_PYTHON
+)
+
+_backend_report: Dict[Path, LoaderBackend] = {}
+_backend_report_lock = threading.Lock()
+
+
+def _record_backend(path: Path, backend: LoaderBackend) -> None:
+    with _backend_report_lock:
+        _backend_report[path] = backend
+
+
+def get_backend_report() -> Dict[Path, LoaderBackend]:
+    """Return which backend served each file loaded in this process."""
+    with _backend_report_lock:
+        return dict(_backend_report)
+
+
+def clear_backend_report() -> None:
+    with _backend_report_lock:
+        _backend_report.clear()
+
+
+class SidecarSource(BaseModel):
+    """Identity of the YAML file a JSON sidecar was converted from."""
+
+    size: int
+    content_hash: str
+
+
+def get_json_sidecar_path(path: Path) -> Optional[Path]:
+    """Return where the JSON sidecar of a YAML file lives, whether or not it exists."""
+    if path.suffix not in (".yaml", ".yml"):
+        return None
+    return path.with_suffix(".json")
+
+
+def get_sidecar_source_path(sidecar: Path) -> Path:
+    """Return the file recording the source of a sidecar (``findings.json.source``)."""
+    return sidecar.with_name(f"{sidecar.name}.source")
+
+
+def get_json_sidecar(path: Path) -> Optional[Path]:
+    """Return the JSON sidecar of a YAML file if it exists and is up to date.
+
+    A sidecar holds the same data as the YAML file next to it
+    (``findings.yaml`` -> ``findings.json``). ``write_json_sidecar`` records
+    the size and sha256 digest of the YAML file next to the sidecar; the
+    sidecar is only used while both still match, so rewrites within the same
+    second and restored mtimes (git checkout, rsync) are detected.
+
+    Args:
+        path (Path): The YAML file.
+
+    Returns:
+        Optional[Path]: The sidecar path, or None if there is no usable sidecar.
+    """
+    sidecar = get_json_sidecar_path(path)
+    if sidecar is None:
+        return None
+    try:
+        source = SidecarSource.model_validate_json(
+            get_sidecar_source_path(sidecar).read_bytes()
+        )
+        if not sidecar.is_file() or source.size != path.stat().st_size:
+            return None
+        content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+    except (OSError, ValidationError):
+        return None
+    if content_hash != source.content_hash:
+        return None
+    return sidecar
+
+
+def load_yaml(path: Path) -> Any:
+    """Decode a YAML file with libyaml's CSafeLoader, or SafeLoader if missing."""
+    with path.open("r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    _record_backend(path, YAML_BACKEND)
+    return data
+
+
+def parse_yaml(content: bytes) -> Any:
+    """Decode YAML content that was already read into memory."""
+    return yaml.load(content, Loader=_YamlLoader)
+
+
+def read_json_sidecar(path: Path) -> Optional[bytes]:
+    """Return the raw bytes of an up to date JSON sidecar of ``path``.
+
+    The bytes can be passed to ``model_validate_json`` so decoding and
+    validation happen in a single pydantic-core call.
+
+    Args:
+        path (Path): The YAML file.
+
+    Returns:
+        Optional[bytes]: The sidecar content, or None if there is no usable sidecar.
+    """
+    sidecar = get_json_sidecar(path)
+    if sidecar is None:
+        return None
+    raw = sidecar.read_bytes()
+    _record_backend(path, LoaderBackend.JSON_SIDECAR)
+    return raw
+
+
+def load_structured_file(path: Path) -> Tuple[Any, LoaderBackend]:
+    """Load the data of a YAML file, preferring its JSON sidecar.
+
+    Args:
+        path (Path): The YAML file.
+
+    Returns:
+        Tuple[Any, LoaderBackend]: The decoded data and the backend that served it.
+    """
+    raw = read_json_sidecar(path)
+    if raw is not None:
+        return from_json(raw), LoaderBackend.JSON_SIDECAR
+    return load_yaml(path), YAML_BACKEND
+
+
+def write_json_sidecar(path: Path) -> Path:
+    """Convert a YAML file into its JSON sidecar.
+
+    The size and digest of the YAML file are written to
+    ``get_sidecar_source_path(sidecar)``; see ``get_json_sidecar``.
+
+    Args:
+        path (Path): The YAML file.
+
+    Returns:
+        Path: The written sidecar.
+    """
+    content = path.read_bytes()
+    sidecar = path.with_suffix(".json")
+    sidecar.write_bytes(to_json(parse_yaml(content)))
+    source = SidecarSource(
+        size=len(content), content_hash=hashlib.sha256(content).hexdigest()
+    )
+    get_sidecar_source_path(sidecar).write_text(
+        source.model_dump_json(), encoding="utf-8"
+    )
+    return sidecar
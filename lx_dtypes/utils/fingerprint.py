@@ -0,0 +1,74 @@
+import hashlib
+from pathlib import Path
+from typing import Iterable, List
+
+from pydantic import BaseModel, ConfigDict
+
+from lx_dtypes.utils.file_loader import get_json_sidecar_path
+
+
+class FileFingerprint(BaseModel):
+    """Cheap identity of a file on disk used to detect changed inputs."""
+
+    model_config = ConfigDict(frozen=True)
+
+    path: str
+    size: int
+    mtime_ns: int
+    content_hash: str | None = None
+    # the JSON sidecar the data may be read from instead, if present
+    sidecar: "FileFingerprint | None" = None
+
+
+def hash_file_content(path: Path) -> str:
+    """Return the sha256 hex digest of the file content."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint_file(path: Path, hash_content: bool = False) -> FileFingerprint:
+    """Fingerprint a single file by path, size, mtime and optionally its content.
+
+    The JSON sidecar of a YAML file is fingerprinted along with it, so adding,
+    removing or rewriting a sidecar changes the fingerprint.
+
+    Args:
+        path (Path): The file to fingerprint.
+        hash_content (bool): Whether to include a sha256 digest of the content.
+
+    Returns:
+        FileFingerprint: The fingerprint of the file.
+    """
+    stat = path.stat()
+    content_hash = hash_file_content(path) if hash_content else None
+    sidecar_path = get_json_sidecar_path(path)
+    sidecar = None
+    if sidecar_path is not None and sidecar_path.is_file():
+        sidecar = fingerprint_file(sidecar_path, hash_content=hash_content)
+    return FileFingerprint(
+        path=path.as_posix(),
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        content_hash=content_hash,
+        sidecar=sidecar,
+    )
+
+
+def fingerprint_files(
+    paths: Iterable[Path], hash_content: bool = False
+) -> List[FileFingerprint]:
+    """Fingerprint all files, sorted by path so the result is order independent."""
+    unique_paths = sorted(set(paths), key=lambda p: p.as_posix())
+    return [fingerprint_file(path, hash_content=hash_content) for path in unique_paths]
+
+
+def combine_fingerprints(fingerprints: Iterable[FileFingerprint]) -> str:
+    """Fold a sequence of fingerprints into a single sha256 hex digest."""
+    digest = hashlib.sha256()
+    for fingerprint in fingerprints:
+        digest.update(fingerprint.model_dump_json().encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
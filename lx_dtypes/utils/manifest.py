@@ -0,0 +1,214 @@
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+from lx_dtypes.utils.factories.field_defaults import list_of_str_factory
+from lx_dtypes.utils.paths import get_files_from_dir_recursive, sort_walk_files
+
+MANIFEST_FILE_NAME = ".lx_manifest.json"
+MANIFEST_FORMAT_VERSION = 1
+CONFIG_FILE_NAME = "config.yaml"
+# directories modified this close to a scan may change again within the same
+# mtime tick, so they are re-listed on the next scan
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class ManifestDirectory(BaseModel):
+    mtime_ns: int
+    files: List[str] = Field(default_factory=list_of_str_factory)
+    dirs: List[str] = Field(default_factory=list_of_str_factory)
+
+
+def _directory_dict_factory() -> Dict[str, ManifestDirectory]:
+    return {}
+
+
+class DiscoveryManifest(BaseModel):
+    """Recorded directory tree of a data input dir.
+
+    Directories are keyed by their POSIX path relative to the root ("." for the
+    root itself). A directory whose mtime is unchanged since the last scan is
+    not listed again, because adding, removing or renaming an entry always
+    updates the mtime of the containing directory.
+    """
+
+    format_version: int = MANIFEST_FORMAT_VERSION
+    scanned_at_ns: int = 0
+    directories: Dict[str, ManifestDirectory] = Field(
+        default_factory=_directory_dict_factory
+    )
+
+    @classmethod
+    def scan(
+        cls, root: Path, previous: Optional["DiscoveryManifest"] = None
+    ) -> "DiscoveryManifest":
+        """Walk ``root`` with os.scandir, reusing unchanged directories of ``previous``.
+
+        Args:
+            root (Path): The directory to scan.
+            previous (Optional[DiscoveryManifest]): An earlier manifest of the same root.
+
+        Returns:
+            DiscoveryManifest: The up to date manifest.
+        """
+        scan_started_ns = time.time_ns()
+        previous_dirs = previous.directories if previous else {}
+        trusted_before_ns = previous.scanned_at_ns - RACY_WINDOW_NS if previous else -1
+        directories: Dict[str, ManifestDirectory] = {}
+
+        def visit(rel_path: str, abs_path: str) -> None:
+            mtime_ns = os.stat(abs_path).st_mtime_ns
+            known = previous_dirs.get(rel_path)
+            if (
+                known is not None
+                and known.mtime_ns == mtime_ns
+                and mtime_ns < trusted_before_ns
+            ):
+                entry = known
+            else:
+                entry = ManifestDirectory(mtime_ns=mtime_ns)
+                with os.scandir(abs_path) as it:
+                    for dir_entry in it:
+                        # like Path.rglob, do not descend into symlinked dirs
+                        if dir_entry.is_dir(follow_symlinks=False):
+                            entry.dirs.append(dir_entry.name)
+                        elif dir_entry.is_file():
+                            if rel_path == "." and dir_entry.name == MANIFEST_FILE_NAME:
+                                continue
+                            entry.files.append(dir_entry.name)
+            directories[rel_path] = entry
+
+            for dir_name in entry.dirs:
+                child_rel = dir_name if rel_path == "." else f"{rel_path}/{dir_name}"
+                visit(child_rel, os.path.join(abs_path, dir_name))
+
+        visit(".", os.fspath(root))
+        return cls(scanned_at_ns=scan_started_ns, directories=directories)
+
+    @classmethod
+    def load(cls, root: Path) -> Optional["DiscoveryManifest"]:
+        """Read the manifest persisted in ``root``, or None if there is no usable one."""
+        manifest_file = root / MANIFEST_FILE_NAME
+        try:
+            manifest = cls.model_validate_json(manifest_file.read_bytes())
+        except (OSError, ValueError, ValidationError):
+            return None
+        if manifest.format_version != MANIFEST_FORMAT_VERSION:
+            return None
+        return manifest
+
+    def save(self, root: Path) -> bool:
+        """Persist the manifest in ``root``.
+
+        Returns:
+            bool: False if the directory is not writable.
+        """
+        manifest_file = root / MANIFEST_FILE_NAME
+        tmp_file = manifest_file.with_name(f"{MANIFEST_FILE_NAME}.{os.getpid()}.tmp")
+        try:
+            tmp_file.write_text(self.model_dump_json(), encoding="utf-8")
+            os.replace(tmp_file, manifest_file)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+            return False
+        return True
+
+    def get_config_files(self, root: Path) -> List[Path]:
+        """Return all config.yaml files below ``root``, sorted by path."""
+        return sort_walk_files(
+            [
+                root / rel_path / file_name if rel_path != "." else root / file_name
+                for rel_path, entry in self.directories.items()
+                for file_name in entry.files
+                if file_name == CONFIG_FILE_NAME
+            ]
+        )
+
+    def get_files(self, root: Path, directory: Path) -> Optional[List[Path]]:
+        """Return all files below ``directory`` in the order of a recursive walk.
+
+        The files are sorted like ``get_files_from_dir_recursive``, so both
+        listings pick the same file when two define the same entity.
+
+        Args:
+            root (Path): The root the manifest was scanned from.
+            directory (Path): A directory inside ``root``.
+
+        Returns:
+            Optional[List[Path]]: The files, or None if the directory is not
+            covered by the manifest.
+        """
+        try:
+            rel_path = directory.relative_to(root).as_posix()
+        except ValueError:
+            return None
+        if rel_path not in self.directories:
+            return None
+
+        files: List[Path] = []
+
+        def visit(rel: str, abs_path: Path) -> None:
+            entry = self.directories[rel]
+            files.extend(abs_path / file_name for file_name in entry.files)
+            for dir_name in entry.dirs:
+                child_rel = dir_name if rel == "." else f"{rel}/{dir_name}"
+                visit(child_rel, abs_path / dir_name)
+
+        visit(rel_path, directory)
+        return sort_walk_files(files)
+
+
+def _needs_save(
+    previous: Optional[DiscoveryManifest], current: DiscoveryManifest
+) -> bool:
+    # writing the manifest bumps the mtime of the root, so the root mtime alone
+    # never triggers another write
+    if previous is None or previous.directories.keys() != current.directories.keys():
+        return True
+    trusted_before_ns = previous.scanned_at_ns - RACY_WINDOW_NS
+    for rel_path, entry in current.directories.items():
+        known = previous.directories[rel_path]
+        if known.files != entry.files or known.dirs != entry.dirs:
+            return True
+        if rel_path == ".":
+            continue
+        if known.mtime_ns != entry.mtime_ns or known.mtime_ns >= trusted_before_ns:
+            return True
+    return False
+
+
+def load_manifest(root: Path, persist: bool = True) -> DiscoveryManifest:
+    """Return an up to date manifest of ``root``.
+
+    The persisted manifest is revalidated by directory mtime and written back if
+    anything changed.
+
+    Args:
+        root (Path): The data input directory.
+        persist (bool): Whether to write the manifest next to the data.
+
+    Returns:
+        DiscoveryManifest: The manifest of ``root``.
+    """
+    previous = DiscoveryManifest.load(root)
+    manifest = DiscoveryManifest.scan(root, previous)
+    if persist and _needs_save(previous, manifest):
+        manifest.save(root)
+    return manifest
+
+
+class ManifestFileLister:
+    """Lists files below a directory from manifests, falling back to a walk."""
+
+    def __init__(self, manifests: Dict[Path, DiscoveryManifest]) -> None:
+        self.manifests = manifests
+
+    def __call__(self, directory: Path) -> List[Path]:
+        for root, manifest in self.manifests.items():
+            files = manifest.get_files(root, directory)
+            if files is not None:
+                return files
+        return get_files_from_dir_recursive(directory)
@@ -35,12 +35,17 @@ class AppBaseModel(BaseModel):
 
     @classmethod
     def from_yaml_file(cls, path: Path) -> Self:
-        """Load model instance from a YAML file."""
-        import yaml
+        """Load model instance from a YAML file or its JSON sidecar."""
+        from lx_dtypes.utils.file_loader import load_yaml, read_json_sidecar
 
         path = path.expanduser().resolve()
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        raw = read_json_sidecar(path)
+        if raw is not None:
+            instance = cls.model_validate_json(raw)
+            instance.source_file = path
+            return instance
+
+        data = load_yaml(path)
         data["source_file"] = path
         instance = cls.model_validate(data)
 
@@ -1,7 +1,21 @@
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-import yaml
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import InitErrorDetails
 
 from lx_dtypes.models.shallow import (
     CitationShallow,
@@ -21,6 +35,8 @@ from lx_dtypes.models.shallow.intervention import (
     InterventionTypeShallow,
 )
 from lx_dtypes.models.shallow.unit import UnitShallow, UnitTypeShallow
+from lx_dtypes.utils.dataloader import ParseExecutorKind
+from lx_dtypes.utils.file_loader import load_structured_file
 
 model_types = Union[
     type[InformationSourceShallow],
@@ -78,10 +94,84 @@ model_lookup: Dict[str, model_types] = {
 
 allowed_types = [v for _, v in model_lookup.items()]
 
+# model name -> KnowledgeBase category field
+category_lookup: Dict[str, str] = {
+    "information_source": "information_sources",
+    "citation": "citations",
+    "examination": "examinations",
+    "examination_type": "examination_types",
+    "finding": "findings",
+    "finding_type": "finding_types",
+    "classification": "classifications",
+    "classification_choice": "classification_choices",
+    "classification_type": "classification_types",
+    "indication": "indications",
+    "indication_type": "indication_types",
+    "intervention": "interventions",
+    "intervention_type": "intervention_types",
+    "unit": "units",
+    "unit_type": "unit_types",
+}
+
 reverse_model_lookup: Dict[model_types, str] = {v: k for k, v in model_lookup.items()}
 
+# below these file counts a pool costs more than it saves (worker start-up,
+# pickling the parsed models back from spawned processes)
+THREAD_POOL_MIN_FILES = 4
+PROCESS_POOL_MIN_FILES = 64
 
-def parse_shallow_object(file_path: Path) -> List[ShallowModel]:
+
+@lru_cache(maxsize=None)
+def get_shallow_list_adapter(model_name: str) -> TypeAdapter[List[ShallowModel]]:
+    """Return the TypeAdapter validating a list of items of one model type."""
+    model_type: Any = model_lookup[model_name]
+    adapter: TypeAdapter[List[ShallowModel]] = TypeAdapter(List[model_type])
+    return adapter
+
+
+def _get_file_errors(
+    exc: ValidationError, tag: str, positions: List[int]
+) -> List[InitErrorDetails]:
+    """Locate the errors of a per-type batch by file position and model tag."""
+    errors: List[InitErrorDetails] = []
+    for error in exc.errors():
+        index, *rest = error["loc"]
+        details: InitErrorDetails = {
+            "type": error["type"],
+            "loc": (positions[int(index)], tag, *rest),
+            "input": error["input"],
+        }
+        if "ctx" in error:
+            details["ctx"] = error["ctx"]
+        errors.append(details)
+    return errors
+
+
+def _raise_invalid_model_tag(position: int, item: Dict[str, Any]) -> NoReturn:
+    tag = item.get("model")
+    error: InitErrorDetails
+    if tag is None:
+        error = {
+            "type": "union_tag_not_found",
+            "loc": (position,),
+            "input": item,
+            "ctx": {"discriminator": "'model'"},
+        }
+    else:
+        error = {
+            "type": "union_tag_invalid",
+            "loc": (position,),
+            "input": item,
+            "ctx": {
+                "discriminator": "'model'",
+                "tag": str(tag),
+                "expected_tags": ", ".join(f"'{name}'" for name in model_lookup),
+            },
+        }
+    raise ValidationError.from_exception_data("ShallowItem", [error])
+
+
+def _load_shallow_items(file_path: Path) -> List[Dict[str, Any]]:
     if not file_path.exists() or not file_path.is_file():
         raise ValueError(
             f"The provided path {file_path} does not exist or is not a file."
@@ -91,28 +181,198 @@ def parse_shallow_object(file_path: Path) -> List[ShallowModel]:
         "File must be a YAML file."
     )
 
-    # each yaml file is a list of objects
-    with file_path.open("r", encoding="utf-8") as f:
-        data: List[Dict[str, Any]] = yaml.safe_load(f) or []  # simplified typ
+    # each yaml file (or its json sidecar) is a list of objects
+    loaded, _ = load_structured_file(file_path)
+    data: List[Dict[str, Any]] = loaded or []  # simplified typ
 
     assert isinstance(data, list), "YAML file must contain a list of objects."
-    results: List[ShallowModel] = list()
     for item in data:
         assert isinstance(item, dict), "Each item in the list must be a dictionary."
 
         target_model_name = item.get("model")
         assert target_model_name is not None, "Each item must have a 'model' field."
+        assert target_model_name in model_lookup, (
+            f"Unknown model type: {target_model_name}"
+        )
+    return data
+
+
+def validate_shallow_item(item: Dict[str, Any], file_path: Path) -> ShallowModel:
+    """Validate a single raw item of a data file into its shallow model.
+
+    Args:
+        item (Dict[str, Any]): The raw item including its "model" field. The
+            dictionary is modified in place.
+        file_path (Path): The file the item was read from.
+
+    Returns:
+        ShallowModel: The validated object.
+    """
+    TargetModel = model_lookup[item.pop("model")]
+    item["source_file"] = file_path  # set source_file for reference
+    result = TargetModel.model_validate(item)
+    result_type = type(result)
+    assert result_type in allowed_types, (
+        f"Parsed object type {result_type} is not allowed."
+    )
+    return result
+
+
+def get_shallow_item_name(item: Dict[str, Any]) -> str:
+    """Return the name a raw item will have once validated, without validating it."""
+    name = item.get("name")
+    if not name and item.get("model") == "citation":
+        # mirrors CitationShallow.ensure_name
+        name = item.get("citation_key") or item.get("title")
+    assert isinstance(name, str) and name.strip(), "Each item must have a 'name'."
+    return name.strip()
+
+
+def validate_shallow_items(
+    items: List[Dict[str, Any]], file_path: Path
+) -> List[ShallowModel]:
+    """Validate all raw items of a data file with one call per model type.
+
+    The "model" tags are popped in one pass over the list, the items of each
+    model type are validated in a single pydantic-core call and the tags are
+    put back afterwards, so no item is copied or dispatched on its own.
+
+    Args:
+        items (List[Dict[str, Any]]): The raw items including their "model"
+            field. When the function returns the dictionaries hold the same
+            entries again, with "model" as the last key.
+        file_path (Path): The file the items were read from, attached to every
+            validated object.
 
-        TargetModel = model_lookup.get(target_model_name, None)
-        assert TargetModel is not None, f"Unknown model type: {target_model_name}"
+    Returns:
+        List[ShallowModel]: The validated objects in file order.
+    """
+    for position, item in enumerate(items):
+        if item.get("model") not in model_lookup:
+            _raise_invalid_model_tag(position, item)
 
-        item.pop("model")  # remove the model field before validation
-        item["source_file"] = file_path  # set source_file for reference
-        result = TargetModel.model_validate(item)
-        result_type = type(result)
-        assert result_type in allowed_types, (
-            f"Parsed object type {result_type} is not allowed."
+    tags: List[str] = [item.pop("model") for item in items]
+    try:
+        positions_by_tag: Dict[str, List[int]] = {}
+        for position, tag in enumerate(tags):
+            positions_by_tag.setdefault(tag, []).append(position)
+
+        objects: List[ShallowModel] = [None] * len(items)  # type: ignore[list-item]
+        errors: List[InitErrorDetails] = []
+        for tag, positions in positions_by_tag.items():
+            try:
+                validated = get_shallow_list_adapter(tag).validate_python(
+                    [items[position] for position in positions]
+                )
+            except ValidationError as exc:
+                errors += _get_file_errors(exc, tag, positions)
+                continue
+            for position, parsed_object in zip(positions, validated):
+                objects[position] = parsed_object
+    finally:
+        for item, tag in zip(items, tags):
+            item["model"] = tag
+    if errors:
+        errors.sort(key=lambda error: error["loc"][0])
+        raise ValidationError.from_exception_data("ShallowItem", errors)
+
+    for parsed_object in objects:
+        parsed_object.source_file = file_path
+    return objects
+
+
+def parse_shallow_object(file_path: Path) -> List[ShallowModel]:
+    data = _load_shallow_items(file_path)
+    return validate_shallow_items(data, file_path)
+
+
+def index_shallow_objects(file_path: Path) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """Read a data file without validating its items.
+
+    Args:
+        file_path (Path): The YAML file to read.
+
+    Returns:
+        List[Tuple[str, str, Dict[str, Any]]]: The knowledge base category, name
+        and raw item of every object in the file. Items can be validated later
+        with ``validate_shallow_item``.
+    """
+    data = _load_shallow_items(file_path)
+    return [
+        (category_lookup[item["model"]], get_shallow_item_name(item), item)
+        for item in data
+    ]
+
+
+def create_parse_executor(
+    kind: ParseExecutorKind, max_workers: Optional[int] = None
+) -> Executor:
+    """Create a pool for ``parse_shallow_objects``.
+
+    Create it once and pass it to every ``parse_shallow_objects`` call of a
+    load; the caller owns the pool and shuts it down.
+
+    Args:
+        kind (ParseExecutorKind): "thread" or "process".
+        max_workers (Optional[int]): Worker count, defaults to the executor's
+            own default.
+
+    Returns:
+        Executor: The pool.
+    """
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    if kind == "process":
+        # spawn avoids forking a possibly multi-threaded parent process
+        return ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
         )
+    raise ValueError(f"Unsupported parse executor: {kind}")
+
+
+def get_parse_min_files(executor: Union[ParseExecutorKind, Executor]) -> int:
+    """Return the file count from which parsing in a pool pays off."""
+    if executor == "process" or isinstance(executor, ProcessPoolExecutor):
+        return PROCESS_POOL_MIN_FILES
+    return THREAD_POOL_MIN_FILES
+
+
+def parse_shallow_objects(
+    file_paths: Sequence[Path],
+    executor: Optional[Union[ParseExecutorKind, Executor]] = None,
+    max_workers: Optional[int] = None,
+    min_files: Optional[int] = None,
+) -> Iterator[List[ShallowModel]]:
+    """Parse multiple YAML files, optionally concurrently.
+
+    Results are always yielded in the order of ``file_paths``, regardless of
+    which worker finished first, so callers merging the results keep a
+    deterministic "last file wins" order.
+
+    Args:
+        file_paths (Sequence[Path]): The YAML files to parse.
+        executor (Optional[Union[ParseExecutorKind, Executor]]): A pool from
+            ``create_parse_executor`` shared by all calls of a load, or "thread"
+            or "process" to create a pool for this call only. None parses
+            sequentially in the calling thread.
+        max_workers (Optional[int]): Worker count of a pool created for this
+            call, defaults to the executor's own default.
+        min_files (Optional[int]): Parse fewer files sequentially, defaults to
+            ``get_parse_min_files(executor)``.
+
+    Yields:
+        List[ShallowModel]: The parsed objects of each file.
+    """
+    if executor is not None and min_files is None:
+        min_files = get_parse_min_files(executor)
+    if executor is None or len(file_paths) < max(min_files or 0, 2):
+        for file_path in file_paths:
+            yield parse_shallow_object(file_path)
+        return
+
+    if isinstance(executor, Executor):
+        yield from executor.map(parse_shallow_object, file_paths)
+        return
 
-        results.append(result)
-    return results
+    with create_parse_executor(executor, max_workers=max_workers) as pool:
+        yield from pool.map(parse_shallow_object, file_paths)
@@ -3,7 +3,12 @@ from typing import List
 
 
 def get_files_from_dir_recursive(directory: Path) -> List[Path]:
-    """Recursively get all files from a directory and its subdirectories."""
+    """Recursively get all files from a directory and its subdirectories.
+
+    Files are sorted by path (``sort_walk_files``), so the order, and with it
+    which file wins when two files define the same entity, does not depend on
+    the file system or the Python version.
+    """
     if not directory.exists():
         raise ValueError(f"The provided path {directory} does not exist.")
 
@@ -15,4 +20,9 @@ def get_files_from_dir_recursive(directory: Path) -> List[Path]:
         is_file = path.is_file()
         if is_file:
             all_files.append(path)
-    return all_files
+    return sort_walk_files(all_files)
+
+
+def sort_walk_files(files: List[Path]) -> List[Path]:
+    """Sort the files of a recursive walk by their path components."""
+    return sorted(files, key=lambda path: path.parts)
@@ -0,0 +1,97 @@
+"""Compare the streaming knowledge base export with a whole-dump yaml.dump."""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import yaml
+
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.utils.export.export_knowledge_base import ExportFormat
+
+DEFAULT_ENTITY_COUNT = 20_000
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark knowledge base export paths."
+    )
+    parser.add_argument(
+        "--entities",
+        type=int,
+        default=DEFAULT_ENTITY_COUNT,
+        help="Number of findings in the synthetic knowledge base.",
+    )
+    return parser.parse_args()
+
+
+def build_knowledge_base(entity_count: int) -> KnowledgeBase:
+    data: Dict[str, Any] = {
+        "name": "benchmark",
+        "findings": {
+            f"finding_{i}": {
+                "name": f"finding_{i}",
+                "name_de": f"Befund {i}",
+                "name_en": f"Finding {i}",
+                "description": "Synthetic finding used to benchmark exports. " * 3,
+                "classification_names": [f"classification_{i % 50}"],
+                "tags": ["benchmark"],
+            }
+            for i in range(entity_count)
+        },
+    }
+    return KnowledgeBase.construct_from_dump(data)
+
+
+def export_whole_dump(kb: KnowledgeBase, export_dir: Path) -> Path:
+    """The export before streaming: build the full dump, then yaml.dump it."""
+    export_path = export_dir / "whole_dump.yaml"
+    with open(export_path, "w", encoding="utf-8") as f:
+        yaml.dump(kb.model_dump(), f)
+    return export_path
+
+
+def measure(label: str, export: Callable[[], Path]) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    path = export()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = path.stat().st_size
+    print(
+        f"{label:<22} {elapsed:8.2f} s   peak {peak / 2**20:8.1f} MiB   "
+        f"file {size / 2**20:8.1f} MiB"
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    kb = build_knowledge_base(args.entities)
+    formats: list[tuple[ExportFormat, bool]] = [
+        ("yaml", False),
+        ("yaml", True),
+        ("jsonl", False),
+        ("json", False),
+        ("json", True),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        export_dir = Path(tmp)
+        measure("whole dump (yaml)", lambda: export_whole_dump(kb, export_dir))
+        for export_format, compress in formats:
+            label = f"stream ({export_format}{', gzip' if compress else ''})"
+            measure(
+                label,
+                lambda: kb.export(
+                    export_dir, export_format=export_format, compress=compress
+                ),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Time KnowledgeBase.check_integrity on a synthetic knowledge base."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Dict
+
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+
+DEFAULT_ENTITY_COUNT = 100_000
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the referential integrity check."
+    )
+    parser.add_argument(
+        "--entities",
+        type=int,
+        default=DEFAULT_ENTITY_COUNT,
+        help="Approximate number of entities in the synthetic knowledge base.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timed checks.",
+    )
+    return parser.parse_args()
+
+
+def build_knowledge_base(entity_count: int) -> KnowledgeBase:
+    """Build a knowledge base with findings, classifications and choices.
+
+    Every finding references three classifications, every classification five
+    choices; one reference in a hundred is dangling.
+    """
+    n_choices = entity_count // 2
+    n_classifications = entity_count // 4
+    n_findings = entity_count - n_choices - n_classifications
+
+    data: Dict[str, Any] = {
+        "name": "benchmark",
+        "classification_choices": {
+            f"choice_{i}": {"name": f"choice_{i}"} for i in range(n_choices)
+        },
+        "classifications": {
+            f"classification_{i}": {
+                "name": f"classification_{i}",
+                "choice_names": [f"choice_{(i * 5 + j) % n_choices}" for j in range(5)],
+            }
+            for i in range(n_classifications)
+        },
+        "findings": {
+            f"finding_{i}": {
+                "name": f"finding_{i}",
+                "classification_names": [
+                    f"classification_{(i * 3 + j) % n_classifications}"
+                    if i % 100
+                    else f"missing_{i}_{j}"
+                    for j in range(3)
+                ],
+            }
+            for i in range(n_findings)
+        },
+    }
+    return KnowledgeBase.construct_from_dump(data)
+
+
+def main() -> None:
+    args = parse_args()
+    kb = build_knowledge_base(args.entities)
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        report = kb.check_integrity()
+        timings.append(time.perf_counter() - start)
+
+    print(
+        f"{report.checked_entities} entities, {report.checked_references} references, "
+        f"{len(report.dangling)} dangling, {len(report.orphaned)} orphaned"
+    )
+    print(
+        f"best {min(timings) * 1000:.1f} ms   mean {sum(timings) / len(timings) * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Compare the per-process cost of a pickled snapshot and a mapped knowledge base."""
+
+from __future__ import annotations
+
+import argparse
+import pickle
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.models.knowledge_base.mapped import (
+    open_mapped_knowledge_base,
+    write_mapped_knowledge_base,
+)
+
+DEFAULT_ENTITY_COUNT = 20_000
+DEFAULT_READ_COUNT = 100
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark attaching to a memory-mapped knowledge base."
+    )
+    parser.add_argument(
+        "--entities",
+        type=int,
+        default=DEFAULT_ENTITY_COUNT,
+        help="Number of findings in the synthetic knowledge base.",
+    )
+    parser.add_argument(
+        "--reads",
+        type=int,
+        default=DEFAULT_READ_COUNT,
+        help="Number of findings read after loading, as a request would.",
+    )
+    return parser.parse_args()
+
+
+def build_knowledge_base(entity_count: int) -> KnowledgeBase:
+    data: Dict[str, Any] = {
+        "name": "benchmark",
+        "findings": {
+            f"finding_{i}": {
+                "name": f"finding_{i}",
+                "name_de": f"Befund {i}",
+                "name_en": f"Finding {i}",
+                "description": "Synthetic finding used to benchmark loading. " * 3,
+                "classification_names": [f"classification_{i % 50}"],
+                "tags": ["benchmark"],
+            }
+            for i in range(entity_count)
+        },
+    }
+    return KnowledgeBase.construct_from_dump(data)
+
+
+def measure(label: str, load: Callable[[], KnowledgeBase], reads: int) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    kb = load()
+    for name in list(kb.findings)[:reads]:
+        kb.findings[name]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<18} {elapsed * 1000:8.1f} ms   heap {current / 2**20:8.1f} MiB "
+        "per process"
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    kb = build_knowledge_base(args.entities)
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_path = Path(tmp) / "benchmark.kb.pickle"
+        snapshot_path.write_bytes(pickle.dumps(kb, protocol=pickle.HIGHEST_PROTOCOL))
+        mapped_path = write_mapped_knowledge_base(kb, Path(tmp) / "benchmark.kb.map")
+        print(
+            f"{args.entities} findings, mapped file "
+            f"{mapped_path.stat().st_size / 2**20:.1f} MiB (shared by all processes)"
+        )
+
+        def load_mapped() -> KnowledgeBase:
+            mapped = open_mapped_knowledge_base(mapped_path)
+            assert mapped is not None
+            return mapped
+
+        measure(
+            "pickled snapshot",
+            lambda: pickle.loads(snapshot_path.read_bytes()),
+            args.reads,
+        )
+        measure("mapped", load_mapped, args.reads)
+
+
+if __name__ == "__main__":
+    main()
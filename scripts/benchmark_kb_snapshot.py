@@ -0,0 +1,84 @@
+"""Compare cold and warm start times of DataLoader.load_knowledge_base."""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from lx_dtypes.models.knowledge_base import DataLoader
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_INPUT_DIR = REPO_ROOT / "lx_dtypes" / "data"
+DEFAULT_MODULE_NAME = "lx_knowledge_base"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark knowledge base loading with and without snapshots."
+    )
+    parser.add_argument(
+        "--input-dir",
+        type=Path,
+        default=DEFAULT_INPUT_DIR,
+        help="Directory scanned for module config.yaml files.",
+    )
+    parser.add_argument(
+        "--module",
+        type=str,
+        default=DEFAULT_MODULE_NAME,
+        help="Name of the knowledge base module to load.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timed loads per scenario.",
+    )
+    parser.add_argument(
+        "--hash-content",
+        action="store_true",
+        help="Include content hashes in the snapshot key.",
+    )
+    return parser.parse_args()
+
+
+def _time_load(loader: DataLoader, module_name: str, repeat: int) -> List[float]:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader.load_knowledge_base(module_name)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(label: str, timings: List[float]) -> None:
+    best = min(timings) * 1000
+    mean = sum(timings) / len(timings) * 1000
+    print(f"{label:<24} best {best:8.1f} ms   mean {mean:8.1f} ms")
+
+
+def main() -> None:
+    args = parse_args()
+
+    cold_loader = DataLoader(input_dirs=[args.input_dir])
+    cold_loader.load_module_configs()
+    _report("cold (no snapshot)", _time_load(cold_loader, args.module, args.repeat))
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        warm_loader = DataLoader(
+            input_dirs=[args.input_dir],
+            snapshot_dir=Path(snapshot_dir),
+            snapshot_hash_content=args.hash_content,
+        )
+        warm_loader.load_module_configs()
+        _report("first (writes snapshot)", _time_load(warm_loader, args.module, 1))
+        _report(
+            "warm (from snapshot)", _time_load(warm_loader, args.module, args.repeat)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Time the bulk terminology mapper on phrases derived from the bundled data."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import List
+
+from lx_dtypes.models.knowledge_base import DataLoader
+from lx_dtypes.models.knowledge_base.term_mapper import TerminologyMapper
+
+DEFAULT_PHRASE_COUNT = 200_000
+SUFFIXES = ("", " links", " rechts", " ca. 5 mm", " distal")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark mapping free-text phrases to terminology names."
+    )
+    parser.add_argument(
+        "--phrases",
+        type=int,
+        default=DEFAULT_PHRASE_COUNT,
+        help="Number of synthetic phrases to map.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes, maps in the calling process if unset.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=2048,
+        help="Number of phrases per matrix product.",
+    )
+    return parser.parse_args()
+
+
+def build_phrases(mapper: TerminologyMapper, count: int) -> List[str]:
+    """Combine random labels with free-text suffixes, some of them misspelled."""
+    rng = random.Random(0)
+    phrases = []
+    for i in range(count):
+        label = rng.choice(mapper.labels)
+        if i % 10 == 0 and len(label) > 4:
+            position = rng.randrange(len(label))
+            label = label[:position] + label[position + 1 :]
+        phrases.append(f"{label}{rng.choice(SUFFIXES)}".replace(" ", "_", i % 2))
+    return phrases
+
+
+def main() -> None:
+    args = parse_args()
+    loader = DataLoader(input_dirs=[Path("./lx_dtypes/data/")])
+    loader.load_module_configs()
+    kb = loader.load_knowledge_base("lx_knowledge_base")
+
+    start = time.perf_counter()
+    mapper = TerminologyMapper(kb)
+    build_time = time.perf_counter() - start
+    phrases = build_phrases(mapper, args.phrases)
+
+    start = time.perf_counter()
+    matched = 0
+    for candidates in mapper.map_phrases(
+        phrases, batch_size=args.batch_size, workers=args.workers
+    ):
+        matched += bool(candidates)
+    map_time = time.perf_counter() - start
+
+    print(
+        f"{len(mapper.entities)} entities, {len(mapper.labels)} labels, "
+        f"index built in {build_time * 1000:.1f} ms"
+    )
+    print(
+        f"{len(phrases)} phrases, {matched} matched, {map_time:.2f} s "
+        f"({len(phrases) / map_time:,.0f} phrases/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
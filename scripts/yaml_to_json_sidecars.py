@@ -0,0 +1,36 @@
+"""Write JSON sidecars for all YAML files below a directory."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from lx_dtypes.utils.file_loader import write_json_sidecar
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_ROOT = REPO_ROOT / "lx_dtypes" / "data"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Convert YAML data files into JSON sidecars for the fast loader."
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=DEFAULT_ROOT,
+        help="Directory that is searched recursively for *.yaml files.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    yaml_files = sorted(args.root.rglob("*.yaml"))
+    for yaml_file in yaml_files:
+        write_json_sidecar(yaml_file)
+    print(f"Wrote {len(yaml_files)} JSON sidecars below {args.root}")
+
+
+if __name__ == "__main__":
+    main()
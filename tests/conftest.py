@@ -8,6 +8,7 @@ from .fixtures.dataloader import (
 )
 from .fixtures.knowledge_base import lx_knowledge_base
 from .fixtures.logs import log_writer, logger
+from .fixtures.module_tree import write_module_tree
 from .fixtures.object_names import (
     classification_choice_name_lesion_size_oval_mm,
     classification_choice_name_paris_1s,
@@ -87,4 +88,5 @@ __all__ = [
     "indication_name_screening_colonoscopy",
     "sample_patient_finding_with_classification_choice",
     "classification_name_colon_lesion_paris",
+    "write_module_tree",
 ]
@@ -0,0 +1,30 @@
+from pathlib import Path
+from typing import Callable
+
+from pytest import fixture
+
+
+def _write_module_tree(root: Path, data_subdir: str = "") -> Path:
+    """Write a knowledge base ``sample_kb`` with one module and one data file.
+
+    Returns the data file ``sample_module/data/<data_subdir>/findings.yaml``.
+    """
+    module_dir = root / "sample_module"
+    data_dir = module_dir / "data" / data_subdir
+    data_dir.mkdir(parents=True)
+    (module_dir / "config.yaml").write_text(
+        "name: sample_module\nversion: 0.1.0\ndata:\n  dirs:\n    - ./data\n",
+        encoding="utf-8",
+    )
+    (root / "config.yaml").write_text(
+        "name: sample_kb\nversion: 0.1.0\nmodules:\n  - sample_module\n",
+        encoding="utf-8",
+    )
+    data_file = data_dir / "findings.yaml"
+    data_file.write_text("- model: finding\n  name: colon_polyp\n", encoding="utf-8")
+    return data_file
+
+
+@fixture
+def write_module_tree() -> Callable[..., Path]:
+    return _write_module_tree
@@ -3,8 +3,11 @@ from pathlib import Path
 import pytest
 
 from lx_dtypes.models import KnowledgeBaseConfig
-from lx_dtypes.models.knowledge_base import DataLoader
-from lx_dtypes.utils.dataloader import resolve_kb_module_load_order
+from lx_dtypes.models.knowledge_base import DataLoader, KnowledgeBase
+from lx_dtypes.utils.dataloader import (
+    resolve_kb_module_load_levels,
+    resolve_kb_module_load_order,
+)
 
 
 class TestDataLoader:
@@ -134,3 +137,96 @@ class TestDataLoader:
         loader = DataLoader(input_dirs=[Path("./non_existing_dir/")])
         config_files = loader.fetch_config_yamls()
         assert config_files == []
+
+    def test_initialized_config_is_memoized(
+        self, empty_data_loader: DataLoader, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        root = KnowledgeBaseConfig(name="root", version="1.0.0", modules=["mod_a"])
+        mod_a = KnowledgeBaseConfig(
+            name="mod_a", version="1.0.0", depends_on=["mod_b"], modules=[]
+        )
+        mod_b = KnowledgeBaseConfig(name="mod_b", version="1.0.0", modules=[])
+        empty_data_loader.module_configs = {
+            root.name: root,
+            mod_a.name: mod_a,
+            mod_b.name: mod_b,
+        }
+
+        calls: list[str] = []
+
+        def counting_resolve(name: str) -> KnowledgeBaseConfig:
+            calls.append(name)
+            return original_resolve(name)
+
+        original_resolve = empty_data_loader._resolve_config  # type: ignore
+        monkeypatch.setattr(empty_data_loader, "_resolve_config", counting_resolve)
+
+        view = empty_data_loader.get_initialized_config_view("root")
+        assert view.modules == ["mod_b", "mod_a"]
+        assert empty_data_loader.get_initialized_config_view("root") is view
+
+        copied = empty_data_loader.get_initialized_config("root")
+        assert copied is not view
+        assert copied.modules == view.modules
+        assert calls == ["root"]
+
+        # replacing the module configs invalidates the memoized resolution
+        empty_data_loader.module_configs = {root.name: root, mod_b.name: mod_b}
+        with pytest.raises(ValueError, match="referenced but not loaded"):
+            empty_data_loader.get_initialized_config_view("root")
+        assert calls == ["root", "root"]
+
+    def test_module_knowledge_base_config_is_not_the_memo(
+        self, yaml_repo_dirs: list[Path]
+    ) -> None:
+        loader = DataLoader(input_dirs=yaml_repo_dirs)
+        loader.load_module_configs()
+        view = loader.get_initialized_config_view("lx_classification_choices")
+        tags = list(view.tags)
+
+        kb = loader.get_module_knowledge_base("lx_classification_choices")
+        assert kb.config is not None and kb.config is not view
+        kb.config.tags.append("changed")
+        kb.config.modules.clear()
+
+        assert view.tags == tags
+        assert loader.get_initialized_config_view("lx_classification_choices") is view
+
+    def test_resolve_kb_module_load_levels(self) -> None:
+        mod_a = KnowledgeBaseConfig(
+            name="mod_a", version="1.0.0", depends_on=["mod_b", "mod_d"], modules=[]
+        )
+        mod_b = KnowledgeBaseConfig(
+            name="mod_b", version="1.0.0", depends_on=["mod_c"], modules=[]
+        )
+        mod_c = KnowledgeBaseConfig(name="mod_c", version="1.0.0", modules=[])
+        mod_d = KnowledgeBaseConfig(name="mod_d", version="1.0.0", modules=[])
+        modules_dict = {mod.name: mod for mod in (mod_a, mod_b, mod_c, mod_d)}
+
+        levels = resolve_kb_module_load_levels(
+            modules=modules_dict,
+            preferred_order=["mod_d", "mod_a", "mod_b", "mod_c"],
+        )
+        assert levels == [["mod_d", "mod_c"], ["mod_b"], ["mod_a"]]
+        assert resolve_kb_module_load_levels({}, []) == []
+
+    def test_level_parallel_build_matches_sequential(
+        self,
+        yaml_repo_dirs: list[Path],
+        demo_kb_config_name: str,
+        lx_knowledge_base: KnowledgeBase,
+    ) -> None:
+        loader = DataLoader(input_dirs=yaml_repo_dirs, module_workers=4)
+        loader.load_module_configs()
+
+        levels = loader.get_module_load_levels(demo_kb_config_name)
+        modules = loader.get_initialized_config_view(demo_kb_config_name).modules
+        assert sorted(name for level in levels for name in level) == sorted(modules)
+        assert len(levels) > 1
+
+        kb = loader.load_knowledge_base(demo_kb_config_name)
+        assert kb.model_dump() == lx_knowledge_base.model_dump()
+        for category in ("findings", "classifications", "citations"):
+            assert list(getattr(kb, category)) == list(
+                getattr(lx_knowledge_base, category)
+            )
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+from lx_dtypes.models.knowledge_base import DataLoader, KnowledgeBase
+from lx_dtypes.models.knowledge_base.content_hash import hash_entity_dump
+
+
+def _copy(kb: KnowledgeBase) -> KnowledgeBase:
+    return KnowledgeBase.construct_from_dump(kb.model_dump())
+
+
+class TestKnowledgeBaseContentHash:
+    def test_hash_ignores_key_order_and_source(self, lx_knowledge_base: KnowledgeBase):
+        finding = next(iter(lx_knowledge_base.findings.values()))
+        moved = finding.model_copy(update={"source_file": Path("elsewhere.yaml")})
+        dump = finding.model_dump()
+        assert hash_entity_dump(dump) == hash_entity_dump(dict(reversed(dump.items())))
+        assert hash_entity_dump(dump) == hash_entity_dump(moved.model_dump())
+
+    def test_equal_content_equal_root(self, lx_knowledge_base: KnowledgeBase):
+        copy = _copy(lx_knowledge_base)
+        assert copy.get_content_hash() == lx_knowledge_base.get_content_hash()
+        assert lx_knowledge_base.diff_content(copy).is_empty()
+
+    def test_module_roots(self, lx_knowledge_base: KnowledgeBase):
+        modules = lx_knowledge_base.get_content_tree().modules
+        module_entities = lx_knowledge_base.get_module_entities()
+        assert set(modules) == set(module_entities)
+        owned = [key for keys in module_entities.values() for key in keys]
+        assert len(owned) == len(set(owned))
+        assert ("findings", "colon_polyp") in module_entities["lx_findings"]
+
+    def test_diff(self, lx_knowledge_base: KnowledgeBase):
+        old = _copy(lx_knowledge_base)
+        new = _copy(lx_knowledge_base)
+        old_hash = new.get_content_hash()
+
+        changed = new.findings["colon_polyp"].model_copy(update={"description": "x"})
+        new.add_shallow_object(changed)
+        added = changed.model_copy(update={"name": "new_finding"})
+        new.add_shallow_object(added)
+        removed = next(iter(new.units))
+        new._remove_entity("units", removed)
+
+        assert new.get_content_hash() != old_hash
+        diff = old.diff_content(new)
+        assert diff.changed == {"findings": ["colon_polyp"]}
+        assert diff.added == {"findings": ["new_finding"]}
+        assert diff.removed == {"units": [removed]}
+
+        reverse = new.diff_content(old)
+        assert reverse.added == diff.removed
+        assert reverse.removed == diff.added
+
+    def test_changed_modules(
+        self,
+        lx_knowledge_base: KnowledgeBase,
+        yaml_data_loader: DataLoader,
+        demo_kb_config_name: str,
+    ):
+        new = yaml_data_loader.load_knowledge_base(demo_kb_config_name)
+        changed = new.findings["colon_polyp"].model_copy(update={"description": "x"})
+        new.add_shallow_object(changed)
+        diff = lx_knowledge_base.diff_content(new)
+        assert diff.changed == {"findings": ["colon_polyp"]}
+        assert diff.changed_modules == ["lx_findings"]
@@ -0,0 +1,47 @@
+import gzip
+import json
+from pathlib import Path
+
+import yaml
+from pydantic_core import to_json
+
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.models.knowledge_base.knowledge_base import CATEGORY_NAMES
+from lx_dtypes.utils.export.export_knowledge_base import iter_yaml_chunks
+
+
+class TestKnowledgeBaseStreamingExport:
+    def test_yaml_matches_full_dump(self, lx_knowledge_base: KnowledgeBase):
+        dump = lx_knowledge_base.model_dump()
+        streamed = "".join(iter_yaml_chunks(lx_knowledge_base))
+        assert streamed == yaml.dump(dump, Dumper=yaml.CSafeDumper)
+        assert yaml.load(streamed, Loader=yaml.CSafeLoader) == dump
+
+    def test_empty_categories_are_kept(self):
+        kb = KnowledgeBase(name="empty")
+        streamed = "".join(iter_yaml_chunks(kb))
+        assert yaml.safe_load(streamed) == kb.model_dump()
+
+    def test_json_formats(self, lx_knowledge_base: KnowledgeBase, tmp_path: Path):
+        dump = lx_knowledge_base.model_dump()
+
+        json_path = lx_knowledge_base.export(tmp_path, export_format="json")
+        assert json_path.name == "knowledge_base.json"
+        assert json_path.read_bytes() == to_json(dump)
+
+        jsonl_path = lx_knowledge_base.export(tmp_path, export_format="jsonl")
+        lines = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+        header = lines[0]["knowledge_base"]
+        assert header["name"] == lx_knowledge_base.name
+        assert len(lines) - 1 == sum(
+            len(getattr(lx_knowledge_base, category)) for category in CATEGORY_NAMES
+        )
+        finding = next(line for line in lines if line.get("category") == "findings")
+        name = finding["entity"]["name"]
+        assert dump["findings"][name] == finding["entity"]
+
+    def test_gzip_output(self, lx_knowledge_base: KnowledgeBase, tmp_path: Path):
+        plain = lx_knowledge_base.export(tmp_path)
+        compressed = lx_knowledge_base.export(tmp_path, compress=True)
+        assert compressed.name == "knowledge_base.yaml.gz"
+        assert gzip.decompress(compressed.read_bytes()) == plain.read_bytes()
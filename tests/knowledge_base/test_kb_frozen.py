@@ -0,0 +1,65 @@
+import copy
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.models.knowledge_base.frozen import (
+    FrozenDict,
+    FrozenKnowledgeBase,
+    freeze_model,
+)
+from lx_dtypes.models.shallow.finding import FindingShallow
+
+
+class TestFrozenKnowledgeBase:
+    def test_freeze_keeps_content(self, lx_knowledge_base: KnowledgeBase):
+        frozen = lx_knowledge_base.freeze()
+        assert isinstance(frozen, FrozenKnowledgeBase)
+        assert frozen.freeze() is frozen
+        assert frozen.model_dump() == lx_knowledge_base.model_dump()
+        assert frozen.model_dump_json() == lx_knowledge_base.model_dump_json()
+        assert frozen.get_content_hash() == lx_knowledge_base.get_content_hash()
+        assert frozen.get_module_entities() == lx_knowledge_base.get_module_entities()
+
+    def test_entities_are_immutable_and_hashable(
+        self, lx_knowledge_base: KnowledgeBase, finding_name_colon_polyp: str
+    ):
+        frozen = lx_knowledge_base.freeze()
+        finding = frozen.findings[finding_name_colon_polyp]
+        assert isinstance(finding, FindingShallow)
+        assert isinstance(finding.classification_names, tuple)
+        assert frozen.get_category_name(finding) == "findings"
+        assert hash(finding) == hash(freeze_model(finding))
+        assert copy.deepcopy(finding) == finding
+
+        with pytest.raises(ValidationError):
+            finding.name = "other"
+        with pytest.raises(TypeError):
+            frozen.findings["other"] = finding
+        with pytest.raises(ValidationError):
+            frozen.name = "other"
+        with pytest.raises(TypeError):
+            frozen.add_shallow_object(finding)
+
+    def test_queries_and_pickle(
+        self, lx_knowledge_base: KnowledgeBase, finding_name_colon_polyp: str
+    ):
+        frozen = lx_knowledge_base.freeze()
+        assert frozen.search("polyp") == lx_knowledge_base.search("polyp")
+        assert frozen.check_integrity() == lx_knowledge_base.check_integrity()
+
+        restored = pickle.loads(pickle.dumps(frozen))
+        assert type(restored.findings) is FrozenDict
+        finding = restored.findings[finding_name_colon_polyp]
+        assert finding == frozen.findings[finding_name_colon_polyp]
+        assert restored.model_dump() == frozen.model_dump()
+
+    def test_frozen_dict(self):
+        frozen = FrozenDict({"a": (1, 2)})
+        assert frozen == {"a": (1, 2)}
+        assert hash(frozen) == hash(FrozenDict({"a": (1, 2)}))
+        for mutate in (frozen.clear, frozen.popitem, lambda: frozen.update(b=1)):
+            with pytest.raises(TypeError):
+                mutate()
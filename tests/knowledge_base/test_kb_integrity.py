@@ -0,0 +1,79 @@
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.models.shallow import FindingShallow
+from lx_dtypes.models.shallow.classification import ClassificationShallow
+from lx_dtypes.models.shallow.classification_choice import ClassificationChoiceShallow
+
+
+def _build_knowledge_base() -> KnowledgeBase:
+    kb = KnowledgeBase(name="integrity")
+    for choice_name in ("paris_1s", "paris_2a", "unused_choice"):
+        kb.add_shallow_object(ClassificationChoiceShallow(name=choice_name))
+    kb.add_shallow_object(
+        ClassificationShallow(
+            name="paris", choice_names=["paris_1s", "paris_2a", "paris_1s"]
+        )
+    )
+    kb.add_shallow_object(
+        FindingShallow(
+            name="colon_polyp", classification_names=["paris", "missing_class"]
+        )
+    )
+    return kb
+
+
+class TestKnowledgeBaseIntegrity:
+    def test_report_lists_dangling_duplicate_and_orphaned_names(self):
+        report = _build_knowledge_base().check_integrity()
+
+        assert report.has_errors()
+        assert report.checked_entities == 5
+        assert report.checked_references == 5
+        assert [(d.name, d.field, d.target_name) for d in report.dangling] == [
+            ("colon_polyp", "classification_names", "missing_class")
+        ]
+        assert [
+            (d.name, d.target_name, d.count) for d in report.duplicate_references
+        ] == [("paris", "paris_1s", 2)]
+        orphaned = {(o.category, o.name) for o in report.orphaned}
+        assert ("classification_choices", "unused_choice") in orphaned
+        assert ("classifications", "paris") not in orphaned
+
+    def test_dangling_references_are_found_through_reverse_indexes(self):
+        kb = _build_knowledge_base()
+        # built before the findings below are added, kept up to date by the kb
+        kb.get_reverse_index("findings", "classification_names")
+        for name, classification_names in (
+            ("colon_ulcer", ["missing_class", "missing_class"]),
+            ("colon_mass", ["paris"]),
+            ("colon_stenosis", ["other_missing"]),
+        ):
+            kb.add_shallow_object(
+                FindingShallow(name=name, classification_names=classification_names)
+            )
+
+        report = kb.check_integrity()
+        assert [(d.name, d.target_name) for d in report.dangling] == [
+            ("colon_polyp", "missing_class"),
+            ("colon_ulcer", "missing_class"),
+            ("colon_ulcer", "missing_class"),
+            ("colon_stenosis", "other_missing"),
+        ]
+
+    def test_consistent_knowledge_base_has_no_errors(self):
+        kb = _build_knowledge_base()
+        kb.classifications["missing_class"] = ClassificationShallow(
+            name="missing_class"
+        )
+        kb.classifications["paris"].choice_names = ["paris_1s", "paris_2a"]
+
+        report = kb.check_integrity()
+        assert not report.has_errors()
+
+    def test_bundled_knowledge_base_is_checked(self, lx_knowledge_base: KnowledgeBase):
+        report = lx_knowledge_base.check_integrity()
+
+        assert report.checked_entities > 0
+        for dangling in report.dangling:
+            assert dangling.target_name not in getattr(
+                lx_knowledge_base, dangling.target_category
+            )
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from lx_dtypes.models.knowledge_base import DataLoader, KnowledgeBase
+from lx_dtypes.models.knowledge_base.layered import LayeredEntityDict
+from lx_dtypes.models.shallow import FindingShallow
+
+
+class TestKnowledgeBaseLayered:
+    def test_layered_load_matches_merged_load(
+        self,
+        yaml_repo_dirs: list[Path],
+        demo_kb_config_name: str,
+        lx_knowledge_base: KnowledgeBase,
+    ):
+        loader = DataLoader(input_dirs=yaml_repo_dirs, layered=True)
+        loader.load_module_configs()
+        kb = loader.load_knowledge_base(demo_kb_config_name)
+
+        assert isinstance(kb.findings, LayeredEntityDict)
+        assert kb.count_entries() == lx_knowledge_base.count_entries()
+        assert kb.model_dump() == lx_knowledge_base.model_dump()
+        assert list(kb.findings) == list(lx_knowledge_base.findings)
+
+        kb.flatten_layers()
+        assert type(kb.findings) is dict
+        assert kb.model_dump() == lx_knowledge_base.model_dump()
+
+    def test_module_layers_are_shared(
+        self, yaml_repo_dirs: list[Path], demo_kb_config_name: str
+    ):
+        loader = DataLoader(input_dirs=yaml_repo_dirs, layered=True)
+        loader.load_module_configs()
+        first_kb = loader.load_knowledge_base(demo_kb_config_name)
+        second_kb = loader.load_knowledge_base("example_terminology")
+
+        assert isinstance(first_kb.findings, LayeredEntityDict)
+        assert isinstance(second_kb.findings, LayeredEntityDict)
+        shared = [
+            layer
+            for layer in second_kb.findings.layers
+            if any(layer is known for known in first_kb.findings.layers)
+        ]
+        assert shared
+        assert loader.get_module_knowledge_base("lx_findings").findings in shared
+
+    def test_layer_override_and_local_writes(self, finding_name_colon_polyp: str):
+        lower = {"shared": FindingShallow(name="shared", description="lower")}
+        upper = {"shared": FindingShallow(name="shared", description="upper")}
+        view: LayeredEntityDict[FindingShallow] = LayeredEntityDict()
+        view.add_layer(lower)
+        view.add_layer(upper)
+        assert view["shared"].description == "upper"
+
+        del view["shared"]
+        assert "shared" not in view
+        assert "shared" in upper and "shared" in lower
+
+        view[finding_name_colon_polyp] = FindingShallow(name=finding_name_colon_polyp)
+        assert list(view) == [finding_name_colon_polyp]
+        assert finding_name_colon_polyp not in upper
+
+        view.add_layer(lower)
+        assert view.flatten()["shared"].description == "lower"
+
+    def test_len_is_kept_up_to_date(self):
+        def _findings(*names: str) -> dict[str, FindingShallow]:
+            return {name: FindingShallow(name=name) for name in names}
+
+        view: LayeredEntityDict[FindingShallow] = LayeredEntityDict(_findings("a"))
+        steps = [
+            lambda: view.add_layer(_findings("a", "b", "c")),
+            lambda: view.add_layer(_findings("c", "d")),
+            lambda: view.__setitem__("e", FindingShallow(name="e")),
+            lambda: view.__setitem__("b", FindingShallow(name="b")),
+            lambda: view.__delitem__("c"),
+            lambda: view.__delitem__("e"),
+            lambda: view.__setitem__("c", FindingShallow(name="c")),
+            lambda: view.add_layer(_findings("c", "e")),
+        ]
+        for step in steps:
+            step()
+            assert len(view) == len(list(view))
+        assert sorted(view) == ["a", "b", "c", "d", "e"]
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from lx_dtypes.models.knowledge_base import DataLoader, KnowledgeBase
+from lx_dtypes.models.shallow import CitationShallow, FindingShallow
+
+
+class TestKnowledgeBaseLazy:
+    def test_lazy_load_materializes_on_access(
+        self,
+        yaml_repo_dirs: list[Path],
+        demo_kb_config_name: str,
+        finding_name_colon_polyp: str,
+    ):
+        loader = DataLoader(input_dirs=yaml_repo_dirs, lazy=True)
+        loader.load_module_configs()
+        kb = loader.load_knowledge_base(demo_kb_config_name)
+
+        assert sum(kb.count_materialized().values()) == 0
+        assert finding_name_colon_polyp in kb.findings
+
+        finding = kb.get_finding(finding_name_colon_polyp)
+        assert isinstance(finding, FindingShallow)
+        assert finding.source_file is not None
+        assert kb.findings[finding_name_colon_polyp] is finding
+
+        citation_name = next(iter(kb.citations))
+        assert isinstance(kb.citations[citation_name], CitationShallow)
+
+        counts = kb.count_materialized()
+        assert counts["findings"] == 1
+        assert counts["citations"] == 1
+        assert sum(counts.values()) == 2
+
+    def test_lazy_load_matches_eager_load(
+        self,
+        yaml_repo_dirs: list[Path],
+        demo_kb_config_name: str,
+        lx_knowledge_base: KnowledgeBase,
+    ):
+        loader = DataLoader(input_dirs=yaml_repo_dirs, lazy=True)
+        loader.load_module_configs()
+        kb = loader.load_knowledge_base(demo_kb_config_name)
+
+        assert kb.count_entries() == lx_knowledge_base.count_entries()
+        assert kb.model_dump() == lx_knowledge_base.model_dump()
+        assert kb.count_materialized() == lx_knowledge_base.count_materialized()
@@ -0,0 +1,122 @@
+import mmap
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from lx_dtypes.models.knowledge_base import DataLoader, KnowledgeBase
+from lx_dtypes.models.knowledge_base.mapped import (
+    MappedEntityDict,
+    get_mapped_path,
+    open_mapped_knowledge_base,
+    write_mapped_knowledge_base,
+)
+
+
+class TestMappedKnowledgeBase:
+    def test_roundtrip_decodes_lazily(
+        self,
+        lx_knowledge_base: KnowledgeBase,
+        finding_name_colon_polyp: str,
+        tmp_path: Path,
+    ):
+        mapped_path = write_mapped_knowledge_base(
+            lx_knowledge_base, tmp_path / "kb.kb.map", key="abc"
+        )
+        assert open_mapped_knowledge_base(mapped_path, key="other") is None
+
+        kb = open_mapped_knowledge_base(mapped_path, key="abc")
+        assert kb is not None
+        findings = kb.findings
+        assert isinstance(findings, MappedEntityDict)
+        assert set(findings) == set(lx_knowledge_base.findings)
+        assert findings.count_decoded() == 0
+
+        finding = kb.get_finding(finding_name_colon_polyp)
+        assert finding.model_dump() == (
+            lx_knowledge_base.findings[finding_name_colon_polyp].model_dump()
+        )
+        assert findings.count_decoded() == 1
+        assert findings[finding_name_colon_polyp] is finding
+
+        assert kb.model_dump() == lx_knowledge_base.model_dump()
+        assert kb.get_content_hash() == lx_knowledge_base.get_content_hash()
+        with pytest.raises(TypeError):
+            kb.add_shallow_object(finding)
+
+    def test_invalid_file(self, tmp_path: Path):
+        assert open_mapped_knowledge_base(tmp_path / "missing.kb.map") is None
+        broken = tmp_path / "broken.kb.map"
+        broken.write_bytes(b"not a mapped knowledge base")
+        assert open_mapped_knowledge_base(broken) is None
+
+    def test_rejected_files_are_unmapped(
+        self,
+        lx_knowledge_base: KnowledgeBase,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        buffers: List[mmap.mmap] = []
+
+        class _RecordingMap(mmap.mmap):
+            def __init__(self, *args: object, **kwargs: object) -> None:
+                buffers.append(self)
+
+        monkeypatch.setattr(mmap, "mmap", _RecordingMap)
+        mapped_path = write_mapped_knowledge_base(
+            lx_knowledge_base, tmp_path / "kb.kb.map", key="abc"
+        )
+        assert open_mapped_knowledge_base(mapped_path, key="other") is None
+
+        truncated = tmp_path / "truncated.kb.map"
+        content = mapped_path.read_bytes()
+        # valid magic and trailer, header cut short
+        truncated.write_bytes(content[:8] + content[-24:])
+        assert open_mapped_knowledge_base(truncated) is None
+        assert len(buffers) == 2
+        assert all(buffer.closed for buffer in buffers)
+
+        kb = open_mapped_knowledge_base(mapped_path, key="abc")
+        assert kb is not None
+        assert not buffers[-1].closed
+
+    def test_mapped_dumps_are_byte_identical(
+        self, lx_knowledge_base: KnowledgeBase, tmp_path: Path
+    ):
+        mapped_path = write_mapped_knowledge_base(
+            lx_knowledge_base, tmp_path / "kb.kb.map"
+        )
+        kb = open_mapped_knowledge_base(mapped_path)
+        assert kb is not None
+        # source_file and created_at are not part of the dump
+        exclude = {"source_file", "created_at"}
+        for name, finding in lx_knowledge_base.findings.items():
+            assert kb.findings[name].model_dump_json(
+                exclude=exclude
+            ) == finding.model_dump_json(exclude=exclude)
+        assert kb.model_dump_json(exclude=exclude) == (
+            lx_knowledge_base.model_dump_json(exclude=exclude)
+        )
+
+    def test_data_loader_maps_once(
+        self,
+        yaml_repo_dirs: list[Path],
+        demo_kb_config_name: str,
+        lx_knowledge_base: KnowledgeBase,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        loader = DataLoader(input_dirs=yaml_repo_dirs, mapped_dir=tmp_path)
+        loader.load_module_configs()
+        kb = loader.load_knowledge_base(demo_kb_config_name)
+        assert get_mapped_path(tmp_path, demo_kb_config_name).is_file()
+        assert isinstance(kb.findings, MappedEntityDict)
+
+        def _fail(*args: object, **kwargs: object) -> KnowledgeBase:
+            raise AssertionError("attaching must not parse YAML files")
+
+        monkeypatch.setattr(KnowledgeBase, "create_from_config", _fail)
+        worker = DataLoader(input_dirs=yaml_repo_dirs, mapped_dir=tmp_path)
+        worker.load_module_configs()
+        attached = worker.load_knowledge_base(demo_kb_config_name)
+        assert attached.model_dump() == lx_knowledge_base.model_dump()
@@ -0,0 +1,81 @@
+from typing import Any, Dict
+
+from pydantic_core import to_json
+
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.models.knowledge_base.knowledge_base import CATEGORY_NAMES
+from lx_dtypes.models.knowledge_base.lazy import LazyEntityDict
+from lx_dtypes.models.shallow import FindingShallow
+
+
+def _dump_per_entity(kb: KnowledgeBase) -> Dict[str, Any]:
+    """Dump every entity on its own, like the former per-category serializers."""
+    dump: Dict[str, Any] = {}
+    for field in KnowledgeBase.model_fields:
+        if field in CATEGORY_NAMES:
+            dump[field] = {
+                name: entity.model_dump() for name, entity in getattr(kb, field).items()
+            }
+        elif field == "config":
+            if kb.config is not None:
+                dump[field] = kb.config.model_dump()
+        elif field not in ("source_file", "created_at"):
+            value = getattr(kb, field)
+            if value is not None:
+                dump[field] = value
+    return dump
+
+
+def _dump_json_per_entity(kb: KnowledgeBase) -> bytes:
+    """Dump like the former per-category serializers, keeping top-level defaults."""
+    dump: Dict[str, Any] = {}
+    for field in KnowledgeBase.model_fields:
+        value = getattr(kb, field)
+        if field in CATEGORY_NAMES:
+            dump[field] = {name: entity.model_dump() for name, entity in value.items()}
+        elif field == "config":
+            dump[field] = None if value is None else value.model_dump()
+        else:
+            dump[field] = value
+    return to_json(dump)
+
+
+class TestKnowledgeBaseModelDump:
+    def test_single_pass_matches_per_entity_dump(
+        self, lx_knowledge_base: KnowledgeBase
+    ):
+        dump = lx_knowledge_base.model_dump()
+        assert to_json(dump) == to_json(_dump_per_entity(lx_knowledge_base))
+
+    def test_json_dump_keeps_per_entity_output(self, lx_knowledge_base: KnowledgeBase):
+        assert lx_knowledge_base.model_dump_json().encode() == _dump_json_per_entity(
+            lx_knowledge_base
+        )
+        assert b'"created_at":' in lx_knowledge_base.model_dump_json().encode()
+
+    def test_empty_and_non_dict_categories(self):
+        kb = KnowledgeBase(name="dump")
+        kb.add_shallow_object(FindingShallow(name="colon_polyp", tags=["b", "a"]))
+        kb.enable_lazy_loading()
+        assert isinstance(kb.findings, LazyEntityDict)
+
+        dump = kb.model_dump()
+        assert list(dump) == ["name", "name_de", "name_en", *CATEGORY_NAMES]
+        assert dump["citations"] == {}
+        assert dump["findings"]["colon_polyp"] == {
+            "name": "colon_polyp",
+            "name_de": "colon_polyp",
+            "name_en": "colon_polyp",
+            "tags": ["a", "b"],
+        }
+        assert kb.model_dump_json().encode() == _dump_json_per_entity(kb)
+        assert '"config":null' in kb.model_dump_json()
+
+    def test_exclude_is_merged(self, lx_knowledge_base: KnowledgeBase):
+        dump = lx_knowledge_base.model_dump(exclude={"findings", "config"})
+        assert "findings" not in dump
+        assert "config" not in dump
+        assert "created_at" not in dump
+        for entity in dump["classifications"].values():
+            assert "created_at" not in entity
+            assert "source_file" not in entity
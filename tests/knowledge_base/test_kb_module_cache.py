@@ -0,0 +1,92 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from lx_dtypes.models.knowledge_base import DataLoader, KnowledgeBase
+
+
+class TestDataLoaderModuleCache:
+    def test_overlapping_profiles_reuse_modules(
+        self,
+        yaml_repo_dirs: list[Path],
+        demo_kb_config_name: str,
+        lx_knowledge_base: KnowledgeBase,
+    ):
+        loader = DataLoader(input_dirs=yaml_repo_dirs, module_cache_size=64)
+        loader.load_module_configs()
+        first_modules = loader.get_initialized_config_view(demo_kb_config_name).modules
+        second_modules = loader.get_initialized_config_view(
+            "example_terminology"
+        ).modules
+
+        kb = loader.load_knowledge_base(demo_kb_config_name)
+        assert kb.model_dump() == lx_knowledge_base.model_dump()
+        stats = loader.get_module_cache_stats()
+        assert (stats.hits, stats.misses) == (0, len(first_modules))
+
+        loader.load_knowledge_base("example_terminology")
+        stats = loader.get_module_cache_stats()
+        shared = set(first_modules) & set(second_modules)
+        assert shared
+        assert stats.hits == len(shared)
+        assert stats.misses == len(first_modules) + len(second_modules) - len(shared)
+
+        kb = loader.load_knowledge_base(demo_kb_config_name)
+        assert kb.model_dump() == lx_knowledge_base.model_dump()
+        assert loader.get_module_cache_stats().hits == len(shared) + len(first_modules)
+
+    def test_cache_is_bounded(
+        self, yaml_repo_dirs: list[Path], demo_kb_config_name: str
+    ):
+        loader = DataLoader(input_dirs=yaml_repo_dirs, module_cache_size=2)
+        loader.load_module_configs()
+        loader.load_knowledge_base(demo_kb_config_name)
+
+        stats = loader.get_module_cache_stats()
+        module_count = len(
+            loader.get_initialized_config_view(demo_kb_config_name).modules
+        )
+        assert stats.size == 2
+        assert stats.evictions == module_count - 2
+
+    def test_changed_file_misses(
+        self, tmp_path: Path, write_module_tree: Callable[..., Path]
+    ):
+        data_file = write_module_tree(tmp_path)
+        loader = DataLoader(input_dirs=[tmp_path], module_cache_size=4)
+        loader.load_module_configs()
+        loader.load_knowledge_base("sample_kb")
+
+        data_file.write_text(
+            "- model: finding\n  name: colon_polyp\n- model: finding\n  name: ulcer\n",
+            encoding="utf-8",
+        )
+        stat = data_file.stat()
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        kb = loader.load_knowledge_base("sample_kb")
+        stats = loader.get_module_cache_stats()
+        assert sorted(kb.findings) == ["colon_polyp", "ulcer"]
+        assert (stats.hits, stats.misses, stats.size) == (0, 2, 1)
+
+    def test_parallel_build_shares_one_cache(
+        self,
+        yaml_repo_dirs: list[Path],
+        demo_kb_config_name: str,
+        lx_knowledge_base: KnowledgeBase,
+    ):
+        loader = DataLoader(
+            input_dirs=yaml_repo_dirs, module_cache_size=64, module_workers=4
+        )
+        loader.load_module_configs()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            caches = list(pool.map(lambda _: loader.get_module_cache(), range(32)))
+        assert all(cache is caches[0] for cache in caches)
+
+        kb = loader.load_knowledge_base(demo_kb_config_name)
+        assert kb.model_dump() == lx_knowledge_base.model_dump()
+        modules = loader.get_initialized_config_view(demo_kb_config_name).modules
+        stats = loader.get_module_cache_stats()
+        assert stats.size == len(modules)
+        assert stats.misses == len(modules)
@@ -0,0 +1,82 @@
+from concurrent.futures import Executor
+from pathlib import Path
+
+import pytest
+
+from lx_dtypes.models import KnowledgeBaseConfig
+from lx_dtypes.models.base_models.path import FilesAndDirsModel
+from lx_dtypes.models.knowledge_base import DataLoader, KnowledgeBase
+from lx_dtypes.utils import parser
+from lx_dtypes.utils.dataloader import ParseExecutorKind
+from lx_dtypes.utils.parser import create_parse_executor, parse_shallow_objects
+
+
+class TestKnowledgeBaseParallelParse:
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_parallel_build_matches_sequential(
+        self, yaml_data_loader: DataLoader, executor: ParseExecutorKind
+    ):
+        config = yaml_data_loader.get_initialized_config("lx_classification_choices")
+        sequential_kb = KnowledgeBase.create_from_config(config)
+        parallel_kb = KnowledgeBase.create_from_config(
+            config, executor=executor, max_workers=2
+        )
+
+        assert parallel_kb.model_dump() == sequential_kb.model_dump()
+        assert list(parallel_kb.classification_choices) == list(
+            sequential_kb.classification_choices
+        )
+
+    def test_parallel_build_last_file_wins(self, tmp_path: Path):
+        files = []
+        for idx in range(4):
+            data_file = tmp_path / f"{idx:02d}_findings.yaml"
+            data_file.write_text(
+                f"- model: finding\n  name: shared\n  description: file {idx}\n",
+                encoding="utf-8",
+            )
+            files.append(data_file)
+
+        config = KnowledgeBaseConfig(
+            name="parallel", version="1.0.0", data=FilesAndDirsModel(files=files)
+        )
+        kb = KnowledgeBase.create_from_config(config, executor="thread", max_workers=4)
+
+        assert kb.get_finding("shared").description == "file 3"
+
+    def test_shared_pool_matches_sequential(self, yaml_data_loader: DataLoader):
+        config = yaml_data_loader.get_initialized_config("lx_classification_choices")
+        files = config.data.get_files_with_suffix(".yaml")
+        sequential = [
+            [obj.model_dump() for obj in objects]
+            for objects in parse_shallow_objects(files)
+        ]
+        with create_parse_executor("process", max_workers=2) as pool:
+            for _ in range(2):
+                parsed = [
+                    [obj.model_dump() for obj in objects]
+                    for objects in parse_shallow_objects(files, pool, min_files=0)
+                ]
+                assert parsed == sequential
+
+    def test_data_loader_creates_one_pool_per_load(
+        self,
+        yaml_repo_dirs: list[Path],
+        demo_kb_config_name: str,
+        lx_knowledge_base: KnowledgeBase,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        created: list[Executor] = []
+
+        def _create(kind: ParseExecutorKind, max_workers: int | None) -> Executor:
+            pool = create_parse_executor(kind, max_workers=max_workers)
+            created.append(pool)
+            return pool
+
+        monkeypatch.setattr(parser, "create_parse_executor", _create)
+        loader = DataLoader(input_dirs=yaml_repo_dirs, parse_executor="thread")
+        loader.load_module_configs()
+        kb = loader.load_knowledge_base(demo_kb_config_name)
+
+        assert len(created) == 1
+        assert kb.model_dump() == lx_knowledge_base.model_dump()
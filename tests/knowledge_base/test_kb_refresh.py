@@ -0,0 +1,100 @@
+import os
+from pathlib import Path
+
+from lx_dtypes.models.knowledge_base import DataLoader, KnowledgeBase
+
+
+def _write(path: Path, content: str) -> None:
+    existed = path.exists()
+    previous_mtime = path.stat().st_mtime_ns if existed else 0
+    path.write_text(content, encoding="utf-8")
+    if existed:
+        # make sure the edit is visible even on coarse mtime resolution
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, previous_mtime + 1_000_000_000))
+
+
+def _findings_yaml(*entries: tuple[str, str]) -> str:
+    return "".join(
+        f"- model: finding\n  name: {name}\n  description: {description}\n"
+        for name, description in entries
+    )
+
+
+def _load_sample_kb(root: Path) -> tuple[KnowledgeBase, Path]:
+    module_dir = root / "sample_module"
+    data_dir = module_dir / "data"
+    (data_dir / "extra").mkdir(parents=True)
+    # explicit files fix the load order, new files are discovered in ./data/extra
+    (module_dir / "config.yaml").write_text(
+        "name: sample_module\nversion: 0.1.0\ndata:\n"
+        "  files:\n    - ./data/01_findings.yaml\n    - ./data/02_findings.yaml\n"
+        "  dirs:\n    - ./data/extra\n",
+        encoding="utf-8",
+    )
+    (root / "config.yaml").write_text(
+        "name: sample_kb\nversion: 0.1.0\nmodules:\n  - sample_module\n",
+        encoding="utf-8",
+    )
+    _write(
+        data_dir / "01_findings.yaml",
+        _findings_yaml(("colon_polyp", "first"), ("shared", "from 01")),
+    )
+    _write(
+        data_dir / "02_findings.yaml",
+        _findings_yaml(("ulcer", "second"), ("shared", "from 02")),
+    )
+
+    loader = DataLoader(input_dirs=[root])
+    loader.load_module_configs()
+    return loader.load_knowledge_base("sample_kb"), data_dir
+
+
+class TestKnowledgeBaseRefresh:
+    def test_refresh_without_changes(self, tmp_path: Path):
+        kb, _ = _load_sample_kb(tmp_path)
+
+        result = kb.refresh()
+
+        assert not result.has_changes()
+        assert result.upserted_entities == 0
+
+    def test_refresh_changed_added_and_removed_entities(self, tmp_path: Path):
+        kb, data_dir = _load_sample_kb(tmp_path)
+        ulcer = kb.get_finding("ulcer")
+
+        _write(
+            data_dir / "01_findings.yaml",
+            _findings_yaml(("shared", "edited 01"), ("diverticulum", "new")),
+        )
+        _write(
+            data_dir / "extra" / "03_findings.yaml",
+            _findings_yaml(("stenosis", "third")),
+        )
+
+        result = kb.refresh()
+
+        assert result.changed_files == [data_dir / "01_findings.yaml"]
+        assert result.added_files == [data_dir / "extra" / "03_findings.yaml"]
+        assert result.removed_entities == 1
+        assert "colon_polyp" not in kb.findings
+        assert kb.get_finding("diverticulum").description == "new"
+        assert kb.get_finding("stenosis").description == "third"
+        # the later file still wins and untouched entities are not re-created
+        assert kb.get_finding("shared").description == "from 02"
+        assert kb.get_finding("ulcer") is ulcer
+
+    def test_refresh_resurfaces_shadowed_entity(self, tmp_path: Path):
+        kb, data_dir = _load_sample_kb(tmp_path)
+
+        _write(data_dir / "02_findings.yaml", _findings_yaml(("ulcer", "second")))
+        result = kb.refresh()
+
+        assert result.removed_entities == 0
+        assert kb.get_finding("shared").description == "from 01"
+
+        (data_dir / "02_findings.yaml").unlink()
+        result = kb.refresh()
+
+        assert result.removed_files == [data_dir / "02_findings.yaml"]
+        assert "ulcer" not in kb.findings
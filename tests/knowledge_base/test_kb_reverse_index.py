@@ -0,0 +1,70 @@
+import pytest
+
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.models.knowledge_base.references import REFERENCE_FIELDS
+from lx_dtypes.models.shallow import ExaminationShallow, FindingShallow
+
+
+class TestKnowledgeBaseReverseIndex:
+    def test_reverse_indexes_match_full_scan(self, lx_knowledge_base: KnowledgeBase):
+        for category, fields in REFERENCE_FIELDS.items():
+            entities = getattr(lx_knowledge_base, category)
+            for field in fields:
+                expected: dict[str, list[str]] = {}
+                for name, entity in entities.items():
+                    for target_name in getattr(entity, field):
+                        expected.setdefault(target_name, []).append(name)
+                for target_name, names in expected.items():
+                    assert (
+                        lx_knowledge_base.get_referencing_names(
+                            category, field, target_name
+                        )
+                        == names
+                    )
+
+    def test_named_queries(
+        self,
+        lx_knowledge_base: KnowledgeBase,
+        finding_name_colon_polyp: str,
+        classification_name_colon_lesion_paris: str,
+    ):
+        assert finding_name_colon_polyp in (
+            lx_knowledge_base.get_findings_by_classification(
+                classification_name_colon_lesion_paris
+            )
+        )
+        paris = lx_knowledge_base.get_classification(
+            classification_name_colon_lesion_paris
+        )
+        for choice_name in paris.choice_names:
+            assert classification_name_colon_lesion_paris in (
+                lx_knowledge_base.get_classifications_by_choice(choice_name)
+            )
+        assert lx_knowledge_base.get_findings_by_classification("missing") == []
+        with pytest.raises(KeyError):
+            lx_knowledge_base.get_referencing_names("findings", "tags", "x")
+
+    def test_indexes_follow_updates_and_imports(self):
+        kb = KnowledgeBase(name="reverse")
+        kb.add_shallow_object(
+            FindingShallow(name="colon_polyp", classification_names=["paris"])
+        )
+        assert kb.get_findings_by_classification("paris") == ["colon_polyp"]
+        assert kb.get_examinations_by_finding("colon_polyp") == []
+
+        kb.add_shallow_object(
+            FindingShallow(name="colon_polyp", classification_names=["nice"])
+        )
+        assert kb.get_findings_by_classification("paris") == []
+        assert kb.get_findings_by_classification("nice") == ["colon_polyp"]
+
+        other = KnowledgeBase(name="other")
+        other.add_shallow_object(
+            FindingShallow(name="ulcer", classification_names=["nice"])
+        )
+        other.add_shallow_object(
+            ExaminationShallow(name="colonoscopy", finding_names=["ulcer"])
+        )
+        kb.import_knowledge_base(other)
+        assert kb.get_findings_by_classification("nice") == ["colon_polyp", "ulcer"]
+        assert kb.get_examinations_by_finding("ulcer") == ["colonoscopy"]
@@ -0,0 +1,79 @@
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.models.knowledge_base.search import normalize_search_text
+from lx_dtypes.models.shallow import ExaminationShallow, FindingShallow
+
+
+def _build_search_kb() -> KnowledgeBase:
+    kb = KnowledgeBase(name="search")
+    kb.add_shallow_object(
+        FindingShallow(
+            name="colon_polyp",
+            name_de="Kolonpolyp",
+            name_en="Colon polyp",
+            tags=["lesion"],
+        )
+    )
+    kb.add_shallow_object(
+        FindingShallow(
+            name="colon_ulcer",
+            name_de="Kolonulkus",
+            description="Läsion der Schleimhaut",
+        )
+    )
+    kb.add_shallow_object(
+        ExaminationShallow(name="colonoscopy", name_de="Koloskopie", tags=["lesion"])
+    )
+    return kb
+
+
+class TestKnowledgeBaseSearch:
+    def test_normalize(self):
+        assert normalize_search_text("Colon_Polyp") == "colon polyp"
+        assert normalize_search_text("  Läsion, Straße ") == "lasion strasse"
+
+    def test_prefix_search(self):
+        kb = _build_search_kb()
+        hits = kb.search("kolon", fuzzy=False)
+        assert [hit.name for hit in hits] == ["colon_polyp", "colon_ulcer"]
+        assert {hit.match for hit in hits} == {"prefix"}
+
+        hits = kb.search("Colon", fuzzy=False)
+        assert [hit.name for hit in hits][:2] == ["colon_polyp", "colon_ulcer"]
+        assert kb.search("colon polyp")[0].score == 1.0
+        assert kb.search("polyp")[0].name == "colon_polyp"
+
+    def test_substring_and_fuzzy_search(self):
+        kb = _build_search_kb()
+        hits = kb.search("schleim")
+        assert hits[0].name == "colon_ulcer"
+        assert hits[0].match == "substring"
+
+        hits = kb.search("colon polip", fuzzy=True)
+        assert hits[0].name == "colon_polyp"
+        assert hits[0].match == "fuzzy"
+        assert kb.search("colon polip", fuzzy=False) == []
+
+    def test_restrictions(self):
+        kb = _build_search_kb()
+        assert [hit.name for hit in kb.search("kolo", categories=["examinations"])] == [
+            "colonoscopy"
+        ]
+        assert [hit.name for hit in kb.search("kolo", tags=["lesion"])] == [
+            "colon_polyp",
+            "colonoscopy",
+        ]
+        assert kb.search("kolo", categories=["units"]) == []
+
+    def test_index_follows_updates(self, lx_knowledge_base: KnowledgeBase):
+        kb = _build_search_kb()
+        index = kb.get_search_index()
+        assert kb.get_search_index() is index
+        kb.add_shallow_object(
+            FindingShallow(name="gastric_ulcer", name_de="Magenulkus")
+        )
+        assert kb.get_search_index() is not index
+        assert kb.search("magen")[0].name == "gastric_ulcer"
+
+        finding_hits = lx_knowledge_base.search("colon", categories=["findings"])
+        assert finding_hits
+        assert all(hit.category == "findings" for hit in finding_hits)
@@ -0,0 +1,99 @@
+import os
+from itertools import permutations
+from pathlib import Path
+from typing import Callable, Tuple
+
+import pytest
+
+from lx_dtypes.models.knowledge_base import DataLoader, KnowledgeBase
+from lx_dtypes.models.knowledge_base.layered import LayeredEntityDict
+from lx_dtypes.models.knowledge_base.lazy import LazyEntityDict
+from lx_dtypes.models.knowledge_base.snapshot import (
+    get_snapshot_path,
+    read_knowledge_base_snapshot,
+)
+
+
+class TestKnowledgeBaseSnapshot:
+    def test_snapshot_roundtrip(
+        self,
+        yaml_repo_dirs: list[Path],
+        demo_kb_config_name: str,
+        lx_knowledge_base: KnowledgeBase,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        loader = DataLoader(input_dirs=yaml_repo_dirs, snapshot_dir=tmp_path)
+        loader.load_module_configs()
+
+        cold_kb = loader.load_knowledge_base(demo_kb_config_name)
+        assert get_snapshot_path(tmp_path, demo_kb_config_name).exists()
+        assert cold_kb.model_dump() == lx_knowledge_base.model_dump()
+
+        def _fail(*args: object, **kwargs: object) -> KnowledgeBase:
+            raise AssertionError("warm load must not parse YAML files")
+
+        monkeypatch.setattr(KnowledgeBase, "create_from_config", _fail)
+        warm_kb = loader.load_knowledge_base(demo_kb_config_name)
+        assert warm_kb.model_dump() == cold_kb.model_dump()
+
+    def test_snapshot_invalidated_by_changed_input(
+        self, tmp_path: Path, write_module_tree: Callable[..., Path]
+    ):
+        data_root = tmp_path / "data"
+        data_file = write_module_tree(data_root)
+        snapshot_dir = tmp_path / "snapshots"
+
+        loader = DataLoader(input_dirs=[data_root], snapshot_dir=snapshot_dir)
+        loader.load_module_configs()
+        kb = loader.load_knowledge_base("sample_kb")
+        assert list(kb.findings) == ["colon_polyp"]
+
+        data_file.write_text(
+            "- model: finding\n  name: colon_polyp\n- model: finding\n  name: ulcer\n",
+            encoding="utf-8",
+        )
+        stat = data_file.stat()
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        kb = loader.load_knowledge_base("sample_kb")
+        assert sorted(kb.findings) == ["colon_polyp", "ulcer"]
+
+    def test_snapshot_is_keyed_by_build_mode(
+        self, tmp_path: Path, write_module_tree: Callable[..., Path]
+    ):
+        data_root = tmp_path / "data"
+        write_module_tree(data_root)
+
+        def _load(snapshot_dir: Path, mode: Tuple[bool, bool]) -> KnowledgeBase:
+            lazy, layered = mode
+            loader = DataLoader(
+                input_dirs=[data_root],
+                snapshot_dir=snapshot_dir,
+                lazy=lazy,
+                layered=layered,
+            )
+            loader.load_module_configs()
+            return loader.load_knowledge_base("sample_kb")
+
+        def _category_type(mode: Tuple[bool, bool]) -> type:
+            lazy, layered = mode
+            if layered:
+                return LayeredEntityDict
+            return LazyEntityDict if lazy else dict
+
+        # (lazy, layered); each loader gets the category type it builds
+        modes = [(False, False), (True, False), (False, True)]
+        for index, (first, second) in enumerate(permutations(modes, 2)):
+            snapshot_dir = tmp_path / f"snapshots_{index}"
+            for mode in (first, second, first):
+                kb = _load(snapshot_dir, mode)
+                assert type(kb.findings) is _category_type(mode)
+                assert list(kb.findings) == ["colon_polyp"]
+
+    def test_read_snapshot_rejects_foreign_key(self, tmp_path: Path):
+        snapshot_path = get_snapshot_path(tmp_path, "missing")
+        assert read_knowledge_base_snapshot(snapshot_path, "key") is None
+
+        snapshot_path.write_bytes(b"not a pickle")
+        assert read_knowledge_base_snapshot(snapshot_path, "key") is None
@@ -0,0 +1,98 @@
+from array import array
+
+import pytest
+
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.models.knowledge_base.knowledge_base import CATEGORY_NAMES
+from lx_dtypes.models.knowledge_base.references import REFERENCE_FIELDS
+from lx_dtypes.models.knowledge_base.symbols import MISSING_ID, SymbolRelation
+from lx_dtypes.models.shallow import (
+    ClassificationChoiceShallow,
+    ClassificationShallow,
+)
+
+
+class TestKnowledgeBaseSymbolTable:
+    def test_ids_round_trip(self, lx_knowledge_base: KnowledgeBase):
+        table = lx_knowledge_base.get_symbol_table()
+        for category in CATEGORY_NAMES:
+            names = list(getattr(lx_knowledge_base, category))
+            assert table.categories[category].names == names
+            for entity_id, name in enumerate(names):
+                assert table.get_id(category, name) == entity_id
+                assert table.get_name(category, entity_id) == name
+        assert lx_knowledge_base.get_symbol_table() is table
+
+    def test_relations_match_reference_fields(self, lx_knowledge_base: KnowledgeBase):
+        table = lx_knowledge_base.get_symbol_table()
+        for category, fields in REFERENCE_FIELDS.items():
+            entities = getattr(lx_knowledge_base, category)
+            for field, target_category in fields.items():
+                relation = table.get_relation(category, field)
+                assert isinstance(relation.targets, array)
+                targets = getattr(lx_knowledge_base, target_category)
+                for name, entity in entities.items():
+                    defined = [t for t in getattr(entity, field) if t in targets]
+                    assert table.get_related_names(category, field, name) == defined
+        with pytest.raises(KeyError):
+            table.get_relation("findings", "tags")
+
+    def test_has_relation(
+        self,
+        lx_knowledge_base: KnowledgeBase,
+        classification_name_colon_lesion_paris: str,
+    ):
+        table = lx_knowledge_base.get_symbol_table()
+        paris = lx_knowledge_base.get_classification(
+            classification_name_colon_lesion_paris
+        )
+        for choice_name in paris.choice_names:
+            assert table.has_relation(
+                "classifications",
+                "choice_names",
+                classification_name_colon_lesion_paris,
+                choice_name,
+            )
+        assert not table.has_relation(
+            "classifications",
+            "choice_names",
+            classification_name_colon_lesion_paris,
+            "missing",
+        )
+        assert not table.has_relation(
+            "classifications", "choice_names", "missing", paris.choice_names[0]
+        )
+
+    def test_table_follows_updates(self):
+        kb = KnowledgeBase(name="symbols")
+        kb.add_shallow_object(
+            ClassificationShallow(name="paris", choice_names=["paris_0_is", "x"])
+        )
+        kb.add_shallow_object(ClassificationChoiceShallow(name="paris_0_is"))
+        table = kb.get_symbol_table()
+        choice_ids = table.get_related_ids("classifications", "choice_names", "paris")
+        assert list(choice_ids) == [0, MISSING_ID]
+
+        kb.add_shallow_object(ClassificationChoiceShallow(name="x"))
+        updated = kb.get_symbol_table()
+        assert updated is not table
+        assert updated.has_relation("classifications", "choice_names", "paris", "x")
+
+        other = KnowledgeBase(name="other")
+        other.add_shallow_object(ClassificationChoiceShallow(name="paris_0_ii"))
+        kb.import_knowledge_base(other)
+        assert kb.get_symbol_table().get_id("classification_choices", "paris_0_ii") == 2
+
+    def test_contains_matches_membership(self):
+        rows = [[5, 1, MISSING_ID, 3, 1], [], [0], list(range(40, 0, -3))]
+        offsets = array("i", [0])
+        targets = array("i")
+        for row in rows:
+            targets.extend(row)
+            offsets.append(len(targets))
+        relation = SymbolRelation(offsets, targets)
+
+        for source_id, row in enumerate(rows):
+            assert list(relation.get(source_id)) == row
+            for target_id in range(MISSING_ID, 42):
+                assert relation.contains(source_id, target_id) == (target_id in row)
@@ -0,0 +1,77 @@
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.models.knowledge_base.tag_index import (
+    TAGGED_CATEGORIES,
+    build_bitmap,
+    iter_bitmap_ids,
+)
+from lx_dtypes.models.shallow import ExaminationShallow, FindingShallow
+
+
+def _build_tagged_kb() -> KnowledgeBase:
+    kb = KnowledgeBase(name="tags")
+    kb.add_shallow_object(FindingShallow(name="colon_polyp", tags=["colon", "lesion"]))
+    kb.add_shallow_object(FindingShallow(name="colon_ulcer", tags=["colon"]))
+    kb.add_shallow_object(FindingShallow(name="gastric_polyp", tags=["lesion"]))
+    kb.add_shallow_object(
+        ExaminationShallow(name="colonoscopy", tags=["colon", "endoscopy"])
+    )
+    return kb
+
+
+class TestKnowledgeBaseTagIndex:
+    def test_tagged_categories(self):
+        assert "findings" in TAGGED_CATEGORIES
+        assert "citations" in TAGGED_CATEGORIES
+        assert "classification_choices" not in TAGGED_CATEGORIES
+
+    def test_boolean_queries(self):
+        kb = _build_tagged_kb()
+        assert kb.query_tags(all_of=["colon"]) == {
+            "findings": ["colon_polyp", "colon_ulcer"],
+            "examinations": ["colonoscopy"],
+        }
+        assert kb.query_tags(all_of=["colon", "lesion"]) == {
+            "findings": ["colon_polyp"]
+        }
+        assert kb.query_tags(any_of=["lesion", "endoscopy"]) == {
+            "findings": ["colon_polyp", "gastric_polyp"],
+            "examinations": ["colonoscopy"],
+        }
+        assert kb.query_tags(
+            all_of=["colon"], none_of=["lesion"], categories=["findings"]
+        ) == {"findings": ["colon_ulcer"]}
+        assert kb.query_tags(all_of=["missing"]) == {}
+        assert kb.get_tag_index().tags == ["colon", "lesion", "endoscopy"]
+
+    def test_index_follows_updates(self):
+        kb = _build_tagged_kb()
+        index = kb.get_tag_index()
+        assert kb.get_tag_index() is index
+
+        kb.add_shallow_object(FindingShallow(name="colon_ulcer", tags=["lesion"]))
+        assert kb.get_tag_index() is not index
+        assert kb.query_tags(all_of=["colon", "lesion"], categories=["findings"]) == {
+            "findings": ["colon_polyp"]
+        }
+        assert kb.get_tag_index().get_tag_counts("findings") == {
+            "colon": 1,
+            "lesion": 3,
+        }
+
+    def test_matches_full_scan(self, lx_knowledge_base: KnowledgeBase):
+        results = lx_knowledge_base.query_tags(all_of=["event"])
+        for category in TAGGED_CATEGORIES:
+            expected = [
+                name
+                for name, entity in getattr(lx_knowledge_base, category).items()
+                if "event" in entity.tags
+            ]
+            assert results.get(category, []) == expected
+        assert results["findings"]
+
+    def test_build_bitmap(self):
+        ids = [0, 7, 8, 63, 64, 1000]
+        bitmap = build_bitmap(ids, 1001)
+        assert bitmap == sum(1 << entity_id for entity_id in ids)
+        assert list(iter_bitmap_ids(bitmap)) == ids
+        assert build_bitmap([], 0) == 0
@@ -0,0 +1,88 @@
+from typing import Dict
+
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.models.knowledge_base.term_mapper import (
+    TerminologyMapper,
+    map_terms,
+)
+from lx_dtypes.models.knowledge_base.search import normalize_search_text
+from lx_dtypes.models.shallow import (
+    ClassificationChoiceShallow,
+    FindingShallow,
+    IndicationShallow,
+)
+
+
+def _build_mapping_kb() -> KnowledgeBase:
+    kb = KnowledgeBase(name="mapping")
+    kb.add_shallow_object(FindingShallow(name="colon_polyp", name_de="Kolonpolyp"))
+    kb.add_shallow_object(FindingShallow(name="colon_ulcer", name_de="Kolonulkus"))
+    kb.add_shallow_object(
+        ClassificationChoiceShallow(
+            name="lesion_planarity_sessile", name_de="Sessil", name_en="Sessile"
+        )
+    )
+    kb.add_shallow_object(
+        IndicationShallow(name="screening_colonoscopy", name_de="Vorsorgekoloskopie")
+    )
+    return kb
+
+
+class TestTerminologyMapper:
+    def test_ranked_candidates(self):
+        mapper = TerminologyMapper(_build_mapping_kb())
+        polyp, sessile, typo, unknown = mapper.map_batch(
+            ["Kolonpolyp", "sessiler", "colon polip", "xyz"], top_k=2
+        )
+        assert polyp[0].name == "colon_polyp"
+        assert polyp[0].score == 1.0
+        assert len(polyp) <= 2
+        assert polyp == sorted(polyp, key=lambda hit: -hit.score)
+        assert sessile[0].name == "lesion_planarity_sessile"
+        assert sessile[0].category == "classification_choices"
+        assert typo[0].name == "colon_polyp"
+        assert unknown == []
+
+    def test_streaming_and_workers(self):
+        kb = _build_mapping_kb()
+        phrases = ["Kolonpolyp", "Vorsorgekoloskopie", "Kolonulkus"] * 7
+        serial = map_terms(kb, iter(phrases), batch_size=4)
+        assert [candidates[0].name for candidates in serial[:3]] == [
+            "colon_polyp",
+            "screening_colonoscopy",
+            "colon_ulcer",
+        ]
+        assert map_terms(kb, phrases, batch_size=4, workers=2) == serial
+
+    def test_mapping_bundled_terminology(self, lx_knowledge_base: KnowledgeBase):
+        mapper = TerminologyMapper(lx_knowledge_base)
+        for category, name in mapper.entities[:20]:
+            [candidates] = mapper.map_batch([name])
+            assert (category, name) in [
+                (hit.category, hit.name) for hit in candidates if hit.score == 1.0
+            ]
+
+    def test_sparse_ranking_matches_dense_scores(
+        self, lx_knowledge_base: KnowledgeBase
+    ):
+        mapper = TerminologyMapper(lx_knowledge_base)
+        phrases = ["Kolonpolyp", "sessil", "polyp colon", "Blutung"]
+        queries = mapper._vectorizer.transform(
+            [normalize_search_text(phrase) for phrase in phrases]
+        )
+        dense = (queries @ mapper._label_matrix).toarray()
+        for row, candidates in zip(
+            dense, mapper.map_batch(phrases, top_k=5, min_score=0.0)
+        ):
+            best: Dict[int, float] = {}
+            for label_id, score in enumerate(row.tolist()):
+                entity_id = int(mapper._label_entities[label_id])
+                if score > 0:
+                    best[entity_id] = max(best.get(entity_id, 0.0), score)
+            expected = sorted(best.items(), key=lambda item: (-item[1], item[0]))[:5]
+            assert [(hit.category, hit.name) for hit in candidates] == [
+                mapper.entities[entity_id] for entity_id, _ in expected
+            ]
+            assert [hit.score for hit in candidates] == [
+                round(score, 6) for _, score in expected
+            ]
@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from lx_dtypes.models.knowledge_base import DataLoader, KnowledgeBase
+from lx_dtypes.models.knowledge_base.trusted import (
+    TRUST_KEY_ENV_VAR,
+    export_trusted_knowledge_base,
+    get_stamp_path,
+    read_trusted_dump,
+)
+
+
+class TestTrustedKnowledgeBase:
+    def test_trusted_roundtrip(self, lx_knowledge_base: KnowledgeBase, tmp_path: Path):
+        yaml_path = export_trusted_knowledge_base(lx_knowledge_base, tmp_path)
+        assert get_stamp_path(yaml_path).exists()
+
+        kb = KnowledgeBase.create_from_yaml(yaml_path, trusted=True)
+        assert kb.model_dump() == lx_knowledge_base.model_dump()
+        finding = next(iter(kb.findings.values()))
+        assert finding.tags == sorted(set(finding.tags))
+        assert finding.name_en
+
+    def test_trusted_dumps_are_byte_identical(
+        self, lx_knowledge_base: KnowledgeBase, tmp_path: Path
+    ):
+        kb = KnowledgeBase.construct_from_dump(lx_knowledge_base.model_dump())
+        # source_file and created_at are not part of a dump
+        exclude = {"source_file", "created_at"}
+        assert kb.model_dump_json(exclude=exclude) == (
+            lx_knowledge_base.model_dump_json(exclude=exclude)
+        )
+        for name, finding in lx_knowledge_base.findings.items():
+            assert kb.findings[name].model_dump_json(exclude=exclude) == (
+                finding.model_dump_json(exclude=exclude)
+            )
+
+        kb.export_yaml(tmp_path, filename="trusted")
+        lx_knowledge_base.export_yaml(tmp_path, filename="validated")
+        assert (tmp_path / "trusted.yaml").read_bytes() == (
+            tmp_path / "validated.yaml"
+        ).read_bytes()
+
+    def test_tampered_dump_is_validated(
+        self, lx_knowledge_base: KnowledgeBase, tmp_path: Path
+    ):
+        yaml_path = export_trusted_knowledge_base(lx_knowledge_base, tmp_path)
+        yaml_path.with_suffix(".json").unlink()
+        with yaml_path.open("a", encoding="utf-8") as f:
+            f.write("unexpected_field: 1\n")
+
+        assert read_trusted_dump(yaml_path) is None
+        with pytest.raises(ValidationError):
+            KnowledgeBase.create_from_yaml(yaml_path, trusted=True)
+
+    def test_signed_dump_requires_key(
+        self,
+        lx_knowledge_base: KnowledgeBase,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.delenv(TRUST_KEY_ENV_VAR, raising=False)
+        yaml_path = export_trusted_knowledge_base(
+            lx_knowledge_base, tmp_path, key=b"ci-secret"
+        )
+
+        assert read_trusted_dump(yaml_path) is None
+        assert read_trusted_dump(yaml_path, key=b"other-secret") is None
+        assert read_trusted_dump(yaml_path, key=b"ci-secret") is not None
+
+        monkeypatch.setenv(TRUST_KEY_ENV_VAR, "ci-secret")
+        assert read_trusted_dump(yaml_path) is not None
+
+    def test_data_loader_uses_trusted_dump(
+        self,
+        yaml_repo_dirs: list[Path],
+        demo_kb_config_name: str,
+        lx_knowledge_base: KnowledgeBase,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.delenv(TRUST_KEY_ENV_VAR, raising=False)
+        export_trusted_knowledge_base(
+            lx_knowledge_base, tmp_path, filename=demo_kb_config_name
+        )
+        loader = DataLoader(input_dirs=yaml_repo_dirs, trusted_dir=tmp_path)
+        loader.load_module_configs()
+
+        def _fail(*args: object, **kwargs: object) -> KnowledgeBase:
+            raise AssertionError("trusted load must not parse data files")
+
+        monkeypatch.setattr(KnowledgeBase, "create_from_config", _fail)
+        kb = loader.load_knowledge_base(demo_kb_config_name)
+        assert kb.model_dump() == lx_knowledge_base.model_dump()
@@ -1,4 +1,5 @@
 from lx_dtypes.models.patient.patient import Patient
+from lx_dtypes.models.patient.patient_examination import PatientExamination
 from lx_dtypes.models.patient.patient_ledger import PatientLedger
 from lx_dtypes.models.patient_interface import PatientInterface
 
@@ -39,3 +40,42 @@ class TestPatientLedgerModel:
     ):
         ledger = sample_patient_ledger
         assert not ledger._examination_exists("non-existent-exam-uuid")  # type: ignore
+
+    def test_patient_ledger_examination_index(
+        self,
+        sample_patient_ledger: PatientLedger,
+        sample_patient: Patient,
+        examination_name_colonoscopy: str,
+    ):
+        ledger = sample_patient_ledger
+        other = sample_patient.model_copy(update={"uuid": "other-patient-uuid"})
+        ledger.add_patient(other)
+        exams = [
+            PatientExamination.create(patient.uuid, examination_name_colonoscopy)
+            for patient in (sample_patient, other, sample_patient)
+        ]
+        for exam in exams:
+            ledger.add_patient_examination(exam)
+
+        assert ledger.get_examination_uuids_by_patient_uuid(sample_patient.uuid) == [
+            exams[0].uuid,
+            exams[2].uuid,
+        ]
+        assert ledger.get_examinations_by_patient_uuid(other.uuid) == {
+            exams[1].uuid: exams[1]
+        }
+
+        ledger.delete_patient_examination(exams[0].uuid)
+        assert ledger.get_examination_uuids_by_patient_uuid(sample_patient.uuid) == [
+            exams[2].uuid
+        ]
+
+        ledger.delete_patient(sample_patient.uuid)
+        assert list(ledger.examinations) == [exams[1].uuid]
+        assert ledger.get_examination_uuids_by_patient_uuid(sample_patient.uuid) == []
+
+        # a ledger validated from a dump builds the index from its examinations
+        restored = PatientLedger.model_validate(ledger.model_dump())
+        assert restored.get_examination_uuids_by_patient_uuid(other.uuid) == [
+            exams[1].uuid
+        ]
@@ -0,0 +1,99 @@
+import gc
+import threading
+from typing import List
+
+import pytest
+
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.models.knowledge_base.handle import (
+    KnowledgeBaseHandle,
+    KnowledgeBaseVersion,
+)
+from lx_dtypes.models.patient.patient_ledger import PatientLedger
+from lx_dtypes.models.patient_interface import PatientInterface
+
+
+def _without_finding(kb: KnowledgeBase, finding_name: str) -> KnowledgeBase:
+    copy = KnowledgeBase.construct_from_dump(kb.model_dump())
+    copy._remove_entity("findings", finding_name)
+    return copy
+
+
+class TestPatientInterfaceHotSwap:
+    def test_snapshot_survives_reload(
+        self,
+        lx_knowledge_base: KnowledgeBase,
+        sample_patient_ledger: PatientLedger,
+        finding_name_colon_polyp: str,
+    ):
+        handle = KnowledgeBaseHandle(lx_knowledge_base)
+        interface = PatientInterface.from_handle(handle, sample_patient_ledger)
+        pinned = interface.snapshot()
+        assert pinned.patient_ledger is interface.patient_ledger
+
+        new_kb = _without_finding(lx_knowledge_base, finding_name_colon_polyp)
+        published = handle.reload(lambda: new_kb).result()
+        handle.close()
+
+        assert published.version == 2
+        assert handle.snapshot() == published
+        assert interface.knowledge_base is new_kb
+        assert not interface.finding_exists(finding_name_colon_polyp)
+        # a request in flight keeps the version it started with
+        assert pinned.knowledge_base is lx_knowledge_base
+        assert pinned.finding_exists(finding_name_colon_polyp)
+        assert interface.snapshot().knowledge_base is new_kb
+
+    def test_failed_reload_keeps_version(self, lx_knowledge_base: KnowledgeBase):
+        handle = KnowledgeBaseHandle(lx_knowledge_base)
+
+        def _fail() -> KnowledgeBase:
+            raise ValueError("broken terminology")
+
+        future = handle.reload(_fail)
+        with pytest.raises(ValueError):
+            future.result()
+        handle.close()
+        assert handle.version == 1
+        assert handle.knowledge_base is lx_knowledge_base
+
+    def test_old_versions_are_released(
+        self, lx_knowledge_base: KnowledgeBase, finding_name_colon_polyp: str
+    ):
+        handle = KnowledgeBaseHandle(KnowledgeBase(name="v1"))
+        reader = handle.snapshot()
+        handle.publish(KnowledgeBase(name="v2"))
+        handle.publish(_without_finding(lx_knowledge_base, finding_name_colon_polyp))
+        gc.collect()
+        assert handle.get_live_versions() == [1, 3]
+
+        del reader
+        gc.collect()
+        assert handle.get_live_versions() == [3]
+
+    def test_listeners_may_use_the_handle(self):
+        handle = KnowledgeBaseHandle(KnowledgeBase(name="v1"))
+
+        class _Listener:
+            def __init__(self) -> None:
+                self.seen: List[int] = []
+
+            def on_published(self, current: KnowledgeBaseVersion) -> None:
+                self.seen.append(handle.snapshot().version)
+                if current.version == 2:
+                    handle.publish(KnowledgeBase(name="v3"))
+
+        first, second = _Listener(), _Listener()
+        handle.subscribe(first.on_published)
+        handle.subscribe(second.on_published)
+        publisher = threading.Thread(
+            target=handle.publish, args=(KnowledgeBase(name="v2"),), daemon=True
+        )
+        publisher.start()
+        publisher.join(timeout=10)
+        assert not publisher.is_alive()
+
+        assert handle.version == 3
+        assert first.seen == [2, 3]
+        # version 2 was replaced before it reached the second listener
+        assert second.seen == [3]
@@ -0,0 +1,106 @@
+import os
+from pathlib import Path
+
+from lx_dtypes.models import KnowledgeBaseConfig
+from lx_dtypes.models.knowledge_base import KnowledgeBase
+from lx_dtypes.utils.file_loader import (
+    YAML_BACKEND,
+    LoaderBackend,
+    get_backend_report,
+    get_json_sidecar,
+    get_sidecar_source_path,
+    load_structured_file,
+    write_json_sidecar,
+)
+from lx_dtypes.utils.fingerprint import fingerprint_file
+from lx_dtypes.utils.parser import parse_shallow_object
+
+FINDINGS_YAML = """\
+- model: finding
+  name: colon_polyp
+  classification_names:
+    - colon_lesion_paris
+"""
+
+
+class TestFileLoader:
+    def test_yaml_backend_reported(self, tmp_path: Path):
+        data_file = tmp_path / "findings.yaml"
+        data_file.write_text(FINDINGS_YAML, encoding="utf-8")
+
+        data, backend = load_structured_file(data_file)
+
+        assert backend == YAML_BACKEND
+        assert data[0]["name"] == "colon_polyp"
+        assert get_backend_report()[data_file] == YAML_BACKEND
+
+    def test_json_sidecar_preferred(self, tmp_path: Path):
+        data_file = tmp_path / "findings.yaml"
+        data_file.write_text(FINDINGS_YAML, encoding="utf-8")
+        yaml_objects = parse_shallow_object(data_file)
+
+        sidecar = write_json_sidecar(data_file)
+        assert get_json_sidecar(data_file) == sidecar
+
+        json_objects = parse_shallow_object(data_file)
+        assert get_backend_report()[data_file] == LoaderBackend.JSON_SIDECAR
+        assert [o.model_dump() for o in json_objects] == [
+            o.model_dump() for o in yaml_objects
+        ]
+        assert json_objects[0].source_file == data_file
+
+    def test_stale_json_sidecar_ignored(self, tmp_path: Path):
+        data_file = tmp_path / "findings.yaml"
+        data_file.write_text(FINDINGS_YAML, encoding="utf-8")
+        sidecar = write_json_sidecar(data_file)
+        stat = data_file.stat()
+
+        # same size, mtime restored as after a git checkout or rsync
+        data_file.write_text(
+            FINDINGS_YAML.replace("colon_polyp", "colon_polyq"), encoding="utf-8"
+        )
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert data_file.stat().st_size == stat.st_size
+
+        assert get_json_sidecar(data_file) is None
+        data, backend = load_structured_file(data_file)
+        assert backend == YAML_BACKEND
+        assert data[0]["name"] == "colon_polyq"
+
+        get_sidecar_source_path(sidecar).unlink()
+        assert get_json_sidecar(data_file) is None
+
+    def test_sidecar_changes_fingerprint(self, tmp_path: Path):
+        data_file = tmp_path / "findings.yaml"
+        data_file.write_text(FINDINGS_YAML, encoding="utf-8")
+        without_sidecar = fingerprint_file(data_file)
+
+        sidecar = write_json_sidecar(data_file)
+        with_sidecar = fingerprint_file(data_file)
+        assert with_sidecar != without_sidecar
+        assert with_sidecar.sidecar == fingerprint_file(sidecar)
+
+    def test_config_from_json_sidecar(self, tmp_path: Path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "name: sidecar_module\nversion: 0.1.0\ntags: [b, a]\n", encoding="utf-8"
+        )
+        write_json_sidecar(config_file)
+
+        config = KnowledgeBaseConfig.from_yaml_file(config_file)
+
+        assert get_backend_report()[config_file] == LoaderBackend.JSON_SIDECAR
+        assert config.source_file == config_file
+        assert config.tags == ["a", "b"]
+
+    def test_knowledge_base_from_json_sidecar(
+        self, lx_knowledge_base: KnowledgeBase, tmp_path: Path
+    ):
+        lx_knowledge_base.export_yaml(export_dir=tmp_path, filename="kb")
+        kb_file = tmp_path / "kb.yaml"
+        write_json_sidecar(kb_file)
+
+        kb = KnowledgeBase.create_from_yaml(kb_file)
+
+        assert get_backend_report()[kb_file] == LoaderBackend.JSON_SIDECAR
+        assert kb.model_dump() == lx_knowledge_base.model_dump()
@@ -0,0 +1,178 @@
+import os
+from pathlib import Path
+from typing import Any, Callable, List
+
+import pytest
+
+from lx_dtypes.models.knowledge_base import DataLoader
+from lx_dtypes.utils import manifest as manifest_module
+from lx_dtypes.utils.manifest import (
+    MANIFEST_FILE_NAME,
+    DiscoveryManifest,
+    load_manifest,
+)
+from lx_dtypes.utils.paths import get_files_from_dir_recursive
+
+
+def _age_directories(root: Path) -> None:
+    old_ns = 1_000_000_000_000_000_000
+    for dir_path, _, _ in os.walk(root):
+        os.utime(dir_path, ns=(old_ns, old_ns))
+
+
+def _count_scandir(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    listed: List[str] = []
+    original = os.scandir
+
+    def _scandir(path: Any) -> Any:
+        listed.append(os.fspath(path))
+        return original(path)
+
+    monkeypatch.setattr(manifest_module.os, "scandir", _scandir)
+    return listed
+
+
+class TestDiscoveryManifest:
+    def test_scan_matches_recursive_walk(
+        self, tmp_path: Path, write_module_tree: Callable[..., Path]
+    ):
+        write_module_tree(tmp_path, "nested")
+        manifest = DiscoveryManifest.scan(tmp_path)
+
+        assert sorted(manifest.get_config_files(tmp_path)) == sorted(
+            tmp_path.rglob("config.yaml")
+        )
+        data_dir = tmp_path / "sample_module" / "data"
+        assert manifest.get_files(tmp_path, data_dir) == get_files_from_dir_recursive(
+            data_dir
+        )
+        assert manifest.get_files(tmp_path, tmp_path.parent) is None
+
+    def test_symlinked_directories_are_not_followed(
+        self, tmp_path: Path, write_module_tree: Callable[..., Path]
+    ):
+        root = tmp_path / "root"
+        write_module_tree(root, "nested")
+        other = tmp_path / "other"
+        other.mkdir()
+        (other / "config.yaml").write_text("name: other\n", encoding="utf-8")
+        (other / "units.yaml").write_text("- model: unit\n  name: mm\n")
+        data_dir = root / "sample_module" / "data"
+        try:
+            (data_dir / "link").symlink_to(other, target_is_directory=True)
+            (data_dir / "nested" / "loop").symlink_to(
+                data_dir, target_is_directory=True
+            )
+            (data_dir / "units.yaml").symlink_to(other / "units.yaml")
+        except OSError:
+            pytest.skip("symlinks are not supported")
+
+        manifest = DiscoveryManifest.scan(root)
+        assert manifest.get_config_files(root) == sorted(root.rglob("config.yaml"))
+        walk_files = get_files_from_dir_recursive(data_dir)
+        assert manifest.get_files(root, data_dir) == walk_files
+        assert [p.relative_to(data_dir).as_posix() for p in walk_files] == [
+            "nested/findings.yaml",
+            "units.yaml",
+        ]
+
+    def test_unchanged_directories_are_not_listed_again(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        write_module_tree: Callable[..., Path],
+    ):
+        write_module_tree(tmp_path, "nested")
+        _age_directories(tmp_path)
+        manifest = DiscoveryManifest.scan(tmp_path)
+
+        listed = _count_scandir(monkeypatch)
+        rescanned = DiscoveryManifest.scan(tmp_path, manifest)
+        assert listed == []
+        assert rescanned.directories == manifest.directories
+
+        data_dir = tmp_path / "sample_module" / "data" / "nested"
+        (data_dir / "units.yaml").write_text("- model: unit\n  name: mm\n")
+        rescanned = DiscoveryManifest.scan(tmp_path, rescanned)
+        assert listed == [os.fspath(data_dir)]
+        assert data_dir / "units.yaml" in (
+            rescanned.get_files(tmp_path, data_dir) or []
+        )
+
+    def test_manifest_is_persisted(
+        self, tmp_path: Path, write_module_tree: Callable[..., Path]
+    ):
+        write_module_tree(tmp_path, "nested")
+        manifest = load_manifest(tmp_path)
+
+        assert (tmp_path / MANIFEST_FILE_NAME).exists()
+        assert DiscoveryManifest.load(tmp_path) == manifest
+        assert MANIFEST_FILE_NAME not in manifest.directories["."].files
+
+    def test_data_loader_with_manifest(
+        self, tmp_path: Path, write_module_tree: Callable[..., Path]
+    ):
+        write_module_tree(tmp_path, "nested")
+
+        walk_loader = DataLoader(input_dirs=[tmp_path])
+        walk_loader.load_module_configs()
+        manifest_loader = DataLoader(input_dirs=[tmp_path], use_manifest=True)
+        manifest_loader.load_module_configs()
+
+        assert sorted(manifest_loader.module_configs) == sorted(
+            walk_loader.module_configs
+        )
+        assert manifest_loader.get_input_files(
+            "sample_kb"
+        ) == walk_loader.get_input_files("sample_kb")
+        kb = manifest_loader.load_knowledge_base("sample_kb")
+        assert list(kb.findings) == ["colon_polyp"]
+
+    def test_manifest_and_walk_pick_the_same_duplicate(
+        self, tmp_path: Path, write_module_tree: Callable[..., Path]
+    ):
+        write_module_tree(tmp_path, "nested")
+        data_dir = tmp_path / "sample_module" / "data"
+        (data_dir / "aa" / "sub").mkdir(parents=True)
+        (data_dir / "zz").mkdir()
+        for rel_path in ("cc-top", "aa/sub/bb-deep", "aa/mid", "zz/last"):
+            (data_dir / f"{rel_path}.yaml").write_text(
+                "- model: finding\n  name: shared\n"
+                f"  description: {rel_path.rsplit('/', 1)[-1]}\n",
+                encoding="utf-8",
+            )
+
+        walk_loader = DataLoader(input_dirs=[tmp_path])
+        walk_loader.load_module_configs()
+        manifest_loader = DataLoader(input_dirs=[tmp_path], use_manifest=True)
+        manifest_loader.load_module_configs()
+
+        walk_files = walk_loader.get_input_files("sample_kb")
+        assert manifest_loader.get_input_files("sample_kb") == walk_files
+        assert [p.relative_to(data_dir).as_posix() for p in walk_files[2:]] == [
+            "aa/mid.yaml",
+            "aa/sub/bb-deep.yaml",
+            "cc-top.yaml",
+            "nested/findings.yaml",
+            "zz/last.yaml",
+        ]
+
+        walk_kb = walk_loader.load_knowledge_base("sample_kb")
+        manifest_kb = manifest_loader.load_knowledge_base("sample_kb")
+        assert manifest_kb.model_dump() == walk_kb.model_dump()
+        assert list(manifest_kb.findings) == list(walk_kb.findings)
+        assert manifest_kb.get_finding("shared").description == "last"
+
+    def test_unchanged_manifest_is_not_rewritten(
+        self, tmp_path: Path, write_module_tree: Callable[..., Path]
+    ):
+        write_module_tree(tmp_path, "nested")
+        _age_directories(tmp_path)
+        load_manifest(tmp_path)
+        manifest_file = tmp_path / MANIFEST_FILE_NAME
+        written_ns = manifest_file.stat().st_mtime_ns
+        _age_directories(tmp_path / "sample_module")
+
+        load_manifest(tmp_path)
+        load_manifest(tmp_path)
+        assert manifest_file.stat().st_mtime_ns == written_ns
@@ -1,6 +1,10 @@
 from pathlib import Path
 from typing import Callable
 
+import pytest
+from pydantic import ValidationError
+
+from lx_dtypes.models.knowledge_base import KnowledgeBase
 from lx_dtypes.models.shallow import (
     CitationShallow,
     ExaminationShallow,
@@ -10,7 +14,13 @@ from lx_dtypes.models.shallow import (
 )
 from lx_dtypes.models.shallow.intervention import InterventionShallow
 from lx_dtypes.utils.logging import Log
-from lx_dtypes.utils.parser import parse_shallow_object
+from lx_dtypes.utils.parser import (
+    index_shallow_objects,
+    parse_shallow_object,
+    parse_shallow_objects,
+    validate_shallow_item,
+    validate_shallow_items,
+)
 
 
 class TestParser:
@@ -154,3 +164,59 @@ class TestParser:
         log_writer(
             f"Parsed {len(parsed_objects)} ClassificationChoiceShallow objects from {sample_classification_choices_yaml_filepath}"
         )
+
+
+class TestBatchValidation:
+    def test_batch_matches_per_item_validation(
+        self, sample_citations_yaml_filepath: Path, sample_findings_yaml_filepath: Path
+    ):
+        file_paths = [sample_citations_yaml_filepath, sample_findings_yaml_filepath]
+        for file_path, parsed in zip(file_paths, parse_shallow_objects(file_paths)):
+            items = [item for _, _, item in index_shallow_objects(file_path)]
+            expected = [validate_shallow_item(dict(item), file_path) for item in items]
+
+            assert [type(obj) for obj in parsed] == [type(obj) for obj in expected]
+            assert [obj.model_dump() for obj in parsed] == [
+                obj.model_dump() for obj in expected
+            ]
+            assert [obj.model_dump() for obj in parse_shallow_object(file_path)] == [
+                obj.model_dump() for obj in expected
+            ]
+            assert all(obj.source_file == file_path for obj in parsed)
+
+            validate_shallow_items(items, file_path)
+            assert all("model" in item for item in items)
+
+    def test_batch_rejects_invalid_items(self, tmp_path: Path):
+        file_path = tmp_path / "findings.yaml"
+        items = [{"model": "finding", "name": "colon_polyp", "unknown": 1}]
+        with pytest.raises(ValidationError):
+            validate_shallow_items(items, file_path)
+
+        with pytest.raises(ValidationError):
+            validate_shallow_items([{"model": "not_a_model", "name": "x"}], file_path)
+
+    def test_batch_errors_use_file_positions(self, tmp_path: Path):
+        items = [
+            {"model": "finding", "name": "colon_polyp"},
+            {"model": "citation", "name": "c"},
+            {"model": "finding", "name": "colon_ulcer", "unknown": 1},
+        ]
+        expected = [dict(item) for item in items]
+        with pytest.raises(ValidationError) as exc_info:
+            validate_shallow_items(items, tmp_path / "mixed.yaml")
+
+        locations = [error["loc"] for error in exc_info.value.errors()]
+        assert [loc[:2] for loc in locations] == [
+            (1, "citation"),
+            (1, "citation"),
+            (2, "finding"),
+        ]
+        assert locations[-1] == (2, "finding", "unknown")
+        assert items == expected
+
+    def test_category_routing(self, sample_findings_yaml_filepath: Path):
+        for obj in parse_shallow_object(sample_findings_yaml_filepath):
+            assert KnowledgeBase.get_category_name(obj) == "findings"
+        with pytest.raises(TypeError):
+            KnowledgeBase.get_category_name(object())  # type: ignore[arg-type]